@@ -1,97 +1,496 @@
+import argparse
 import pygame
 import sys
 import random
-import numpy as np
-from qiskit import QuantumCircuit, transpile
-from qiskit_aer import AerSimulator
+import time
+from collections import OrderedDict
 
+import numpy as np
 
-# --- OYUN YÖNETİCİSİ (ÇEKİRDEK MOTOR) ---
-class GameManager:
-    def __init__(self, board_size=8):
+from oyun_motoru import OyunOturumu, arka_planda_calistir
+from gunluk import GunlukOkuyucu, GunlukYazici, TekrarOynatici
+from profil import Profilci
+
+
+# --- RENK PALETİ  ---
+R_BG       = (4, 8, 14)           # Koyu lacivert-siyah
+R_HUD_BG   = (6, 12, 20)          # HUD arka planı
+R_GRID     = (18, 35, 55)         # Izgara çizgileri
+R_GRID_DIM = (10, 22, 38)         # Izgara hücre arka planı
+R_CYAN     = (0, 220, 255)        # Vurgu - Hayalet / Aktif
+R_GOLD     = (255, 200, 50)       # Vurgu - Hedef / Tur
+R_GREEN    = (0, 255, 140)        # Başarı / Metin
+R_RED      = (255, 70, 70)        # Tehlike / Batma
+R_PURPLE   = (180, 60, 255)       # Hileli gemi
+R_WHITE    = (240, 248, 255)      # Normal yazı
+R_DIM      = (120, 155, 185)      # Soluk / yardımcı
+R_KLASIK   = (80, 110, 145)       # Klasik gemi rengi
+R_HIT_BG   = (25, 15, 10)        # Vurulmuş kare arkaplanı
+
+
+# --- METİN ÖNBELLEĞİ ---
+# HUD metinleri nadiren değişir; (font, metin, renk, antialias) anahtarıyla render edilmiş yüzeyler
+# boyutu sınırlı bir LRU önbellekte tutulur. Önbellekte olan metinlerin çizimi düz bir blit'tir.
+class MetinOnbellegi:
+    def __init__(self, kapasite=256):
+        self.kapasite = kapasite
+        self._yuzeyler = OrderedDict()
+        self.isabet = 0
+        self.iska = 0
+        self.tahliye = 0
+
+    def render(self, font, metin, antialias, renk):
+        anahtar = (font, metin, tuple(renk), antialias)
+        yuzey = self._yuzeyler.get(anahtar)
+        if yuzey is not None:
+            self._yuzeyler.move_to_end(anahtar)
+            self.isabet += 1
+            return yuzey
+        self.iska += 1
+        yuzey = font.render(metin, antialias, renk)
+        self._yuzeyler[anahtar] = yuzey
+        if len(self._yuzeyler) > self.kapasite:
+            self._yuzeyler.popitem(last=False)
+            self.tahliye += 1
+        return yuzey
+
+    @property
+    def isabet_orani(self):
+        toplam = self.isabet + self.iska
+        return self.isabet / toplam if toplam else 0.0
+
+    def istatistikler(self):
+        return {'isabet': self.isabet, 'iska': self.iska, 'tahliye': self.tahliye,
+                'boyut': len(self._yuzeyler), 'isabet_orani': self.isabet_orani}
+
+
+# --- KAMERA ---
+# Tahtanın görünüm alanına düşen kısmını belirler. Yakınlaştırma ayrık hücre boyutlarıyla yapılır (sprite'lar
+# her seviye için bir kez pişirilir); kaydırma piksel cinsindendir ve tahta kenarlarına kenetlenir, görünümden
+# küçük tahtalar ortalanır. Her değişiklikte 'surum' artar; önbellekli katmanlar buna bakarak yeniden çizilir.
+TEMEL_HUCRE = 80   # Parçacık ve radar halkası koordinatları bu hücre boyutundaki dünya pikselleridir
+YAKINLASTIRMA_SEVIYELERI = (160, 120, 80, 64, 48, 40, 32, 24, 16, 12, 8, 6, 4, 3, 2, 1)
+DETAY_ESIGI = 16   # Bu hücre boyutunun altında tahta sprite'sız özet görüntü olarak çizilir
+
+
+class Kamera:
+    def __init__(self, board_size, alan, hucre=TEMEL_HUCRE):
         self.board_size = board_size
-        self.backend_tipi = "simülatör"
-        self.simulator = AerSimulator()
-        self.ibm_backend = None
-        self.ships = {}
-        self.vurulan_kareler = set()
-        self.gemi_sayaci = 1
-
-    def ibm_baglantisi_kur(self, api_key):
-        try:
-            from qiskit_ibm_runtime import QiskitRuntimeService
-            QiskitRuntimeService.save_account(channel="ibm_quantum", token=api_key, overwrite=True)
-            service = QiskitRuntimeService(channel="ibm_quantum")
-            self.ibm_backend = service.least_busy(operational=True, simulator=False)
-            self.backend_tipi = "ibm"
-            return True, self.ibm_backend.name
-        except ImportError:
-            return False, "'qiskit-ibm-runtime' kütüphanesi eksik!"
-        except Exception as e:
-            return False, str(e)
-
-    def gemi_yerlestir_klasik(self, x, y):
-        isim = f"Klasik_{self.gemi_sayaci}"
-        self.ships[isim] = {'tip': 'klasik', 'koordinatlar': [(x, y)], 'durum': 'aktif'}
-        self.gemi_sayaci += 1
-
-    def gemi_yerlestir_hayalet(self, koord1, koord2):
-        isim = f"Hayalet_{self.gemi_sayaci}"
-        self.ships[isim] = {'tip': 'hayalet', 'koordinatlar': [koord1, koord2], 'durum': 'aktif'}
-        self.gemi_sayaci += 1
-
-    def gemi_yerlestir_hileli(self, koord1, koord2, agirlik=0.75):
-        isim = f"Hileli_{self.gemi_sayaci}"
-        theta = 2 * np.arccos(np.sqrt(agirlik))
-        self.ships[isim] = {'tip': 'hileli', 'koordinatlar': [koord1, koord2], 'theta': theta, 'agirlik': agirlik,
-                            'durum': 'aktif'}
-        self.gemi_sayaci += 1
-
-    def qc_hedef_belirle(self):
-        olasi_hedefler = [(x, y) for x in range(self.board_size) for y in range(self.board_size) if
-                          (x, y) not in self.vurulan_kareler]
-        if not olasi_hedefler: return None
-        hedef = random.choice(olasi_hedefler)
-        self.vurulan_kareler.add(hedef)
-        return hedef
-
-    def atis_cozumle(self, hedef):
-        for isim, veri in self.ships.items():
-            if veri['durum'] != 'aktif': continue
-            if hedef in veri['koordinatlar']:
-                if veri['tip'] == 'klasik':
-                    veri['durum'] = 'batti'
-                    return 'batti_klasik'
-                elif veri['tip'] in ['hayalet', 'hileli']:
-                    return self._kuantum_cokme_hesapla(isim, veri, hedef)
-        return 'karavana'
-
-    def _kuantum_cokme_hesapla(self, isim, veri, atis_hedefi):
-        qc = QuantumCircuit(1, 1)
-        if veri['tip'] == 'hayalet':
-            qc.h(0)
-        elif veri['tip'] == 'hileli':
-            qc.ry(veri['theta'], 0)
-        qc.measure(0, 0)
-
-        if self.backend_tipi == "ibm" and self.ibm_backend:
-            transpiled_qc = transpile(qc, self.ibm_backend)
-            job = self.ibm_backend.run(transpiled_qc, shots=1)
-            result = job.result()
+        self.alan = pygame.Rect(alan)
+        # En uzak seviye tahtanın tamamını gösterir; tahta hiçbir seviyede sığmıyorsa 1 piksele kadar inilir
+        sigan = [h for h in YAKINLASTIRMA_SEVIYELERI if h * board_size <= min(self.alan.size)]
+        en_kucuk = max(sigan) if sigan else YAKINLASTIRMA_SEVIYELERI[-1]
+        self.seviyeler = [h for h in YAKINLASTIRMA_SEVIYELERI if h >= en_kucuk]
+        self.hucre = min(self.seviyeler, key=lambda h: abs(h - hucre))
+        self.konum = [0, 0]   # Görünümün sol üst köşesinin tahta üzerindeki piksel konumu
+        self.surum = 0
+        self._kenetle()
+
+    @property
+    def detayli(self):
+        return self.hucre >= DETAY_ESIGI
+
+    def _kenetle(self):
+        for eksen, boy in enumerate(self.alan.size):
+            fazla = self.board_size * self.hucre - boy
+            self.konum[eksen] = fazla // 2 if fazla < 0 else min(max(self.konum[eksen], 0), fazla)
+        self.surum += 1
+
+    def kaydir(self, dx, dy):
+        if dx or dy:
+            self.konum[0] += dx
+            self.konum[1] += dy
+            self._kenetle()
+
+    # İmlecin altındaki tahta noktası yakınlaştırmadan sonra da aynı ekran noktasında kalır
+    def yakinlastir(self, adim, odak=None):
+        i = min(max(self.seviyeler.index(self.hucre) - adim, 0), len(self.seviyeler) - 1)
+        if self.seviyeler[i] == self.hucre:
+            return
+        fx, fy = (odak or self.alan.center)[0] - self.alan.x, (odak or self.alan.center)[1] - self.alan.y
+        oran = self.seviyeler[i] / self.hucre
+        self.hucre = self.seviyeler[i]
+        self.konum = [round((self.konum[0] + fx) * oran - fx), round((self.konum[1] + fy) * oran - fy)]
+        self._kenetle()
+
+    def odakla(self, x, y):
+        self.konum = [x * self.hucre + (self.hucre - self.alan.w) // 2, y * self.hucre + (self.hucre - self.alan.h) // 2]
+        self._kenetle()
+
+    def sigdir(self):
+        self.hucre = self.seviyeler[-1]
+        self._kenetle()
+
+    # --- KOORDİNAT DÖNÜŞÜMLERİ ---
+    # Görünür hücreler [x0, x1) x [y0, y1) aralığıdır; çizim maliyeti board_size'a değil bu aralığa bağlıdır
+    def gorunur_aralik(self):
+        h = self.hucre
+        x0, y0 = max(self.konum[0] // h, 0), max(self.konum[1] // h, 0)
+        x1 = min(-(-(self.konum[0] + self.alan.w) // h), self.board_size)
+        y1 = min(-(-(self.konum[1] + self.alan.h) // h), self.board_size)
+        return x0, x1, y0, y1
+
+    def gorunur_mu(self, x, y):
+        x0, x1, y0, y1 = self.gorunur_aralik()
+        return x0 <= x < x1 and y0 <= y < y1
+
+    def hucre_rect(self, x, y):
+        return pygame.Rect(self.alan.x + x * self.hucre - self.konum[0], self.alan.y + y * self.hucre - self.konum[1],
+                           self.hucre, self.hucre)
+
+    def hucre_merkez(self, x, y):
+        return (self.alan.x + x * self.hucre - self.konum[0] + self.hucre // 2,
+                self.alan.y + y * self.hucre - self.konum[1] + self.hucre // 2)
+
+    def kareye(self, px, py):
+        if not self.alan.collidepoint(px, py):
+            return None
+        x = (px - self.alan.x + self.konum[0]) // self.hucre
+        y = (py - self.alan.y + self.konum[1]) // self.hucre
+        return (x, y) if 0 <= x < self.board_size and 0 <= y < self.board_size else None
+
+    def olcek(self):
+        return self.hucre / TEMEL_HUCRE
+
+
+# --- KATMANLI ÇİZİCİ ---
+# Zemin (ızgara + vurulan kareler) görünüm boyutunda bir yüzeye çizilir; yalnızca kamera kaydırılınca ya da
+# yakınlaştırılınca sadece görünür hücreler için baştan çizilir, yeni vurulan kareler üzerine tek tek eklenir. Gemi, parıltı ve sembol sprite'ları
+# (tip, renk, hücre boyutu) anahtarıyla bir kez pişirilip atlasta tutulur; hedef nabzı, radar halkası ve
+# oyun sonu karartması için yüzeyler her yakınlaştırma seviyesinde bir kez ayrılır.
+# Uzak seviyelerde (DETAY_ESIGI altı) tahta, kare başına bir renk kodu taşıyan NumPy dizisinden tek bir
+# ölçeklenmiş görüntü olarak çizilir; gemi sprite'ları, bağlantı çizgileri ve ızgara çizgileri atlanır.
+KOD_BOS, KOD_VURUS, KOD_KLASIK, KOD_HAYALET, KOD_HILELI, KOD_BATIK = range(6)
+OZET_PALETI = np.array([R_GRID_DIM, (70, 40, 35), R_KLASIK, R_CYAN, R_PURPLE, R_RED], dtype=np.uint8)
+
+
+class KatmanliCizici:
+    def __init__(self, kamera, font_sembol, ekran_boyutu):
+        self.kamera = kamera
+        self.board_size = kamera.board_size
+        self.font_sembol = font_sembol
+        self.zemin = pygame.Surface(kamera.alan.size)
+        # Zeminin çizildiği kamera sürümü; kaydırma ya da yakınlaştırmada zemin baştan çizilir
+        self._zemin_surumu = None
+        # Kare başına vuruş bayrağı ve gemi kodu; [x, y] sırası surfarray ile aynıdır
+        self.vurus = np.zeros((self.board_size, self.board_size), dtype=bool)
+        self._vurus_adedi = 0
+        self.kod = np.zeros((self.board_size, self.board_size), dtype=np.uint8)
+        self._hucre_gemileri = {}
+        self._gemi_surumu = None
+        self._atlas = {}
+        self._efekt_hucresi = None
+        self._karartma = pygame.Surface(ekran_boyutu, pygame.SRCALPHA)
+        self._karartma.fill((0, 0, 0, 180))
+
+    # --- DURUM EŞİTLEME ---
+    # Her karede çağrılır; yalnızca vurulan kare sayısı ya da gemi sürümü değiştiyse iş yapar.
+    # Zemine yalnızca yeni vurulan kareler işlenir; küme küçülürse (yeni oyun) zemin baştan çizilir
+    def zemini_guncelle(self, vurulan_kareler):
+        if len(vurulan_kareler) == self._vurus_adedi:
+            return
+        kareler = np.array(list(vurulan_kareler), dtype=np.int64).reshape(-1, 2)
+        if len(vurulan_kareler) < self._vurus_adedi:
+            self.vurus[:] = False
+            self._zemin_surumu = None
+        yeni = kareler[~self.vurus[kareler[:, 0], kareler[:, 1]]]
+        self.vurus[yeni[:, 0], yeni[:, 1]] = True
+        self._vurus_adedi = len(vurulan_kareler)
+        self._hucreleri_boya(yeni)
+
+    # Özet görüntüde gemi kodu zemin rengini belirlediğinden yalnızca kodu değişen kareler yeniden boyanır
+    def gemileri_guncelle(self, oyun):
+        if oyun.gemi_surumu == self._gemi_surumu:
+            return
+        self._gemi_surumu = oyun.gemi_surumu
+        eski = None if self.kamera.detayli else self.kod.copy()
+        self.kod[:] = KOD_BOS
+        self._hucre_gemileri = {}
+        for isim, v in oyun.ships.items():
+            if v['durum'] == 'batti':
+                kod, koordinatlar = KOD_BATIK, v['koordinatlar'][:1]
+            else:
+                kod = {'klasik': KOD_KLASIK, 'hayalet': KOD_HAYALET, 'hileli': KOD_HILELI}[v['tip']]
+                koordinatlar = v['koordinatlar']
+            for koord in koordinatlar:
+                self._hucre_gemileri.setdefault(koord, []).append(isim)
+                self.kod[koord] = max(self.kod[koord], kod)
+        if eski is not None:
+            self._hucreleri_boya(np.argwhere(eski != self.kod))
+
+    # --- ZEMİN KATMANI ---
+    def _zemini_yenile(self):
+        kamera, h = self.kamera, self.kamera.hucre
+        x0, x1, y0, y1 = kamera.gorunur_aralik()
+        ox, oy = x0 * h - kamera.konum[0], y0 * h - kamera.konum[1]
+        self.zemin.fill(R_BG)
+        if x1 <= x0 or y1 <= y0:
+            return
+        if not kamera.detayli:
+            kodlar = self.kod[x0:x1, y0:y1]
+            kodlar = np.where(kodlar > KOD_BOS, kodlar, self.vurus[x0:x1, y0:y1].astype(np.uint8))
+            goruntu = pygame.surfarray.make_surface(OZET_PALETI[kodlar])
+            self.zemin.blit(pygame.transform.scale(goruntu, ((x1 - x0) * h, (y1 - y0) * h)), (ox, oy))
+            return
+        self.zemin.set_clip(pygame.Rect(ox, oy, (x1 - x0) * h, (y1 - y0) * h))
+        self.zemin.blit(self.sprite('izgara', None), (ox, oy))
+        self.zemin.set_clip(None)
+        vurus_sprite = self.sprite('vurus', None)
+        for vx, vy in zip(*np.nonzero(self.vurus[x0:x1, y0:y1])):
+            self.zemin.blit(vurus_sprite, (ox + int(vx) * h, oy + int(vy) * h))
+
+    # Güncel zemin üzerine yalnızca verilen (N, 2) karelerin görünür olanları çizilir
+    def _hucreleri_boya(self, kareler):
+        kamera, h = self.kamera, self.kamera.hucre
+        if self._zemin_surumu != kamera.surum or not len(kareler):
+            return
+        x0, x1, y0, y1 = kamera.gorunur_aralik()
+        kx, ky = kareler[:, 0], kareler[:, 1]
+        kareler = kareler[(kx >= x0) & (kx < x1) & (ky >= y0) & (ky < y1)]
+        ox, oy = x0 * h - kamera.konum[0], y0 * h - kamera.konum[1]
+        if kamera.detayli:
+            vurus_sprite = self.sprite('vurus', None)
+            for vx, vy in kareler:
+                self.zemin.blit(vurus_sprite, (ox + int(vx - x0) * h, oy + int(vy - y0) * h))
+            return
+        for vx, vy in kareler:
+            kod = self.kod[vx, vy] if self.kod[vx, vy] > KOD_BOS else int(self.vurus[vx, vy])
+            self.zemin.fill(tuple(OZET_PALETI[kod]), pygame.Rect(ox + int(vx - x0) * h, oy + int(vy - y0) * h, h, h))
+
+    def zemini_ciz(self, surf):
+        if self.kamera.surum != self._zemin_surumu:
+            self._zemini_yenile()
+            self._zemin_surumu = self.kamera.surum
+        surf.blit(self.zemin, self.kamera.alan.topleft)
+
+    # --- SPRITE ATLASI ---
+    def sprite(self, tur, renk):
+        anahtar = (tur, renk, self.kamera.hucre)
+        if anahtar not in self._atlas:
+            self._atlas[anahtar] = self._sprite_pisir(tur, renk, self.kamera.hucre)
+        return self._atlas[anahtar]
+
+    def _sprite_pisir(self, tur, renk, H):
+        # Ölçüler TEMEL_HUCRE (80 px) için tasarlanmıştır; diğer seviyelerde orantılı küçülür
+        o = lambda deger: max(1, deger * H // TEMEL_HUCRE)
+        if tur == 'sembol':
+            return self.font_sembol.render("⚛", True, renk)
+        if tur == 'izgara':
+            # Görünümü bir hücre taşacak kadar büyük ızgara deseni; ofsetle kaydırılarak tek blit'te çizilir
+            gw, gh = self.kamera.alan.w + H, self.kamera.alan.h + H
+            desen = pygame.Surface((gw, gh))
+            desen.fill(R_GRID_DIM)
+            for i in range(0, gw, H):
+                pygame.draw.line(desen, R_GRID, (i, 0), (i, gh), 1)
+                pygame.draw.line(desen, R_GRID, (i + H - 1, 0), (i + H - 1, gh), 1)
+            for j in range(0, gh, H):
+                pygame.draw.line(desen, R_GRID, (0, j), (gw, j), 1)
+                pygame.draw.line(desen, R_GRID, (0, j + H - 1), (gw, j + H - 1), 1)
+            return desen
+        if tur == 'vurus':
+            sprite = pygame.Surface((H, H))
+            r = sprite.get_rect()
+            pygame.draw.rect(sprite, R_HIT_BG, r)
+            pygame.draw.rect(sprite, (35, 50, 70), r, 1)
+            # X işareti
+            m, d = r.center, o(14)
+            pygame.draw.line(sprite, (80, 40, 40), (m[0]-d, m[1]-d), (m[0]+d, m[1]+d), o(2))
+            pygame.draw.line(sprite, (80, 40, 40), (m[0]-d, m[1]+d), (m[0]+d, m[1]-d), o(2))
+            return sprite
+        sprite = pygame.Surface((H, H), pygame.SRCALPHA)
+        if tur == 'batik':
+            # Parlayan kırmızı daire: parıltı halkaları ayrı yüzeylerden harmanlanarak pişirilir
+            for r_off in range(3, 0, -1):
+                parilti = pygame.Surface((H, H), pygame.SRCALPHA)
+                pygame.draw.circle(parilti, (*renk, 60 // r_off), (H // 2, H // 2), H // 3 + o(r_off * 4))
+                sprite.blit(parilti, (0, 0))
+            pygame.draw.circle(sprite, renk, (H // 2, H // 2), H // 3)
+            pygame.draw.circle(sprite, (255, 150, 150), (H // 2, H // 2), H // 3, o(2))
+            return sprite
+        gemi_r = pygame.Rect(o(12), o(12), H - 2 * o(12), H - 2 * o(12))
+        if tur == 'klasik':
+            pygame.draw.rect(sprite, renk, gemi_r)
+            pygame.draw.rect(sprite, (130, 160, 195), gemi_r, o(2))
         else:
-            result = self.simulator.run(qc, shots=1).result()
-
-        coken_durum = list(result.get_counts().keys())[0]
-        gercek_konum = veri['koordinatlar'][int(coken_durum)]
-
-        if gercek_konum == atis_hedefi:
-            veri['durum'] = 'batti'
-            veri['koordinatlar'] = [gercek_konum]
-            return 'batti_kuantum'
+            # Parlayan kenarlı kuantum gemisi
+            iç_r = gemi_r.inflate(-o(6), -o(6))
+            pygame.draw.rect(sprite, (renk[0]//6, renk[1]//6, renk[2]//6), gemi_r)
+            pygame.draw.rect(sprite, renk, gemi_r, o(2))
+            pygame.draw.rect(sprite, (255, 255, 255), iç_r, 1)
+        return sprite
+
+    # Yalnızca görünür karelerdeki gemiler çizilir; bağlantı çizgileri konumlardan biri görünürse çizilir
+    def gemileri_ciz(self, surf, oyun):
+        self.gemileri_guncelle(oyun)
+        kamera = self.kamera
+        if not kamera.detayli:
+            return  # Özet görünümde gemiler zemin görüntüsünün içindedir
+        x0, x1, y0, y1 = kamera.gorunur_aralik()
+        gorunur = dict.fromkeys(isim for kx, ky in zip(*np.nonzero(self.kod[x0:x1, y0:y1]))
+                                for isim in self._hucre_gemileri[(x0 + int(kx), y0 + int(ky))])
+        surf.set_clip(kamera.alan)
+        for isim in gorunur:
+            v = oyun.ships[isim]
+            if v['durum'] == 'batti':
+                surf.blit(self.sprite('batik', R_RED), kamera.hucre_rect(*v['koordinatlar'][0]).topleft)
+                continue
+            tip = v['tip']
+            renk = R_KLASIK if tip == 'klasik' else (R_CYAN if tip == 'hayalet' else R_PURPLE)
+            gemi_sprite = self.sprite('klasik' if tip == 'klasik' else 'kuantum', renk)
+            for (gx, gy) in v['koordinatlar']:
+                surf.blit(gemi_sprite, kamera.hucre_rect(gx, gy).topleft)
+
+            # Çok koordinatlı gemilerde her konumdan ağırlık merkezine bağlantı çizgisi
+            if v['durum'] == 'aktif' and len(v['koordinatlar']) >= 2:
+                noktalar = [kamera.hucre_merkez(*k) for k in v['koordinatlar']]
+                orta = (sum(p[0] for p in noktalar) // len(noktalar), sum(p[1] for p in noktalar) // len(noktalar))
+                for p in noktalar:
+                    pygame.draw.line(surf, renk, p, orta, 2)
+                # Ortada ⚛ sembolü; küçük hücrelerde sembol kareden taşacağından atlanır
+                if kamera.hucre >= 32:
+                    sembol = self.sprite('sembol', renk)
+                    surf.blit(sembol, (orta[0] - sembol.get_width() // 2, orta[1] - sembol.get_height() // 2))
+        surf.set_clip(None)
+
+    # --- ÖNCEDEN AYRILMIŞ EFEKT YÜZEYLERİ ---
+    def _efekt_yuzeyleri(self):
+        if self._efekt_hucresi != self.kamera.hucre:
+            h = self._efekt_hucresi = self.kamera.hucre
+            self._puls = pygame.Surface((h, h), pygame.SRCALPHA)
+            self._halka = pygame.Surface((h * 2, h * 2), pygame.SRCALPHA)
+
+    def hedef_ciz(self, surf, hedef, alfa):
+        self._efekt_yuzeyleri()
+        r = self.kamera.hucre_rect(*hedef)
+        self._puls.fill((255, 200, 0, alfa))
+        surf.blit(self._puls, r.topleft)
+        pygame.draw.rect(surf, R_GOLD, r, 2)
+        return r
+
+    # yaricap TEMEL_HUCRE ölçeğindedir; halka görünmeyen karelerde çizilmez
+    def halka_ciz(self, surf, kare, yaricap, alfa):
+        if not self.kamera.gorunur_mu(*kare):
+            return
+        self._efekt_yuzeyleri()
+        h = self.kamera.hucre
+        merkez = self.kamera.hucre_merkez(*kare)
+        self._halka.fill((0, 0, 0, 0))
+        pygame.draw.circle(self._halka, (*R_GOLD, alfa), (h, h), max(1, int(yaricap * self.kamera.olcek())), 2)
+        surf.blit(self._halka, (merkez[0] - h, merkez[1] - h))
+
+    def karartma_ciz(self, surf):
+        surf.blit(self._karartma, (0, 0))
+
+
+# --- PARÇACIK SİSTEMİ ---
+# Sabit kapasiteli, dizi-yapısı (structure-of-arrays) parçacık havuzu. Güncelleme tek seferde NumPy ile
+# yapılır; ölen parçacıklar remove() yerine maskeyle sıkıştırılarak atılır. Bütçe dolarsa en eski
+# parçacıklar yeni patlamaya yer açmak için düşürülür.
+class ParcacikSistemi:
+    def __init__(self, kapasite=2048, rng=None):
+        self.kapasite = kapasite
+        self.rng = rng or np.random.default_rng()
+        self.adet = 0
+        self.konum = np.zeros((kapasite, 2), dtype=np.float32)
+        self.hiz = np.zeros((kapasite, 2), dtype=np.float32)
+        self.omur = np.zeros(kapasite, dtype=np.int16)
+        self.renk = np.zeros((kapasite, 3), dtype=np.uint8)
+        self.boyut = np.zeros(kapasite, dtype=np.uint8)
+
+    def _diziler(self):
+        return self.konum, self.hiz, self.omur, self.renk, self.boyut
+
+    def _kaydir(self, atilacak):
+        # En eski 'atilacak' parçacığı at, kalanları başa kaydır
+        for dizi in self._diziler():
+            dizi[:self.adet - atilacak] = dizi[atilacak:self.adet]
+        self.adet -= atilacak
+
+    def ekle(self, x, y, renk, adet):
+        adet = min(adet, self.kapasite)
+        tasma = self.adet + adet - self.kapasite
+        if tasma > 0:
+            self._kaydir(tasma)
+        bas, son = self.adet, self.adet + adet
+        hiz = self.rng.uniform(1.5, 6, adet)
+        aci = self.rng.uniform(0, 2 * np.pi, adet)
+        self.konum[bas:son] = (x, y)
+        self.hiz[bas:son, 0] = np.cos(aci) * hiz
+        self.hiz[bas:son, 1] = np.sin(aci) * hiz
+        self.omur[bas:son] = self.rng.integers(25, 51, adet)
+        self.renk[bas:son] = renk
+        self.boyut[bas:son] = self.rng.integers(2, 6, adet)
+        self.adet = son
+
+    def guncelle(self):
+        # Bir önceki karede ömrü biten parçacıklar (son kez çizildiler) sıkıştırılarak atılır
+        canli = self.omur[:self.adet] > 0
+        if not canli.all():
+            yeni_adet = int(canli.sum())
+            for dizi in self._diziler():
+                dizi[:yeni_adet] = dizi[:self.adet][canli]
+            self.adet = yeni_adet
+        self.konum[:self.adet] += self.hiz[:self.adet]
+        self.omur[:self.adet] -= 1
+
+    # Konumlar TEMEL_HUCRE ölçeğinde tahta pikselleridir; kamera dışında kalan parçacıklar çizilmeden elenir
+    def ciz(self, surf, kamera):
+        if not self.adet:
+            return
+        olcek = kamera.olcek()
+        ekran = self.konum[:self.adet] * olcek + (kamera.alan.x - kamera.konum[0], kamera.alan.y - kamera.konum[1])
+        boyut = np.maximum(self.boyut[:self.adet] * olcek, 1)
+        gorunur = ((ekran[:, 0] + boyut >= kamera.alan.left) & (ekran[:, 0] - boyut < kamera.alan.right) &
+                   (ekran[:, 1] + boyut >= kamera.alan.top) & (ekran[:, 1] - boyut < kamera.alan.bottom))
+        konumlar = ekran[gorunur].astype(np.int32).tolist()
+        for (px, py), renk, r in zip(konumlar, self.renk[:self.adet][gorunur].tolist(), boyut[gorunur].tolist()):
+            pygame.draw.circle(surf, renk, (px, py), r)
+
+
+# --- ÇİZİM ZAMANLAYICI ---
+# Sahne yalnızca bir girdi olayı, ekrana yansıyan bir durum değişikliği ya da süren bir animasyon varken
+# yeniden çizilir. Boşta (menü, [BOŞLUK] beklenirken, oyun sonu) döngü 60 FPS'te dönmek yerine bir pygame
+# olayı gelene kadar uyur ve en geç BOSTA_ARALIK_MS'de bir uyanıp durumu yoklar; boştaki CPU sıfıra yakındır.
+AKTIF_FPS = 60
+BOSTA_ARALIK_MS = 250
+
+
+class CizimZamanlayici:
+    # etkin=False: her kare çizilir ve AKTIF_FPS uygulanır (kare süresi ölçümleri için)
+    def __init__(self, etkin=True):
+        self.etkin = etkin
+        self.kirli = True
+        self.canli = False
+        self._durum = None
+        self.cizilen = 0
+        self.atlanan = 0
+
+    def olay(self):
+        self.kirli = True
+
+    # durum: ekrana yansıyan oyun durumunun küçük bir özeti; önceki kareden farklıysa sahne kirlenir
+    # canli: bu karede ilerleyen bir animasyon var mı (parçacık, radar halkası, titreme, bekleme yayı)
+    def cizilmeli(self, durum, canli):
+        if durum != self._durum:
+            self._durum, self.kirli = durum, True
+        self.canli = bool(canli)
+        ciz = not self.etkin or self.kirli or self.canli
+        self.kirli = False
+        if ciz:
+            self.cizilen += 1
         else:
-            veri['tip'] = 'klasik'
-            veri['koordinatlar'] = [gercek_konum]
-            return 'kurtuldu_kuantum'
+            self.atlanan += 1
+        return ciz
+
+    # Olay beklerken alınan olay kuyruğa geri konur; döngünün olay işleme yolu değişmez
+    def bekle(self, saat):
+        if not self.etkin or self.canli or self.kirli:
+            saat.tick(AKTIF_FPS)
+            return
+        olay = pygame.event.wait(BOSTA_ARALIK_MS)
+        if olay.type != pygame.NOEVENT:
+            pygame.event.post(olay)
+        saat.tick()
 
 
 # --- API KEY GİRİŞ EKRANI ---
@@ -174,7 +573,7 @@ def api_key_ekrani_goster(ekran, font_buyuk, font_kucuk, saat):
             bilgi1 = font_kucuk.render("[ENTER] Onayla    [ESC] İptal / Simülatöre dön", True, R_DIM)
             ekran.blit(bilgi1, bilgi1.get_rect(center=(W // 2, H // 2 + 65)))
 
-        uyari = font_kucuk.render("⚠  IBM QPU kuyruğu saatler sürebilir. Oyun yanıt vermez görünebilir.", True, R_GOLD)
+        uyari = font_kucuk.render("⚠  IBM QPU kuyruğu saatler sürebilir. [ESC] ile yerel simülatöre geçilir.", True, R_GOLD)
         ekran.blit(uyari, uyari.get_rect(center=(W // 2, H - 80)))
 
         pygame.display.flip()
@@ -183,15 +582,27 @@ def api_key_ekrani_goster(ekran, font_buyuk, font_kucuk, saat):
 
 
 # --- ARAYÜZ ---
-def oyunu_baslat():
+# demo: menü, yerleştirme ve atışlar kendiliğinden ilerler (gösterim ve kıyaslama için)
+# kare_limiti: bu kadar kare çizilince çıkılır ve kare süreleri (sn) döndürülür; 60 FPS sınırı uygulanmaz ve
+#              boşta çizim atlanmaz
+# profil_dosyasi: kare bölümleri ve çökme gecikmeleri bu JSONL dosyasına yazılır; [F3] ekran üstü paneli açar
+# gunluk_dosyasi: oynanan oyun bu ikili günlüğe eklenir
+# tekrar: (günlük dosyası, oyun no); kayıtlı oyun aynı hedefler ve aynı çöken bitlerle yeniden oynatılır
+# board_size: görünüm alanı sabittir (8 x 80 px); büyük tahtalar tekerlek/[+][-] ile yakınlaştırılır,
+#             oklar ya da sağ tuşla sürükleyerek kaydırılır, [HOME] tahtanın tamamını gösterir
+def oyunu_baslat(demo=False, kare_limiti=None, profil_dosyasi=None, gunluk_dosyasi=None, tekrar=None,
+                 board_size=8):
     pygame.init()
 
-    HUCRE = 80
-    BOARD_SIZE = 8
+    oynatici = TekrarOynatici(GunlukOkuyucu(tekrar[0]), tekrar[1]) if tekrar else None
+
+    BOARD_SIZE = oynatici.board_size if oynatici else board_size
     HUD_YUKSEKLIK = 120
+    GENISLIK = 8 * TEMEL_HUCRE
+    YUKSEKLIK = GENISLIK + HUD_YUKSEKLIK
 
-    GERCEK_EKRAN = pygame.display.set_mode((BOARD_SIZE * HUCRE, BOARD_SIZE * HUCRE + HUD_YUKSEKLIK))
-    ekran = pygame.Surface((BOARD_SIZE * HUCRE, BOARD_SIZE * HUCRE + HUD_YUKSEKLIK))
+    GERCEK_EKRAN = pygame.display.set_mode((GENISLIK, YUKSEKLIK))
+    ekran = pygame.Surface((GENISLIK, YUKSEKLIK))
     pygame.display.set_caption("⚛  Kuantum Amiral Battı  —  QCAB v6.0")
 
     # --- FONT---
@@ -204,78 +615,136 @@ def oyunu_baslat():
         font_kucuk = pygame.font.SysFont("Consolas", 17, bold=True)
         font_mikro = pygame.font.SysFont("Consolas", 14)
 
-    # --- RENK PALETİ  ---
-    R_BG       = (4, 8, 14)           # Koyu lacivert-siyah
-    R_HUD_BG   = (6, 12, 20)          # HUD arka planı
-    R_GRID     = (18, 35, 55)         # Izgara çizgileri
-    R_GRID_DIM = (10, 22, 38)         # Izgara hücre arka planı
-    R_CYAN     = (0, 220, 255)        # Vurgu - Hayalet / Aktif
-    R_GOLD     = (255, 200, 50)       # Vurgu - Hedef / Tur
-    R_GREEN    = (0, 255, 140)        # Başarı / Metin
-    R_RED      = (255, 70, 70)        # Tehlike / Batma
-    R_PURPLE   = (180, 60, 255)       # Hileli gemi
-    R_WHITE    = (240, 248, 255)      # Normal yazı
-    R_DIM      = (120, 155, 185)      # Soluk / yardımcı
-    R_KLASIK   = (80, 110, 145)       # Klasik gemi rengi
-    R_HIT_BG   = (25, 15, 10)        # Vurulmuş kare arkaplanı
-
-    oyun = GameManager(BOARD_SIZE)
+    if oynatici:
+        oturum = oynatici.oturum_kur()
+        oturum.oyun.backend_tipi = "tekrar"
+    else:
+        gunluk = GunlukYazici(gunluk_dosyasi) if gunluk_dosyasi else None
+        oturum = OyunOturumu(BOARD_SIZE, arka_uc="aer", gunluk=gunluk)
+    oyun = oturum.oyun
+    profil = Profilci(etkin=profil_dosyasi is not None, dosya=profil_dosyasi)
+    oyun.profil = profil
+    profil_gorunur = False
+    profil_paneli = None
+    # Qiskit/Aer, oyuncu menüdeyken ve filoyu yerleştirirken arka planda yüklenip ısıtılır
+    if not oynatici:
+        arka_planda_calistir(oyun.arka_uc.isit)
+    kare_sureleri = []
     saat = pygame.time.Clock()
-
-    MAX_TUR = 30
-    envanter = {"klasik": 3, "hayalet": 2, "hileli": 1}
-    faz = "ANA_MENU"
+    zamanlayici = CizimZamanlayici(etkin=kare_limiti is None)
+    metinler = MetinOnbellegi()
+    kamera = Kamera(BOARD_SIZE, (0, HUD_YUKSEKLIK, GENISLIK, GENISLIK))
+    cizici = KatmanliCizici(kamera, font_mikro, (GENISLIK, YUKSEKLIK))
+
+    MAX_TUR = oturum.max_tur
+    envanter = oturum.envanter
+    faz = "SAVUNMA" if oynatici else "ANA_MENU"
     secili_tip = "klasik"
     gecici_koordinatlar = []
     animasyon_hedefi = None
     animasyon_baslangic = 0
+    bekleyen_cozum = None
     titreme_miktari = 0
-    parcaciklar = []
+    parcaciklar = ParcacikSistemi()
     radar_halkalari = []
-    mesaj = "SİSTEM HAZIR."
+    mesaj = f"TEKRAR: OYUN {oynatici.oyun_no} — [BOŞLUK] İLE İLERLET." if oynatici else "SİSTEM HAZIR."
 
     # --- HUD'a sabit açıklama metni ---
     _hud_alt_mesaj = ""
 
     def vfx_patlama_olustur(x, y, renk, adet=35):
-        for _ in range(adet):
-            px = x * HUCRE + HUCRE // 2
-            py = y * HUCRE + HUD_YUKSEKLIK + HUCRE // 2
-            hiz = random.uniform(1.5, 6)
-            aci = random.uniform(0, 2 * np.pi)
-            vx, vy = np.cos(aci) * hiz, np.sin(aci) * hiz
-            omur = random.randint(25, 50)
-            boyut = random.randint(2, 5)
-            parcaciklar.append([px, py, vx, vy, omur, renk, boyut])
+        parcaciklar.ekle((x + 0.5) * TEMEL_HUCRE, (y + 0.5) * TEMEL_HUCRE, renk, adet)
 
     def ciz_izgara_hucre(surf, x, y, renk_ic=None, renk_kenar=None):
-        rect = pygame.Rect(x * HUCRE, y * HUCRE + HUD_YUKSEKLIK, HUCRE, HUCRE)
+        rect = kamera.hucre_rect(x, y)
         if renk_ic:
             pygame.draw.rect(surf, renk_ic, rect)
         pygame.draw.rect(surf, renk_kenar or R_GRID, rect, 1)
         return rect
 
     def ciz_metin_golge(surf, font, metin, renk, pos, golge_renk=(0,0,0), ofset=2):
-        g = font.render(metin, True, golge_renk)
+        g = metinler.render(font, metin, True, golge_renk)
         surf.blit(g, (pos[0] + ofset, pos[1] + ofset))
-        t = font.render(metin, True, renk)
+        t = metinler.render(font, metin, True, renk)
         surf.blit(t, pos)
 
+    # --- PROFİL PANELİ ---
+    # Değerler her karede değiştiğinden metin önbelleği kullanılmaz; panel yarım saniyede bir yeniden çizilir
+    def profil_paneli_olustur():
+        ozet = profil.ozet()
+        satirlar = [f"KARE {ozet['bolumler']['toplam'][0]:.2f} ms  p95 {ozet['bolumler']['toplam'][1]:.2f}  "
+                    f"FPS {saat.get_fps():.0f}"] if ozet['bolumler'] else ["ÖLÇÜLÜYOR..."]
+        for bolum in Profilci.BOLUMLER:
+            if bolum in ozet['bolumler']:
+                ort, p95 = ozet['bolumler'][bolum]
+                satirlar.append(f"{bolum:<8}{ort:6.2f} ms  p95 {p95:6.2f}")
+        son = ozet['son_cokme']
+        if son:
+            satir = f"ÇÖKME {son['arka_uc']} {son['sure_ms']:.1f} ms"
+            if 'kuyruk_sn' in son:
+                satir += f"  kuyruk {son['kuyruk_sn']:.1f}s  çalışma {son['calisma_sn']:.1f}s"
+            satirlar.append(satir)
+        satirlar.append(f"METİN ÖNBELLEĞİ %{metinler.isabet_orani * 100:.0f}")
+        if oyun.uyum is not None:
+            satirlar.append(f"BORN UYUMU {len(oyun.uyum.hucreler)} hücre  {len(oyun.uyum.uyarilar)} uyarı")
+        panel = pygame.Surface((330, 16 * len(satirlar) + 8), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 180))
+        for i, satir in enumerate(satirlar):
+            panel.blit(font_mikro.render(satir, True, R_GREEN), (6, 4 + 16 * i))
+        return panel
+
     # --- HUD çizim yardımcısı ---
     def ciz_hud_sınır(surf):
         # Alt kenar çizgisi - parlak çift çizgi efekti
-        pygame.draw.line(surf, R_DIM, (0, HUD_YUKSEKLIK - 2), (BOARD_SIZE * HUCRE, HUD_YUKSEKLIK - 2), 1)
-        pygame.draw.line(surf, R_CYAN, (0, HUD_YUKSEKLIK - 1), (BOARD_SIZE * HUCRE, HUD_YUKSEKLIK - 1), 1)
+        pygame.draw.line(surf, R_DIM, (0, HUD_YUKSEKLIK - 2), (GENISLIK, HUD_YUKSEKLIK - 2), 1)
+        pygame.draw.line(surf, R_CYAN, (0, HUD_YUKSEKLIK - 1), (GENISLIK, HUD_YUKSEKLIK - 1), 1)
 
     while True:
+        kare_baslangic = time.perf_counter()
+        profil.kare_basla()
         simdiki_zaman = pygame.time.get_ticks()
-        kalan_tur = MAX_TUR - len(oyun.vurulan_kareler)
-        aktif_gemi_sayisi = sum(1 for v in oyun.ships.values() if v['durum'] == 'aktif')
+        kalan_tur = oturum.kalan_tur
+        aktif_gemi_sayisi = oyun.aktif_gemi_sayisi()
+
+        # Demo: oyuncunun tuşlarını taklit eden olaylar kuyruğa eklenir, aynı kod yolları çalışır
+        if demo:
+            if faz == "ANA_MENU":
+                pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_1, mod=0, unicode="1"))
+            elif faz == "YERLESTIRME":
+                oturum.rastgele_yerlestir()
+                pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN, mod=0, unicode="\r"))
+            elif faz == "SAVUNMA":
+                pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE, mod=0, unicode=" "))
 
         for event in pygame.event.get():
+            zamanlayici.olay()
             if event.type == pygame.QUIT:
+                profil.kapat()
+                if oturum.gunluk: oturum.gunluk.kapat()
                 pygame.quit(); sys.exit()
 
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                profil_gorunur = not profil_gorunur
+                profil.etkin = profil_gorunur or profil.dosya_yolu is not None
+                continue
+
+            # Kamera: tekerlek imlecin çevresinde yakınlaştırır, sağ/orta tuşla sürüklemek kaydırır
+            if event.type == pygame.MOUSEWHEEL:
+                kamera.yakinlastir(event.y, pygame.mouse.get_pos())
+                continue
+            if event.type == pygame.MOUSEMOTION and (event.buttons[1] or event.buttons[2]):
+                kamera.kaydir(-event.rel[0], -event.rel[1])
+                continue
+            if event.type == pygame.KEYDOWN and event.key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+                kamera.yakinlastir(1)
+                continue
+            if event.type == pygame.KEYDOWN and event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+                kamera.yakinlastir(-1)
+                continue
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_HOME:
+                kamera.sigdir()
+                continue
+
             if faz == "ANA_MENU":
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_1:
@@ -287,11 +756,11 @@ def oyunu_baslat():
                         if api_key:
                             # Bağlantı ekranı göster
                             GERCEK_EKRAN.fill((4, 8, 14))
-                            bekle_txt = font_buyuk.render("IBM QPU'YA BAĞLANIYOR...", True, R_GOLD)
-                            GERCEK_EKRAN.blit(bekle_txt, bekle_txt.get_rect(center=(BOARD_SIZE * HUCRE // 2, (BOARD_SIZE * HUCRE + HUD_YUKSEKLIK) // 2)))
+                            bekle_txt = metinler.render(font_buyuk, "IBM QPU'YA BAĞLANIYOR...", True, R_GOLD)
+                            GERCEK_EKRAN.blit(bekle_txt, bekle_txt.get_rect(center=(GENISLIK // 2, YUKSEKLIK // 2)))
                             pygame.display.flip()
 
-                            basarili, sonuc = oyun.ibm_baglantisi_kur(api_key)
+                            basarili, sonuc = oyun.ibm_baglantisi_kur(api_key, havuz_boyutu=1024)
                             if basarili:
                                 mesaj = f"BAĞLANDI: {sonuc.upper()}"
                             else:
@@ -305,174 +774,166 @@ def oyunu_baslat():
                     if event.key == pygame.K_1: secili_tip = "klasik"
                     elif event.key == pygame.K_2: secili_tip = "hayalet"
                     elif event.key == pygame.K_3: secili_tip = "hileli"
-                    elif event.key == pygame.K_RETURN and sum(envanter.values()) == 0:
+                    elif event.key == pygame.K_RETURN and oturum.savasi_baslat():
                         faz, mesaj = "SAVUNMA", "SAVAŞ BAŞLADI! [BOŞLUK] İLE ATEŞ ET."
 
-                elif event.type == pygame.MOUSEBUTTONDOWN and event.pos[1] > HUD_YUKSEKLIK:
-                    x, y = event.pos[0] // HUCRE, (event.pos[1] - HUD_YUKSEKLIK) // HUCRE
-                    if secili_tip == "klasik" and envanter["klasik"] > 0:
-                        oyun.gemi_yerlestir_klasik(x, y); envanter["klasik"] -= 1
+                elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and kamera.kareye(*event.pos):
+                    x, y = kamera.kareye(*event.pos)
+                    if secili_tip == "klasik":
+                        oturum.yerlestir_klasik(x, y)
                     elif secili_tip in ["hayalet", "hileli"] and envanter[secili_tip] > 0:
                         gecici_koordinatlar.append((x, y))
                         if len(gecici_koordinatlar) == 2:
                             if secili_tip == "hayalet":
-                                oyun.gemi_yerlestir_hayalet(gecici_koordinatlar[0], gecici_koordinatlar[1])
+                                oturum.yerlestir_hayalet(gecici_koordinatlar[0], gecici_koordinatlar[1])
                             else:
-                                oyun.gemi_yerlestir_hileli(gecici_koordinatlar[0], gecici_koordinatlar[1])
-                            envanter[secili_tip] -= 1; gecici_koordinatlar.clear()
-                    if sum(envanter.values()) == 0:
+                                oturum.yerlestir_hileli(gecici_koordinatlar[0], gecici_koordinatlar[1])
+                            gecici_koordinatlar.clear()
+                    if oturum.filo_tamam:
                         mesaj = "FİLO TAMAM! [ENTER] İLE SAVAŞI BAŞLAT."
 
+            elif faz == "QPU_BEKLENIYOR":
+                # Kuyruktaki işi bırak ve aynı ölçümü yerel simülatörde yap
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                    bekleyen_cozum.iptal()
+
             elif faz == "SAVUNMA":
                 if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
                     if kalan_tur > 0 and aktif_gemi_sayisi > 0:
-                        hedef = oyun.qc_hedef_belirle()
+                        hedef = (oynatici or oturum).hedef_sec()
                         if hedef:
                             animasyon_hedefi, animasyon_baslangic, faz = hedef, simdiki_zaman, "ANIMASYON"
                             mesaj = f"⚛  GÖZLEMLENECEK ALAN SEÇİLİYOR → {hedef}"
-                            radar_halkalari.append([hedef[0] * HUCRE + HUCRE // 2,
-                                                    hedef[1] * HUCRE + HUD_YUKSEKLIK + HUCRE // 2, 0])
+                            radar_halkalari.append([hedef, 0])
+                            # Büyük tahtalarda hedef görünüm dışındaysa kamera hedefe götürülür
+                            if not kamera.gorunur_mu(*hedef):
+                                kamera.odakla(*hedef)
 
-        # Animasyon çözümleme
+        # Animasyon çözümleme — kuantum ölçümü arka planda yürür, döngü her karede yoklar
         if faz == "ANIMASYON" and simdiki_zaman - animasyon_baslangic > 1000:
-            sonuc = oyun.atis_cozumle(animasyon_hedefi)
+            bekleyen_cozum = (oynatici or oturum).cozumle_baslat(animasyon_hedefi)
+            faz = "QPU_BEKLENIYOR"
+
+        if faz == "QPU_BEKLENIYOR" and not bekleyen_cozum.tamamlandi():
+            if bekleyen_cozum.bekleme_suresi > 0.25:
+                kaynak = "YEREL SİMÜLATÖR" if bekleyen_cozum.yedege_gecti else "QPU"
+                nokta = "." * (1 + (simdiki_zaman // 400) % 3)
+                mesaj = f"⚛  {kaynak} SONUCU BEKLENİYOR{nokta} {bekleyen_cozum.bekleme_suresi:.0f}s"
+                if not bekleyen_cozum.yedege_gecti:
+                    mesaj += "  [ESC] İPTAL"
+
+        elif faz == "QPU_BEKLENIYOR":
             faz, radar_halkalari = "SAVUNMA", []
-            hx, hy = animasyon_hedefi
-            if sonuc == 'batti_klasik':
-                mesaj, titreme_miktari = "💥 KRİTİK HASAR! GEMİ BATTI.", 15
-                vfx_patlama_olustur(hx, hy, R_RED)
-            elif sonuc == 'batti_kuantum':
-                mesaj, titreme_miktari = "⚛  DALGA ÇÖKTÜ — KUANTUM GEMİSİ BATTI!", 30
-                vfx_patlama_olustur(hx, hy, R_CYAN, 50)
-            elif sonuc == 'kurtuldu_kuantum':
-                mesaj = "✦  MUCİZE! GEMİ SÜPERPOZİSYONDAN KAÇTI."
-                vfx_patlama_olustur(hx, hy, R_GREEN, 20)
-            else:
-                mesaj = "~  KARAVANA. SİSTEM ISKALADI."
-                vfx_patlama_olustur(hx, hy, R_DIM, 15)
-
-            yeni_aktif = sum(1 for v in oyun.ships.values() if v['durum'] == 'aktif')
-            if yeni_aktif == 0:
-                faz, mesaj = "OYUN_BITTI", "■  SİSTEM KAZANDI. FİLO YOK EDİLDİ."
-            elif len(oyun.vurulan_kareler) >= MAX_TUR:
-                faz, mesaj = "OYUN_BITTI", "★  TEBRİKLER! 30 TUR DAYANDIN VE KAZANDIN!"
+            # Ölçüm hatası BekleyenCozum'da analitik örnekleyiciyle karşılanır; yine de bir hata kaçarsa
+            # ana döngü ölmez, atış HUD'da bildirilip savunmaya dönülür
+            try:
+                olay = bekleyen_cozum.olay()
+            except Exception as e:
+                olay = None
+                mesaj = f"HATA: {str(e)[:35]} — ATIŞ ÇÖZÜLEMEDİ"
+            analitik_yedek = bekleyen_cozum.hata is not None
+            bekleyen_cozum = None
+
+            if olay is not None:
+                sonuc = olay.sonuc
+                hx, hy = animasyon_hedefi
+                if sonuc == 'batti_klasik':
+                    mesaj, titreme_miktari = "💥 KRİTİK HASAR! GEMİ BATTI.", 15
+                    vfx_patlama_olustur(hx, hy, R_RED)
+                elif sonuc == 'batti_kuantum':
+                    mesaj, titreme_miktari = "⚛  DALGA ÇÖKTÜ — KUANTUM GEMİSİ BATTI!", 30
+                    vfx_patlama_olustur(hx, hy, R_CYAN, 50)
+                elif sonuc == 'kurtuldu_kuantum':
+                    mesaj = "✦  MUCİZE! GEMİ SÜPERPOZİSYONDAN KAÇTI."
+                    vfx_patlama_olustur(hx, hy, R_GREEN, 20)
+                else:
+                    mesaj = "~  KARAVANA. SİSTEM ISKALADI."
+                    vfx_patlama_olustur(hx, hy, R_DIM, 15)
+                if analitik_yedek:
+                    mesaj += "  [ÖLÇÜM HATASI: ANALİTİK]"
+
+                if olay.kazanan == "sistem":
+                    faz, mesaj = "OYUN_BITTI", "■  SİSTEM KAZANDI. FİLO YOK EDİLDİ."
+                elif olay.kazanan == "oyuncu":
+                    faz, mesaj = "OYUN_BITTI", f"★  TEBRİKLER! {MAX_TUR} TUR DAYANDIN VE KAZANDIN!"
+
+        # Ok tuşlarıyla sürekli kaydırma
+        tuslar = pygame.key.get_pressed()
+        kaydirma = (12 * (tuslar[pygame.K_RIGHT] - tuslar[pygame.K_LEFT]),
+                    12 * (tuslar[pygame.K_DOWN] - tuslar[pygame.K_UP]))
+        kamera.kaydir(*kaydirma)
+
+        profil.isaretle("olaylar")
+
+        # Değişiklik ya da animasyon yoksa kare çizilmez; ekranda bir önceki kare kalır
+        canli = (faz in ("ANIMASYON", "QPU_BEKLENIYOR") or radar_halkalari or parcaciklar.adet
+                 or titreme_miktari > 0 or any(kaydirma) or profil_gorunur)
+        durum = (faz, mesaj, oturum.tur, oyun.gemi_surumu, kamera.surum, oyun.backend_tipi)
+        if not zamanlayici.cizilmeli(durum, canli):
+            zamanlayici.bekle(saat)
+            continue
 
         # ====================== ÇİZİM ======================
         ekran.fill(R_BG)
 
-        # Işık saçan ızgara arka planı
-        for gx in range(BOARD_SIZE):
-            for gy in range(BOARD_SIZE):
-                r = pygame.Rect(gx * HUCRE, gy * HUCRE + HUD_YUKSEKLIK, HUCRE, HUCRE)
-                pygame.draw.rect(ekran, R_GRID_DIM, r)
-                pygame.draw.rect(ekran, R_GRID, r, 1)
-
-        # Vurulmuş kareler
-        for (vx, vy) in oyun.vurulan_kareler:
-            r = pygame.Rect(vx * HUCRE, vy * HUCRE + HUD_YUKSEKLIK, HUCRE, HUCRE)
-            pygame.draw.rect(ekran, R_HIT_BG, r)
-            pygame.draw.rect(ekran, (35, 50, 70), r, 1)
-            # X işareti
-            m = r.center
-            pygame.draw.line(ekran, (80, 40, 40), (m[0]-14, m[1]-14), (m[0]+14, m[1]+14), 2)
-            pygame.draw.line(ekran, (80, 40, 40), (m[0]-14, m[1]+14), (m[0]+14, m[1]-14), 2)
+        # Izgara zemini + vurulmuş kareler (önceden çizilmiş katman)
+        cizici.zemini_guncelle(oyun.vurulan_kareler)
+        cizici.zemini_ciz(ekran)
 
         # Animasyon - yanıp sönen hedef
-        if faz == "ANIMASYON" and animasyon_hedefi:
-            ax, ay = animasyon_hedefi
-            r = pygame.Rect(ax * HUCRE, ay * HUCRE + HUD_YUKSEKLIK, HUCRE, HUCRE)
+        if faz in ("ANIMASYON", "QPU_BEKLENIYOR") and animasyon_hedefi:
             puls = abs(np.sin(simdiki_zaman * 0.008)) * 255
-            surf_target = pygame.Surface((HUCRE, HUCRE), pygame.SRCALPHA)
-            surf_target.fill((255, 200, 0, int(puls * 0.4)))
-            ekran.blit(surf_target, r.topleft)
-            pygame.draw.rect(ekran, R_GOLD, r, 2)
+            r = cizici.hedef_ciz(ekran, animasyon_hedefi, int(puls * 0.4))
+            if faz == "QPU_BEKLENIYOR":
+                # Dönen bekleme yayı
+                aci = simdiki_zaman * 0.006
+                pygame.draw.arc(ekran, R_CYAN, r.inflate(-16, -16), aci, aci + 4.2, 3)
+        profil.isaretle("izgara")
 
         # --- GEMİLER ---
         if faz != "ANA_MENU":
-            for isim, v in oyun.ships.items():
-                if v['durum'] == 'batti':
-                    cx = v['koordinatlar'][0][0] * HUCRE + HUCRE // 2
-                    cy = v['koordinatlar'][0][1] * HUCRE + HUD_YUKSEKLIK + HUCRE // 2
-                    # Parlayan kırmızı daire
-                    for r_off in range(3, 0, -1):
-                        alpha_surf = pygame.Surface((HUCRE, HUCRE), pygame.SRCALPHA)
-                        pygame.draw.circle(alpha_surf, (*R_RED, 60 // r_off),
-                                           (HUCRE // 2, HUCRE // 2), HUCRE // 3 + r_off * 4)
-                        ekran.blit(alpha_surf, (v['koordinatlar'][0][0] * HUCRE, v['koordinatlar'][0][1] * HUCRE + HUD_YUKSEKLIK))
-                    pygame.draw.circle(ekran, R_RED, (cx, cy), HUCRE // 3)
-                    pygame.draw.circle(ekran, (255, 150, 150), (cx, cy), HUCRE // 3, 2)
-                else:
-                    tip = v['tip']
-                    renk = R_KLASIK if tip == 'klasik' else (R_CYAN if tip == 'hayalet' else R_PURPLE)
-                    for (gx, gy) in v['koordinatlar']:
-                        gemi_r = pygame.Rect(gx * HUCRE + 12, gy * HUCRE + HUD_YUKSEKLIK + 12, HUCRE - 24, HUCRE - 24)
-                        if tip == 'klasik':
-                            pygame.draw.rect(ekran, renk, gemi_r)
-                            pygame.draw.rect(ekran, (130, 160, 195), gemi_r, 2)
-                        else:
-                            # Parlayan kenarlı kuantum gemisi
-                            iç_r = gemi_r.inflate(-6, -6)
-                            pygame.draw.rect(ekran, (*renk[:3], 30) if False else (renk[0]//6, renk[1]//6, renk[2]//6), gemi_r)
-                            pygame.draw.rect(ekran, renk, gemi_r, 2)
-                            pygame.draw.rect(ekran, (255, 255, 255), iç_r, 1)
-
-                    # İki koordinatlı gemiler arası bağlantı çizgisi
-                    if v['durum'] == 'aktif' and len(v['koordinatlar']) == 2:
-                        p1 = (v['koordinatlar'][0][0] * HUCRE + HUCRE // 2,
-                              v['koordinatlar'][0][1] * HUCRE + HUD_YUKSEKLIK + HUCRE // 2)
-                        p2 = (v['koordinatlar'][1][0] * HUCRE + HUCRE // 2,
-                              v['koordinatlar'][1][1] * HUCRE + HUD_YUKSEKLIK + HUCRE // 2)
-                        pygame.draw.line(ekran, renk, p1, p2, 2)
-                        # Ortada ⚛ sembolü
-                        orta = ((p1[0] + p2[0]) // 2, (p1[1] + p2[1]) // 2)
-                        sembol = font_mikro.render("⚛", True, renk)
-                        ekran.blit(sembol, (orta[0] - sembol.get_width() // 2, orta[1] - sembol.get_height() // 2))
+            cizici.gemileri_ciz(ekran, oyun)
 
         # Yerleştirme çizgisi (önizleme)
         if faz == "YERLESTIRME" and len(gecici_koordinatlar) == 1:
             mx, my = pygame.mouse.get_pos()
-            if my > HUD_YUKSEKLIK:
+            if kamera.alan.collidepoint(mx, my):
                 renk_sec = R_CYAN if secili_tip == "hayalet" else R_PURPLE
-                gx = gecici_koordinatlar[0][0] * HUCRE + HUCRE // 2
-                gy = gecici_koordinatlar[0][1] * HUCRE + HUD_YUKSEKLIK + HUCRE // 2
-                pygame.draw.line(ekran, renk_sec, (gx, gy), (mx, my), 2)
+                pygame.draw.line(ekran, renk_sec, kamera.hucre_merkez(*gecici_koordinatlar[0]), (mx, my), 2)
+        profil.isaretle("gemiler")
 
         # --- VFX ---
         for h in radar_halkalari:
-            h[2] += 3
-            alpha = max(0, 255 - int(h[2] * 4))
-            surf_h = pygame.Surface((HUCRE * 2, HUCRE * 2), pygame.SRCALPHA)
-            pygame.draw.circle(surf_h, (*R_GOLD, alpha), (HUCRE, HUCRE), int(h[2]), 2)
-            ekran.blit(surf_h, (h[0] - HUCRE, h[1] - HUCRE))
-            if h[2] > HUCRE: h[2] = 0
-
-        for p in parcaciklar[:]:
-            p[0] += p[2]; p[1] += p[3]; p[4] -= 1
-            alpha = max(0, int(p[4] / 50 * 255))
-            pygame.draw.circle(ekran, p[5], (int(p[0]), int(p[1])), p[6])
-            if p[4] <= 0: parcaciklar.remove(p)
+            h[1] += 3
+            alpha = max(0, 255 - int(h[1] * 4))
+            cizici.halka_ciz(ekran, h[0], h[1], alpha)
+            if h[1] > TEMEL_HUCRE: h[1] = 0
+
+        parcaciklar.guncelle()
+        parcaciklar.ciz(ekran, kamera)
+        profil.isaretle("vfx")
 
         # ====================== HUD ======================
-        pygame.draw.rect(ekran, R_HUD_BG, (0, 0, BOARD_SIZE * HUCRE, HUD_YUKSEKLIK))
+        pygame.draw.rect(ekran, R_HUD_BG, (0, 0, GENISLIK, HUD_YUKSEKLIK))
         ciz_hud_sınır(ekran)
 
         # Motor durumu - sol üst köşe badge
         motor_txt = f"⚡ {oyun.backend_tipi.upper()}"
         motor_renk = R_GOLD if oyun.backend_tipi == "ibm" else R_GREEN
-        motor_surf = font_mikro.render(motor_txt, True, motor_renk)
+        motor_surf = metinler.render(font_mikro, motor_txt, True, motor_renk)
         pygame.draw.rect(ekran, (10, 25, 15) if oyun.backend_tipi != "ibm" else (25, 20, 5),
                          (4, 4, motor_surf.get_width() + 12, 20))
         ekran.blit(motor_surf, (10, 7))
 
         if faz == "ANA_MENU":
             # Başlık
-            baslik = font_buyuk.render("KUANTUM AMİRAL BATTISI", True, R_CYAN)
-            ekran.blit(baslik, baslik.get_rect(centerx=BOARD_SIZE * HUCRE // 2, y=10))
+            baslik = metinler.render(font_buyuk, "KUANTUM AMİRAL BATTISI", True, R_CYAN)
+            ekran.blit(baslik, baslik.get_rect(centerx=GENISLIK // 2, y=10))
 
-            s1 = font_kucuk.render("[1] YEREL SİMÜLATÖR  —  Hızlı, anlık", True, R_WHITE)
-            s2 = font_kucuk.render("[2] IBM QUANTUM QPU  —  Gerçek, kuyruklı", True, R_GOLD)
-            ekran.blit(s1, s1.get_rect(centerx=BOARD_SIZE * HUCRE // 2, y=50))
-            ekran.blit(s2, s2.get_rect(centerx=BOARD_SIZE * HUCRE // 2, y=82))
+            s1 = metinler.render(font_kucuk, "[1] YEREL SİMÜLATÖR  —  Hızlı, anlık", True, R_WHITE)
+            s2 = metinler.render(font_kucuk, "[2] IBM QUANTUM QPU  —  Gerçek, kuyruklı", True, R_GOLD)
+            ekran.blit(s1, s1.get_rect(centerx=GENISLIK // 2, y=50))
+            ekran.blit(s2, s2.get_rect(centerx=GENISLIK // 2, y=82))
 
         elif faz == "YERLESTIRME":
             # Tip seçici
@@ -489,54 +950,52 @@ def oyunu_baslat():
                     pygame.draw.rect(ekran, (renk[0]//5, renk[1]//5, renk[2]//5),
                                      (10 + i * 215, 8, 205, 30))
                     pygame.draw.rect(ekran, renk, (10 + i * 215, 8, 205, 30), 1)
-                t = font_kucuk.render(tip_str, True, renk if aktif_sec else R_DIM)
+                t = metinler.render(font_kucuk, tip_str, True, renk if aktif_sec else R_DIM)
                 ekran.blit(t, (20 + i * 215, 12))
 
-            durum_renk = R_GOLD if sum(envanter.values()) == 0 else R_WHITE
-            durum_str = "FİLO TAMAM! [ENTER] İLE BAŞLAT." if sum(envanter.values()) == 0 else mesaj
+            durum_renk = R_GOLD if oturum.filo_tamam else R_WHITE
+            durum_str = "FİLO TAMAM! [ENTER] İLE BAŞLAT." if oturum.filo_tamam else mesaj
             ciz_metin_golge(ekran, font_buyuk, durum_str, durum_renk, (10, 48))
 
             # Seçili tip ipucu
-            ipucu = font_mikro.render(f"Seçili: {secili_tip.upper()} | {'Tek tık' if secili_tip == 'klasik' else 'İki kare seç'}", True, R_DIM)
+            ipucu = metinler.render(font_mikro, f"Seçili: {secili_tip.upper()} | {'Tek tık' if secili_tip == 'klasik' else 'İki kare seç'}", True, R_DIM)
             ekran.blit(ipucu, (10, 98))
 
         else:
             # Savaş HUD'u
             # Sol: Tur sayacı
-            tur_str = f"TUR  {len(oyun.vurulan_kareler):02d} / {MAX_TUR}"
+            tur_str = f"TUR  {oturum.tur:02d} / {MAX_TUR}"
             tur_renk = R_RED if kalan_tur < 5 else (R_GOLD if kalan_tur < 10 else R_GREEN)
             ciz_metin_golge(ekran, font_buyuk, tur_str, tur_renk, (10, 15))
 
             # Sağ: Filo durumu
             gemi_str = f"GEMİ  {aktif_gemi_sayisi}"
             gemi_renk = R_RED if aktif_gemi_sayisi == 1 else R_WHITE
-            gemi_surf = font_buyuk.render(gemi_str, True, gemi_renk)
-            ekran.blit(gemi_surf, (BOARD_SIZE * HUCRE - gemi_surf.get_width() - 10, 15))
+            gemi_surf = metinler.render(font_buyuk, gemi_str, True, gemi_renk)
+            ekran.blit(gemi_surf, (GENISLIK - gemi_surf.get_width() - 10, 15))
 
             # Orta: Mesaj
-            mesaj_surf = font_kucuk.render(mesaj, True, R_WHITE)
-            ekran.blit(mesaj_surf, mesaj_surf.get_rect(centerx=BOARD_SIZE * HUCRE // 2, y=50))
+            mesaj_surf = metinler.render(font_kucuk, mesaj, True, R_WHITE)
+            ekran.blit(mesaj_surf, mesaj_surf.get_rect(centerx=GENISLIK // 2, y=50))
 
             # Alt: Talimat
-            talimat = font_mikro.render("[BOŞLUK] → SİSTEM ATEŞ ETSİN", True, R_DIM)
-            ekran.blit(talimat, talimat.get_rect(centerx=BOARD_SIZE * HUCRE // 2, y=96))
+            talimat = metinler.render(font_mikro, "[BOŞLUK] → SİSTEM ATEŞ ETSİN", True, R_DIM)
+            ekran.blit(talimat, talimat.get_rect(centerx=GENISLIK // 2, y=96))
 
         # Oyun bitti overlay
         if faz == "OYUN_BITTI":
-            overlay = pygame.Surface((BOARD_SIZE * HUCRE, BOARD_SIZE * HUCRE + HUD_YUKSEKLIK), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 180))
-            ekran.blit(overlay, (0, 0))
+            cizici.karartma_ciz(ekran)
 
             # Çerçeveli sonuç kutusu
             kutu_w, kutu_h = 500, 100
-            kutu_x = (BOARD_SIZE * HUCRE - kutu_w) // 2
-            kutu_y = (BOARD_SIZE * HUCRE + HUD_YUKSEKLIK) // 2 - kutu_h // 2
+            kutu_x = (GENISLIK - kutu_w) // 2
+            kutu_y = YUKSEKLIK // 2 - kutu_h // 2
             pygame.draw.rect(ekran, (8, 18, 30), (kutu_x, kutu_y, kutu_w, kutu_h))
             pygame.draw.rect(ekran, R_CYAN, (kutu_x, kutu_y, kutu_w, kutu_h), 2)
 
             son_renk = R_RED if "SİSTEM" in mesaj else R_GOLD
-            txt = font_buyuk.render(mesaj, True, son_renk)
-            ekran.blit(txt, txt.get_rect(center=(BOARD_SIZE * HUCRE // 2, (BOARD_SIZE * HUCRE + HUD_YUKSEKLIK) // 2)))
+            txt = metinler.render(font_buyuk, mesaj, True, son_renk)
+            ekran.blit(txt, txt.get_rect(center=(GENISLIK // 2, YUKSEKLIK // 2)))
 
         # Ekran titremesi
         sx = random.randint(-titreme_miktari, titreme_miktari) if titreme_miktari > 0 else 0
@@ -545,9 +1004,38 @@ def oyunu_baslat():
 
         GERCEK_EKRAN.fill((0, 0, 0))
         GERCEK_EKRAN.blit(ekran, (sx, sy))
+        profil.isaretle("hud")
+
+        if profil_gorunur:
+            if profil_paneli is None or profil.kare_no % 30 == 0:
+                profil_paneli = profil_paneli_olustur()
+            GERCEK_EKRAN.blit(profil_paneli, (GERCEK_EKRAN.get_width() - profil_paneli.get_width() - 4, 28))
+            profil.isaretle("profil")
+
         pygame.display.flip()
-        saat.tick(60)
+        profil.isaretle("flip")
+        profil.kare_bitir()
+        if kare_limiti:
+            kare_sureleri.append(time.perf_counter() - kare_baslangic)
+            if len(kare_sureleri) >= kare_limiti:
+                profil.kapat()
+                if oturum.gunluk: oturum.gunluk.kapat()
+                pygame.quit()
+                return kare_sureleri
+            continue
+        zamanlayici.bekle(saat)
 
 
 if __name__ == "__main__":
-    oyunu_baslat()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Kuantum Amiral Battı")
+    parser.add_argument("--demo", action="store_true", help="oyunu kendi kendine oynat")
+    parser.add_argument("--kare-limiti", type=int, default=None, help="bu kadar kareden sonra çık")
+    parser.add_argument("--profil", metavar="DOSYA", default=None, help="kare ve çökme ölçümlerini JSONL olarak yaz")
+    parser.add_argument("--gunluk", metavar="DOSYA", default=None, help="oyunu ikili günlüğe kaydet")
+    parser.add_argument("--tekrar", metavar="DOSYA", default=None, help="günlükteki bir oyunu yeniden oynat")
+    parser.add_argument("--oyun", type=int, default=0, help="--tekrar ile oynatılacak oyun numarası")
+    parser.add_argument("--boyut", type=int, default=8, help="tahta boyutu (kare)")
+    args = parser.parse_args()
+    oyunu_baslat(demo=args.demo, kare_limiti=args.kare_limiti, profil_dosyasi=args.profil,
+                 gunluk_dosyasi=args.gunluk, tekrar=(args.tekrar, args.oyun) if args.tekrar else None,
+                 board_size=args.boyut)
\ No newline at end of file
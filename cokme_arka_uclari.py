@@ -0,0 +1,641 @@
+import math
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+# Qiskit ve Aer ağır kütüphanelerdir; yalnızca bir devre gerçekten kurulduğunda içe aktarılırlar.
+# Analitik arka uç Qiskit'e hiç dokunmaz.
+#
+# Qiskit'i ilk içe aktaran iş parçacığı sonlandıktan sonra başka bir iş parçacığında devre kurmak süreci
+# çökertebiliyor (ısıtma iş parçacığı biter, ardından çökme iş parçacığı devre kurar). İlk içe aktarım bu
+# yüzden hiç sonlanmayan tek bir daemon iş parçacığında yapılır; çağıran, içe aktarım bitene kadar bekler.
+# Yeniden üretimi: tests/test_qiskit_yukleme.py (transpile SIGSEGV ile çöker).
+_ICE_AKTARMA_KILIDI = threading.Lock()
+_qiskit_yuklendi = threading.Event()
+
+
+def _qiskit_yukleyici():
+    try:
+        import qiskit  # noqa: F401
+        try:
+            import qiskit_aer  # noqa: F401
+        except ImportError:
+            pass
+    finally:
+        _qiskit_yuklendi.set()
+    threading.Event().wait()
+
+
+def qiskit_yukle():
+    if _qiskit_yuklendi.is_set():
+        return
+    with _ICE_AKTARMA_KILIDI:
+        if not _qiskit_yuklendi.is_set():
+            threading.Thread(target=_qiskit_yukleyici, name="qiskit-yukleyici", daemon=True).start()
+            _qiskit_yuklendi.wait()
+
+
+# --- ÇOK KONUMLU GEMİ DAĞILIMI ---
+# k konumlu bir gemi keyfi bir genlik vektörüyle tanımlanır; i. konumda çökme olasılığı |a_i|²'dir.
+# Analitik yol için Walker takma ad (alias) tablosu bir kez kurulur: tek bir [0, 1) sayısı hem sütunu
+# hem eşiği belirler, çökme k'dan bağımsız O(1)'dir. Devre yolu için aynı dağılım ceil(log2 k) kübitte
+# bir Ry ağacıyla hazırlanır; ağacın açıları da burada bir kez hesaplanır.
+# Ölçüm arka uçlarına 'theta' yerine geçer: olc(tip, dagilim) çöken konumun sırasını döndürür.
+class KonumDagilimi:
+    __slots__ = ('olasiliklar', 'k', 'kubit', 'esik', 'takma', 'acilar', '_anahtar')
+
+    def __init__(self, genlikler):
+        olasiliklar = np.abs(np.asarray(genlikler, dtype=np.complex128)) ** 2
+        if olasiliklar.ndim != 1 or len(olasiliklar) < 2 or not olasiliklar.sum() > 0:
+            raise ValueError("Genlik vektörü en az iki konum ve sıfırdan farklı norm içermeli")
+        olasiliklar = olasiliklar / olasiliklar.sum()
+        olasiliklar.setflags(write=False)
+        self.olasiliklar = olasiliklar
+        self.k = len(olasiliklar)
+        self.kubit = (self.k - 1).bit_length()
+        self.esik, self.takma = walker_tablosu(olasiliklar)
+        self.acilar = tuple(agac_acilari(olasiliklar, self.kubit).tolist())
+        self._anahtar = tuple(np.round(olasiliklar, 12).tolist())
+
+    @classmethod
+    def esit(cls, k):
+        return cls(np.ones(k))
+
+    def ornekle(self, rng):
+        u = rng.random() * self.k
+        i = int(u)
+        return i if u - i < self.esik[i] else int(self.takma[i])
+
+    def ornekle_coklu(self, rng, adet):
+        u = rng.random(adet) * self.k
+        i = u.astype(np.int64)
+        return np.where(u - i < self.esik[i], i, self.takma[i]).astype(np.uint8)
+
+    def __eq__(self, diger):
+        return isinstance(diger, KonumDagilimi) and self._anahtar == diger._anahtar
+
+    def __hash__(self):
+        return hash(self._anahtar)
+
+    def __repr__(self):
+        return f"KonumDagilimi({np.round(self.olasiliklar, 4).tolist()})"
+
+
+# Vose'nin kararlı kurulumu: ortalamanın altındaki sütunlar üstündekilerden tamamlanır
+def walker_tablosu(olasiliklar):
+    k = len(olasiliklar)
+    olcekli = np.asarray(olasiliklar, dtype=np.float64) * k
+    esik = np.ones(k)
+    takma = np.arange(k)
+    kucuk = [i for i in range(k) if olcekli[i] < 1.0]
+    buyuk = [i for i in range(k) if olcekli[i] >= 1.0]
+    while kucuk and buyuk:
+        s, b = kucuk.pop(), buyuk.pop()
+        esik[s], takma[s] = olcekli[s], b
+        olcekli[b] -= 1.0 - olcekli[s]
+        (kucuk if olcekli[b] < 1.0 else buyuk).append(b)
+    # Kalanlar yuvarlama artığıdır; tam sütun sayılır
+    return esik, takma
+
+
+# En anlamlı kübitten başlayarak her kübit, üstündeki kübitlerin değeri (önek j) koşuluyla
+# Ry(α_j) ile döndürülür; α_j, önekin alt ağacında 1 dalına düşen olasılık payından gelir.
+# Koşullu döndürmeler CX + Ry dizisine açıldığından (Gray kodu sırası) açılar
+# θ = Mᵀα / 2^m ile dönüştürülür; M_ji = (-1)^popcount(j & g_i). Devrenin yapısı yalnızca kübit
+# sayısına bağlıdır, dağılım sadece açılardır.
+def agac_acilari(olasiliklar, kubit):
+    p = np.zeros(1 << kubit)
+    p[:len(olasiliklar)] = olasiliklar
+    acilar = []
+    for hedef in range(kubit - 1, -1, -1):
+        m = kubit - 1 - hedef
+        dugumler = p.reshape(1 << m, 2, 1 << hedef).sum(axis=2)
+        toplam = dugumler.sum(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            alfa = 2 * np.arcsin(np.sqrt(np.where(toplam > 0, dugumler[:, 1] / toplam, 0.0).clip(0, 1)))
+        gray = np.arange(1 << m) ^ (np.arange(1 << m) >> 1)
+        isaret = np.array([[(-1) ** bin(j & g).count('1') for g in gray] for j in range(1 << m)])
+        acilar.append(isaret.T @ alfa / (1 << m))
+    return np.concatenate(acilar) if acilar else np.zeros(0)
+
+
+def _agac_ekle(qc, kubit, acilar):
+    i = 0
+    for hedef in range(kubit - 1, -1, -1):
+        m = kubit - 1 - hedef
+        for adim in range(1 << m):
+            qc.ry(acilar[i], hedef)
+            i += 1
+            if m:
+                # Gray kodunda adim ile adim+1 arasında değişen bit; son adımda en üst bit
+                bit = (adim + 1 & -(adim + 1)).bit_length() - 1 if adim + 1 < (1 << m) else m - 1
+                qc.cx(hedef + 1 + bit, hedef)
+
+
+def parametreli_coklu_devre(kubit):
+    qiskit_yukle()
+    from qiskit import QuantumCircuit
+    from qiskit.circuit import ParameterVector
+    acilar = ParameterVector("α", (1 << kubit) - 1)
+    qc = QuantumCircuit(kubit, kubit)
+    _agac_ekle(qc, kubit, acilar)
+    qc.measure(range(kubit), range(kubit))
+    return qc
+
+
+# --- BORN KURALI ---
+# Tek kübitlik gemi devreleri için |0> ölçme olasılığı kesin olarak bilinir:
+# hayalet (H) için 1/2, hileli (Ry(θ)) için cos²(θ/2) = agirlik; çok konumlu gemide ilk konumun olasılığı.
+def sifir_olasiligi(tip, theta=None):
+    if isinstance(theta, KonumDagilimi):
+        return float(theta.olasiliklar[0])
+    if tip == 'hayalet':
+        return 0.5
+    if tip == 'hileli':
+        return float(np.cos(theta / 2) ** 2)
+    raise ValueError(f"Kuantum olmayan gemi tipi: {tip}")
+
+
+def cokme_devresi(tip, theta=None):
+    qiskit_yukle()
+    from qiskit import QuantumCircuit
+    if isinstance(theta, KonumDagilimi):
+        qc = QuantumCircuit(theta.kubit, theta.kubit)
+        _agac_ekle(qc, theta.kubit, theta.acilar)
+        qc.measure(range(theta.kubit), range(theta.kubit))
+        return qc
+    qc = QuantumCircuit(1, 1)
+    if tip == 'hayalet':
+        qc.h(0)
+    elif tip == 'hileli':
+        qc.ry(theta, 0)
+    qc.measure(0, 0)
+    return qc
+
+
+# --- PARAMETRELİ DEVRELER VE TRANSPILE ÖNBELLEĞİ ---
+# Çökme devreleri yalnızca kapı tipi ve θ açısında farklılaşır. Her tip için tek bir parametreli
+# devre backend başına bir kez transpile edilir, atış başına sadece θ bağlanır.
+_THETA = None
+
+
+def theta_parametresi():
+    global _THETA
+    if _THETA is None:
+        qiskit_yukle()
+        from qiskit.circuit import Parameter
+        _THETA = Parameter("θ")
+    return _THETA
+
+
+def parametreli_cokme_devresi(tip):
+    qiskit_yukle()
+    from qiskit import QuantumCircuit
+    qc = QuantumCircuit(1, 1)
+    if tip == 'hayalet':
+        qc.h(0)
+    elif tip == 'hileli':
+        qc.ry(theta_parametresi(), 0)
+    else:
+        raise ValueError(f"Kuantum olmayan gemi tipi: {tip}")
+    qc.measure(0, 0)
+    return qc
+
+
+# --- ÇOK KÜBİTLİ TOPLU ÇÖKME ---
+# Farklı oturumlardan biriken n ölçüm tek devrede n bağımsız kübite yerleştirilir: i. kübit Ry(θ_i) ile
+# döndürülüp i. klasik bite ölçülür. Hayalet için θ = π/2 alınır (|0> olasılığı H kapısındaki gibi 1/2).
+def toplu_aci(tip, theta=None):
+    if isinstance(theta, KonumDagilimi):
+        raise ValueError("Çok konumlu gemiler tek kübitlik toplu devreye sığmaz")
+    if tip == 'hayalet':
+        return math.pi / 2
+    if tip == 'hileli':
+        return float(theta)
+    raise ValueError(f"Kuantum olmayan gemi tipi: {tip}")
+
+
+def parametreli_toplu_devre(n):
+    qiskit_yukle()
+    from qiskit import QuantumCircuit
+    from qiskit.circuit import ParameterVector
+    acilar = ParameterVector("θ", n)
+    qc = QuantumCircuit(n, n)
+    for i in range(n):
+        qc.ry(acilar[i], i)
+    qc.measure(range(n), range(n))
+    return qc
+
+
+# Çökme iş parçacıkları (BekleyenCozum), havuz dolumları ve sunucunun toplu gönderimleri önbelleği aynı anda
+# kullanır. Arama, backend kontrolü ve ekleme tek bir kilit altında yapılır; transpile de kilit altındadır,
+# böylece aynı devre iki kez transpile edilmez. Parametre bağlama kopya üzerinde, kilit dışında yapılır.
+class DevreOnbellegi:
+    def __init__(self):
+        self._devreler = {}
+        self._backend_anahtari = None
+        self._kilit = threading.Lock()
+
+    @staticmethod
+    def backend_anahtari(backend):
+        return (backend.name, getattr(backend, 'version', None), id(backend))
+
+    def gecersiz_kil(self):
+        with self._kilit:
+            self._devreler.clear()
+            self._backend_anahtari = None
+
+    # Kilit altında çağrılır
+    def _backend_kontrol(self, backend):
+        anahtar = self.backend_anahtari(backend)
+        if anahtar != self._backend_anahtari:
+            # Backend değişti: eski hedefe göre transpile edilmiş devreler artık geçersiz
+            self._devreler.clear()
+            self._backend_anahtari = anahtar
+        return anahtar
+
+    # ek: backend anahtarına eklenen devre kimliği; kur: önbellekte yoksa transpile edilecek devreyi üretir
+    def _getir(self, backend, ek, kur):
+        with self._kilit:
+            anahtar = (self._backend_kontrol(backend),) + ek
+            if anahtar not in self._devreler:
+                qiskit_yukle()
+                from qiskit import transpile
+                self._devreler[anahtar] = transpile(kur(), backend)
+            return self._devreler[anahtar]
+
+    def isit(self, backend, tipler=('hayalet', 'hileli')):
+        for tip in tipler:
+            self.devre(backend, tip)
+
+    def devre(self, backend, tip):
+        return self._getir(backend, (tip,), lambda: parametreli_cokme_devresi(tip))
+
+    def bagla(self, backend, tip, theta=None):
+        if isinstance(theta, KonumDagilimi):
+            return self.coklu_devre(backend, theta.kubit).assign_parameters(list(theta.acilar))
+        qc = self.devre(backend, tip)
+        if qc.parameters:
+            return qc.assign_parameters([theta])
+        return qc
+
+    # Çok konumlu gemilerin Ry ağacı kübit sayısı başına bir kez transpile edilir
+    def coklu_devre(self, backend, kubit):
+        return self._getir(backend, ('coklu', kubit), lambda: parametreli_coklu_devre(kubit))
+
+    # Kübit sayısı ikinin kuvvetine yuvarlanır (fazla kübitler θ = 0 ile hep 0 ölçülür); böylece
+    # değişken parti boyutları için backend başına yalnızca birkaç devre transpile edilir
+    def toplu_bagla(self, backend, acilar):
+        n = 1 << max(len(acilar) - 1, 0).bit_length()
+        n = min(n, getattr(backend, 'num_qubits', None) or n)
+        qc = self._getir(backend, ('toplu', n), lambda: parametreli_toplu_devre(n))
+        return qc.assign_parameters(list(acilar) + [0.0] * (n - len(acilar)))
+
+    def __len__(self):
+        with self._kilit:
+            return len(self._devreler)
+
+
+DEVRE_ONBELLEGI = DevreOnbellegi()
+
+
+# --- ÇÖKME ARKA UÇLARI ---
+# Her arka uç tek bir kübiti ölçer ve 0/1 döndürür; 0 ilk koordinat, 1 ikinci koordinattır.
+# theta bir KonumDagilimi ise ceil(log2 k) kübit ölçülür ve çöken konumun sırası (0..k-1) döner.
+class CokmeArkaUcu:
+    ad = "temel"
+    _yerel = None
+
+    # Son ölçümü üreten uzak işin kimliği (gunluk için). Ölçümler farklı iş parçacıklarından
+    # yapılabildiğinden iş parçacığına özgü tutulur; yerel arka uçlarda None
+    @property
+    def son_is_no(self):
+        return getattr(self._yerel, 'is_no', None)
+
+    # Aynı işin kuyruk/çalışma süreleri (profil.Profilci için); iş parçacığına özgü, yerel arka uçlarda None
+    @property
+    def son_zamanlama(self):
+        return getattr(self._yerel, 'zamanlama', None)
+
+    def olc(self, tip, theta=None):
+        raise NotImplementedError
+
+    # Uzak işleri olan arka uçlar bekleyen işi iptal eder; yerel arka uçlarda yapılacak bir şey yok
+    def iptal(self):
+        pass
+
+    def isit(self):
+        pass
+
+    # Bir (tip, θ) çifti için ölçüm yakında istenecek; önbellekli arka uçlar hazırlığa başlayabilir
+    def on_yukle(self, tip, theta=None):
+        pass
+
+    def olc_coklu(self, tip, theta, adet):
+        return np.array([self.olc(tip, theta) for _ in range(adet)], dtype=np.uint8)
+
+    # istekler: farklı gemilerin (tip, θ) çiftleri; her biri için bağımsız bir ölçüm, tek gönderimde
+    def olc_toplu(self, istekler):
+        return np.array([self.olc(tip, theta) for tip, theta in istekler], dtype=np.uint8)
+
+
+class AnalitikArkaUc(CokmeArkaUcu):
+    ad = "analitik"
+
+    def __init__(self, seed=None):
+        self.rng = np.random.default_rng(seed)
+
+    def olc(self, tip, theta=None):
+        if isinstance(theta, KonumDagilimi):
+            return theta.ornekle(self.rng)
+        return 0 if self.rng.random() < sifir_olasiligi(tip, theta) else 1
+
+    def olc_coklu(self, tip, theta, adet):
+        if isinstance(theta, KonumDagilimi):
+            return theta.ornekle_coklu(self.rng, adet)
+        return (self.rng.random(adet) >= sifir_olasiligi(tip, theta)).astype(np.uint8)
+
+    def olc_toplu(self, istekler):
+        if any(isinstance(theta, KonumDagilimi) for _, theta in istekler):
+            return super().olc_toplu(istekler)
+        p0 = np.array([sifir_olasiligi(tip, theta) for tip, theta in istekler])
+        return (self.rng.random(len(p0)) >= p0).astype(np.uint8)
+
+
+class AerArkaUc(CokmeArkaUcu):
+    ad = "aer"
+
+    def __init__(self, seed=None):
+        self._simulator = None
+        self._kilit = threading.Lock()
+        # Sabit seed_simulator her koşuda aynı sonucu verir; tohumu her koşu için RNG'den çekiyoruz
+        self.rng = np.random.default_rng(seed) if seed is not None else None
+
+    @property
+    def simulator(self):
+        # İlk kullanımda (ya da isit() iş parçacığında) kurulur; kilit çift kurulumu önler
+        if self._simulator is None:
+            with self._kilit:
+                if self._simulator is None:
+                    qiskit_yukle()
+                    from qiskit_aer import AerSimulator
+                    self._simulator = AerSimulator()
+        return self._simulator
+
+    def isit(self):
+        self._calistir(cokme_devresi('hayalet'), 1)
+
+    def _calistir(self, qc, shots):
+        secenekler = {'shots': shots, 'memory': True}
+        if self.rng is not None:
+            secenekler['seed_simulator'] = int(self.rng.integers(2 ** 31))
+        return self.simulator.run(qc, **secenekler).result()
+
+    def olc(self, tip, theta=None):
+        result = self._calistir(cokme_devresi(tip, theta), 1)
+        coken_durum = list(result.get_counts().keys())[0]
+        return int(coken_durum, 2)
+
+    def olc_coklu(self, tip, theta, adet):
+        result = self._calistir(cokme_devresi(tip, theta), adet)
+        return np.array([int(b, 2) for b in result.get_memory()], dtype=np.uint8)
+
+    # Tek bir çok-devreli Aer koşusu; her devre bir kez ölçülür
+    def olc_toplu(self, istekler):
+        result = self._calistir([cokme_devresi(tip, theta) for tip, theta in istekler], 1)
+        return np.array([int(result.get_memory(i)[0], 2) for i in range(len(istekler))], dtype=np.uint8)
+
+
+class IbmArkaUc(CokmeArkaUcu):
+    ad = "ibm"
+
+    def __init__(self, backend, onbellek=None):
+        self.onbellek = onbellek or DEVRE_ONBELLEGI
+        self.backend = backend
+        self.aktif_is = None
+        self._yerel = threading.local()
+
+    def isit(self):
+        self.onbellek.isit(self.backend)
+
+    def iptal(self):
+        job = self.aktif_is
+        if job is not None:
+            try:
+                job.cancel()
+            except Exception:
+                pass
+
+    # Runtime işinin zaman damgalarından kuyrukta bekleme ve QPU'da çalışma süreleri ayrılır;
+    # damgalar okunamazsa yalnızca gönderimden sonuca kadar geçen toplam süre verilir
+    @staticmethod
+    def _zamanlama(job, toplam):
+        zamanlama = {'toplam_sn': round(toplam, 3)}
+        try:
+            from datetime import datetime
+            damgalar = job.metrics()['timestamps']
+            olustu, basladi, bitti = (datetime.fromisoformat(damgalar[k].replace('Z', '+00:00'))
+                                      for k in ('created', 'running', 'finished'))
+            zamanlama['kuyruk_sn'] = round((basladi - olustu).total_seconds(), 3)
+            zamanlama['calisma_sn'] = round((bitti - basladi).total_seconds(), 3)
+        except Exception:
+            pass
+        return zamanlama
+
+    def _calistir(self, tip, theta, shots):
+        return self._gonder(self.onbellek.bagla(self.backend, tip, theta), shots)
+
+    def _gonder(self, transpiled_qc, shots):
+        gonderim = time.perf_counter()
+        job = self.backend.run(transpiled_qc, shots=shots, memory=shots > 1)
+        self.aktif_is = job
+        self._yerel.is_no = job.job_id()
+        try:
+            sonuc = job.result()
+            self._yerel.zamanlama = self._zamanlama(job, time.perf_counter() - gonderim)
+            return sonuc
+        finally:
+            self.aktif_is = None
+
+    def olc(self, tip, theta=None):
+        result = self._calistir(tip, theta, 1)
+        coken_durum = list(result.get_counts().keys())[0]
+        return int(coken_durum, 2)
+
+    def olc_coklu(self, tip, theta, adet):
+        result = self._calistir(tip, theta, adet)
+        return np.array([int(b, 2) for b in result.get_memory()], dtype=np.uint8)
+
+    # Tek bir çok kübitli QPU işi; parti backend'in kübit sayısını aşarsa birkaç işe bölünür.
+    # Qiskit bit dizgisinde 0. klasik bit en sağdadır. Çok konumlu gemiler kendi devreleriyle ayrı ölçülür.
+    def olc_toplu(self, istekler):
+        bitler = np.zeros(len(istekler), dtype=np.uint8)
+        coklu = [isinstance(theta, KonumDagilimi) for _, theta in istekler]
+        tekli = [i for i, c in enumerate(coklu) if not c]
+        for i in np.flatnonzero(coklu):
+            bitler[i] = self.olc(*istekler[i])
+        kapasite = getattr(self.backend, 'num_qubits', None) or len(tekli)
+        for bas in range(0, len(tekli), kapasite):
+            parca = tekli[bas:bas + kapasite]
+            qc = self.onbellek.toplu_bagla(self.backend, [toplu_aci(*istekler[i]) for i in parca])
+            dizgi = next(iter(self._gonder(qc, 1).get_counts())).replace(" ", "")
+            bitler[parca] = [int(b) for b in dizgi[::-1][:len(parca)]]
+        return bitler
+
+
+# --- KUANTUM RASTGELELİK HAVUZU ---
+# Her (tip, θ) için kaynak arka uçta tek bir çok-atışlı iş koşturulur ve sonuçlar bir tampondan
+# birer birer verilir. Tampon alt sınıra indiğinde arka planda yeniden doldurulur.
+# Her bit tampondan çıkarılarak verilir; hiçbir ölçüm sonucu ikinci kez kullanılmaz.
+# Tamponun yanında her partinin iş kimliği, zamanlaması ve kalan bit sayısı tutulur; son_is_no ve
+# son_zamanlama verilen bitin işini gösterir. Zamanlamada kaynağın kuyruk/çalışma sürelerine (varsa) dolumun
+# toplam süresi (yenileme_sn) ve parti boyutu eklenir; profilci havuzdan gelen çökmeleri de böyle ayırır.
+class KuantumHavuzu(CokmeArkaUcu):
+    ad = "havuz"
+
+    def __init__(self, kaynak="aer", parti_boyutu=1024, alt_sinir=None):
+        self.kaynak = arka_uc_olustur(kaynak)
+        self.parti_boyutu = parti_boyutu
+        self.alt_sinir = parti_boyutu // 4 if alt_sinir is None else alt_sinir
+        self._tamponlar = {}
+        self._partiler = {}
+        self._yerel = threading.local()
+        self._dolduruluyor = set()
+        self._hatalar = {}
+        self._kosul = threading.Condition()
+        self.isabet = 0
+        self.iska = 0
+        self.yenileme = 0
+        self.yenileme_suresi_toplam = 0.0
+        self.son_yenileme_suresi = 0.0
+        self.en_uzun_yenileme_suresi = 0.0
+
+    @staticmethod
+    def _anahtar(tip, theta):
+        if theta is None or isinstance(theta, KonumDagilimi):
+            return tip, theta
+        return tip, round(float(theta), 12)
+
+    def _doldur(self, anahtar):
+        if anahtar in self._dolduruluyor:
+            return
+        self._dolduruluyor.add(anahtar)
+        threading.Thread(target=self._doldur_is, args=(anahtar,), name="kuantum-havuz", daemon=True).start()
+
+    def _doldur_is(self, anahtar):
+        tip, theta = anahtar
+        baslangic = time.perf_counter()
+        try:
+            bitler, hata = self.kaynak.olc_coklu(tip, theta, self.parti_boyutu), None
+            is_no, zamanlama = self.kaynak.son_is_no, self.kaynak.son_zamanlama
+        except Exception as e:
+            bitler, hata = None, e
+        sure = time.perf_counter() - baslangic
+        if hata is None:
+            zamanlama = {**(zamanlama or {}), 'yenileme_sn': round(sure, 3), 'parti': len(bitler)}
+        with self._kosul:
+            self._dolduruluyor.discard(anahtar)
+            if hata is None:
+                self._tamponlar.setdefault(anahtar, deque()).extend(bitler.tolist())
+                self._partiler.setdefault(anahtar, deque()).append([is_no, zamanlama, len(bitler)])
+                self.yenileme += 1
+                self.yenileme_suresi_toplam += sure
+                self.son_yenileme_suresi = sure
+                self.en_uzun_yenileme_suresi = max(self.en_uzun_yenileme_suresi, sure)
+            else:
+                self._hatalar[anahtar] = hata
+            self._kosul.notify_all()
+
+    def isit(self):
+        self.kaynak.isit()
+
+    def iptal(self):
+        self.kaynak.iptal()
+
+    def on_yukle(self, tip, theta=None):
+        anahtar = self._anahtar(tip, theta)
+        with self._kosul:
+            if len(self._tamponlar.get(anahtar, ())) <= self.alt_sinir:
+                self._doldur(anahtar)
+
+    def olc(self, tip, theta=None):
+        anahtar = self._anahtar(tip, theta)
+        with self._kosul:
+            tampon = self._tamponlar.setdefault(anahtar, deque())
+            if tampon:
+                self.isabet += 1
+            else:
+                # Tampon boş: bekleyen dolumu (yoksa yenisini) bekle
+                self.iska += 1
+                self._hatalar.pop(anahtar, None)
+                self._doldur(anahtar)
+                while not tampon:
+                    if anahtar in self._hatalar:
+                        raise self._hatalar.pop(anahtar)
+                    self._kosul.wait()
+            bit = tampon.popleft()
+            parti = self._partiler[anahtar][0]
+            self._yerel.is_no, self._yerel.zamanlama = parti[0], parti[1]
+            parti[2] -= 1
+            if not parti[2]:
+                self._partiler[anahtar].popleft()
+            if len(tampon) <= self.alt_sinir:
+                self._doldur(anahtar)
+            return bit
+
+    def istatistikler(self):
+        with self._kosul:
+            return {
+                'isabet': self.isabet,
+                'iska': self.iska,
+                'yenileme': self.yenileme,
+                'ortalama_yenileme_suresi': self.yenileme_suresi_toplam / self.yenileme if self.yenileme else 0.0,
+                'son_yenileme_suresi': self.son_yenileme_suresi,
+                'en_uzun_yenileme_suresi': self.en_uzun_yenileme_suresi,
+                'tamponda': sum(len(t) for t in self._tamponlar.values()),
+            }
+
+
+def arka_uc_olustur(ad, **secenekler):
+    if isinstance(ad, CokmeArkaUcu):
+        return ad
+    if ad == "analitik":
+        return AnalitikArkaUc(**secenekler)
+    if ad == "aer":
+        return AerArkaUc(**secenekler)
+    if ad == "ibm":
+        return IbmArkaUc(**secenekler)
+    if ad == "havuz":
+        return KuantumHavuzu(**secenekler)
+    raise ValueError(f"Bilinmeyen çökme arka ucu: {ad}")
+
+
+# --- İSTATİSTİKSEL EŞDEĞERLİK TESTİ ---
+# İki arka ucun aynı devre için ürettiği 0/1 sayıları 2x2 ki-kare homojenlik testiyle karşılaştırılır.
+# Serbestlik derecesi 1 olduğundan p-değeri erfc(sqrt(χ²/2)) ile kapalı biçimde hesaplanır.
+# Betik ve tests/test_cokme_arka_uclari.py aynı durumları dener: hayalet ve dört ağırlıkta hileli.
+ESDEGERLIK_DURUMLARI = [('hayalet', None)] + [('hileli', 2 * np.arccos(np.sqrt(w))) for w in (0.1, 0.5, 0.75, 0.9)]
+
+
+def esdegerlik_testi(arka_uc_a, arka_uc_b, tip, theta=None, adet=20000):
+    a = arka_uc_a.olc_coklu(tip, theta, adet)
+    b = arka_uc_b.olc_coklu(tip, theta, adet)
+    gozlenen = np.array([[adet - a.sum(), a.sum()], [adet - b.sum(), b.sum()]], dtype=float)
+    beklenen = gozlenen.sum(axis=1, keepdims=True) * gozlenen.sum(axis=0, keepdims=True) / gozlenen.sum()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        terimler = np.where(beklenen > 0, (gozlenen - beklenen) ** 2 / beklenen, 0.0)
+    ki_kare = float(terimler.sum())
+    return ki_kare, math.erfc(math.sqrt(ki_kare / 2))
+
+
+if __name__ == "__main__":
+    analitik, aer = AnalitikArkaUc(seed=1), AerArkaUc(seed=2)
+    basarisiz = 0
+    for tip, theta in ESDEGERLIK_DURUMLARI:
+        ki_kare, p = esdegerlik_testi(analitik, aer, tip, theta)
+        durum = "GEÇTİ" if p > 0.001 else "KALDI"
+        basarisiz += p <= 0.001
+        print(f"{tip:8s} θ={theta if theta is None else round(theta, 4)!s:8s} χ²={ki_kare:7.3f}  p={p:.4f}  {durum}")
+    raise SystemExit(1 if basarisiz else 0)
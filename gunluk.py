@@ -0,0 +1,277 @@
+import os
+
+import numpy as np
+
+from kompakt_motor import GemiTipi, TIP_ADLARI
+from oyun_motoru import BekleyenCozum, OyunOturumu
+
+
+# --- OYUN GÜNLÜĞÜ ---
+# Her oyun sabit genişlikli (64 bayt) kayıtlar olarak tek bir ikili dosyanın sonuna eklenir:
+# oyun başlangıcı (tohum, tahta boyutu, tur sınırı), her yerleştirme, her hedef seçimi, her atışın
+# sonucu (çöken bit, biti üreten arka uç ve iş kimliği) ve oyun sonu. İkiden fazla konumlu gemilerin
+# yerleştirme kaydını (kod = konum sayısı) her konum ve olasılığı için birer KONUM kaydı izler. Dosyanın başında sürüm ve kayıt
+# boyutunu taşıyan 16 baytlık bir başlık vardır. Okuyucu dosyayı belleğe eşler; milyonlarca kaydın
+# sütunları kopyalanmadan NumPy dizisi olarak taranır.
+SIHIR = b"QCABGK"
+SURUM = 1
+
+BASLIK_DTYPE = np.dtype([
+    ('sihir', 'S6'),
+    ('surum', '<u2'),
+    ('kayit_boyutu', '<u2'),
+    ('rezerv', 'S6'),
+])
+
+KAYIT_DTYPE = np.dtype([
+    ('oyun', '<u4'),
+    ('tur', '<u2'),
+    ('olay', 'u1'),
+    ('kod', 'u1'),        # sonuç / kazanan / hedefleme stratejisi
+    ('gemi', 'u1'),       # GemiTipi
+    ('bit', 'u1'),        # çöken kübit (çok konumlu gemide konum sırası); klasik gemide ve karavanada BIT_YOK
+    ('arka_uc', 'u1'),    # ARKA_UC_KODLARI; havuzdan gelen bitlerde HAVUZ_BAYRAGI da set edilir
+    ('_bos', 'u1'),
+    ('x', '<u2', (2,)),
+    ('y', '<u2', (2,)),
+    ('deger', '<f8'),     # |0> (ilk konum) olasılığı (agirlik; hayalet için 0.5)
+    ('tohum', '<u8'),
+    ('is_no', 'S28'),
+])
+
+OYUN_BASLADI, YERLESTIRME, HEDEF, ATIS, OYUN_BITTI, KONUM = range(6)
+
+SONUC_KODLARI = {'karavana': 0, 'batti_klasik': 1, 'batti_kuantum': 2, 'kurtuldu_kuantum': 3}
+KAZANAN_KODLARI = {None: 0, 'sistem': 1, 'oyuncu': 2}
+HEDEFLEME_KODLARI = {'rastgele': 0, 'isi_haritasi': 1}
+ARKA_UC_KODLARI = {'harici': 0, 'analitik': 1, 'aer': 2, 'ibm': 3}
+TIP_KODLARI = {ad: kod for kod, ad in TIP_ADLARI.items()}
+HAVUZ_BAYRAGI = 0x80
+BIT_YOK = 255
+
+SONUC_ADLARI = {kod: ad for ad, kod in SONUC_KODLARI.items()}
+KAZANAN_ADLARI = {kod: ad for ad, kod in KAZANAN_KODLARI.items()}
+HEDEFLEME_ADLARI = {kod: ad for ad, kod in HEDEFLEME_KODLARI.items()}
+
+
+def kaynak_kodu(arka_uc):
+    if arka_uc is None:
+        return ARKA_UC_KODLARI['harici']
+    # Havuz bitleri kaynak arka ucun çok-atışlı işinden gelir
+    ic = getattr(arka_uc, 'kaynak', None)
+    if ic is not None:
+        return kaynak_kodu(ic) | HAVUZ_BAYRAGI
+    return ARKA_UC_KODLARI.get(arka_uc.ad, ARKA_UC_KODLARI['harici'])
+
+
+def _basligi_oku(yol):
+    baslik = np.fromfile(yol, dtype=BASLIK_DTYPE, count=1)
+    if len(baslik) == 0 or baslik['sihir'][0] != SIHIR:
+        raise ValueError(f"{yol} bir oyun günlüğü değil")
+    if baslik['surum'][0] != SURUM or baslik['kayit_boyutu'][0] != KAYIT_DTYPE.itemsize:
+        raise ValueError(f"{yol}: desteklenmeyen günlük sürümü {baslik['surum'][0]} "
+                         f"(kayıt {baslik['kayit_boyutu'][0]} bayt)")
+
+
+# --- YAZICI ---
+# Kayıtlar demet listesi olarak biriktirilir (yapılandırılmış diziye satır satır atamaktan hızlı); liste
+# dolunca, her oyunun sonunda ve kapat()'ta tek seferde diziye çevrilip dosyaya eklenir
+class GunlukYazici:
+    def __init__(self, yol, tampon=4096):
+        self.yol = yol
+        if os.path.exists(yol) and os.path.getsize(yol) > 0:
+            _basligi_oku(yol)
+            kayit_sayisi = (os.path.getsize(yol) - BASLIK_DTYPE.itemsize) // KAYIT_DTYPE.itemsize
+            self._sonraki_oyun = 0
+            if kayit_sayisi:
+                son = np.memmap(yol, dtype=KAYIT_DTYPE, mode='r', offset=BASLIK_DTYPE.itemsize)[-1]
+                self._sonraki_oyun = int(son['oyun']) + 1
+            self._dosya = open(yol, "ab")
+        else:
+            self._dosya = open(yol, "wb")
+            baslik = np.zeros(1, dtype=BASLIK_DTYPE)
+            baslik['sihir'], baslik['surum'], baslik['kayit_boyutu'] = SIHIR, SURUM, KAYIT_DTYPE.itemsize
+            self._dosya.write(baslik.tobytes())
+            self._sonraki_oyun = 0
+        self._tampon = []
+        self._tampon_boyutu = tampon
+        self.oyun_no = None
+
+    def _ekle(self, olay, tur=0, kod=0, gemi=0, bit=BIT_YOK, arka_uc=0, x=(0, 0), y=(0, 0), deger=0.0,
+              tohum=0, is_no=b""):
+        self._tampon.append((self.oyun_no, tur, olay, kod, gemi, bit, arka_uc, 0, x, y, deger, tohum, is_no))
+        if len(self._tampon) >= self._tampon_boyutu:
+            self.bosalt()
+
+    def bosalt(self):
+        if self._tampon:
+            self._dosya.write(np.array(self._tampon, dtype=KAYIT_DTYPE).tobytes())
+            self._dosya.flush()
+            self._tampon.clear()
+
+    def kapat(self):
+        if self._dosya is not None:
+            self.bosalt()
+            self._dosya.close()
+            self._dosya = None
+
+    # --- OLAYLAR ---
+    def oyun_basla(self, tohum, board_size, max_tur, hedefleme):
+        self.oyun_no = self._sonraki_oyun
+        self._sonraki_oyun += 1
+        self._ekle(OYUN_BASLADI, tur=max_tur, kod=HEDEFLEME_KODLARI[hedefleme], x=(board_size, 0), tohum=tohum)
+
+    # olasiliklar: çok konumlu gemide konum başına çökme olasılıkları
+    def yerlestirme(self, tip, koordinatlar, deger, olasiliklar=None):
+        (x1, y1), (x2, y2) = koordinatlar[0], koordinatlar[-1]
+        coklu = len(koordinatlar) > 2
+        self._ekle(YERLESTIRME, kod=len(koordinatlar) if coklu else 0, gemi=TIP_KODLARI[tip], x=(x1, x2),
+                   y=(y1, y2), deger=deger)
+        if coklu:
+            for (x, y), p in zip(koordinatlar, olasiliklar):
+                self._ekle(KONUM, x=(x, 0), y=(y, 0), deger=p)
+
+    def hedef(self, hedef, tur):
+        self._ekle(HEDEF, tur=tur, x=(hedef[0], 0), y=(hedef[1], 0))
+
+    # tip / deger: atıştan önceki gemi tipi ve |0> olasılığı; kaynak: (arka uç, iş kimliği)
+    def atis(self, hedef, tur, sonuc, tip=None, deger=0.0, bit=None, kaynak=None):
+        arka_uc, is_no = kaynak or (None, None)
+        self._ekle(ATIS, tur=tur, kod=SONUC_KODLARI[sonuc], gemi=TIP_KODLARI.get(tip, 0),
+                   bit=BIT_YOK if bit is None else bit, arka_uc=kaynak_kodu(arka_uc),
+                   x=(hedef[0], 0), y=(hedef[1], 0), deger=deger, is_no=(is_no or "").encode()[:28])
+
+    def oyun_bitti(self, kazanan, tur):
+        self._ekle(OYUN_BITTI, tur=tur, kod=KAZANAN_KODLARI[kazanan])
+        self.bosalt()
+
+
+# --- OKUYUCU ---
+class GunlukOkuyucu:
+    def __init__(self, yol):
+        _basligi_oku(yol)
+        self.yol = yol
+        if os.path.getsize(yol) > BASLIK_DTYPE.itemsize:
+            self.kayitlar = np.memmap(yol, dtype=KAYIT_DTYPE, mode='r', offset=BASLIK_DTYPE.itemsize)
+        else:
+            self.kayitlar = np.zeros(0, dtype=KAYIT_DTYPE)
+
+    def __len__(self):
+        return len(self.kayitlar)
+
+    @property
+    def oyun_sayisi(self):
+        return int(np.count_nonzero(self.kayitlar['olay'] == OYUN_BASLADI))
+
+    # Kayıtlar oyun numarasına göre sıralı eklendiğinden bir oyunun dilimi ikili aramayla bulunur
+    def oyun(self, no):
+        oyunlar = self.kayitlar['oyun']
+        bas, son = np.searchsorted(oyunlar, no, 'left'), np.searchsorted(oyunlar, no, 'right')
+        if bas == son:
+            raise KeyError(f"Günlükte {no} numaralı oyun yok")
+        return self.kayitlar[bas:son]
+
+    # --- ANALİZ ---
+    def istatistikler(self):
+        olay = self.kayitlar['olay']
+        bitenler = olay == OYUN_BITTI
+        kazanan = self.kayitlar['kod'][bitenler]
+        turlar = self.kayitlar['tur'][bitenler]
+        sonuc = {
+            'oyun_sayisi': self.oyun_sayisi,
+            'biten_oyun': int(bitenler.sum()),
+            'sistem_kazanma_orani': float(np.mean(kazanan == KAZANAN_KODLARI['sistem'])) if len(kazanan) else 0.0,
+            'ortalama_tur': float(turlar.mean()) if len(turlar) else 0.0,
+        }
+        atislar = olay == ATIS
+        kodlar = self.kayitlar['kod'][atislar]
+        sonuc['sonuclar'] = {ad: int(np.count_nonzero(kodlar == kod)) for ad, kod in SONUC_KODLARI.items()}
+
+        # Çökmeler (gemi tipi, |0> olasılığı, arka uç) gruplarına ayrılır; gözlenen |0> oranı beklenenle yan yana
+        bitler = self.kayitlar['bit'][atislar]
+        kuantum = bitler != BIT_YOK
+        bitler = bitler[kuantum]
+        gruplar = np.stack([self.kayitlar['gemi'][atislar][kuantum].astype(np.float64),
+                            self.kayitlar['deger'][atislar][kuantum],
+                            self.kayitlar['arka_uc'][atislar][kuantum].astype(np.float64)], axis=1)
+        cokmeler = []
+        if len(gruplar):
+            anahtarlar, ters = np.unique(gruplar, axis=0, return_inverse=True)
+            adet = np.bincount(ters.ravel(), minlength=len(anahtarlar))
+            sifir = np.bincount(ters.ravel(), weights=(bitler == 0), minlength=len(anahtarlar))
+            for (gemi, p0, arka_uc), n, s in zip(anahtarlar, adet, sifir):
+                cokmeler.append({'tip': TIP_ADLARI[GemiTipi(int(gemi))], 'beklenen_sifir': float(p0),
+                                 'arka_uc': int(arka_uc), 'adet': int(n), 'gozlenen_sifir': float(s / n)})
+        sonuc['cokmeler'] = cokmeler
+        return sonuc
+
+
+# --- TEKRAR ---
+# Kaydedilmiş bir oyunu aynı yerleştirmeler, aynı hedefler ve aynı çöken bitlerle yeniden oynatır;
+# hiçbir arka uç çalıştırılmaz. Arayüz hedef_sec / cozumle_baslat çağrılarını oturum yerine buraya yapar.
+class TekrarOynatici:
+    def __init__(self, okuyucu, oyun_no=0):
+        kayitlar = np.array(okuyucu.oyun(oyun_no))
+        bas = kayitlar[0]
+        if bas['olay'] != OYUN_BASLADI:
+            raise ValueError(f"{oyun_no} numaralı oyunun başlangıç kaydı eksik")
+        self.oyun_no = oyun_no
+        self.tohum = int(bas['tohum'])
+        self.board_size = int(bas['x'][0])
+        self.max_tur = int(bas['tur'])
+        self.hedefleme = HEDEFLEME_ADLARI[int(bas['kod'])]
+        self.yerlestirmeler = kayitlar[(kayitlar['olay'] == YERLESTIRME) | (kayitlar['olay'] == KONUM)]
+        self.atislar = kayitlar[kayitlar['olay'] == ATIS]
+        bitis = kayitlar[kayitlar['olay'] == OYUN_BITTI]
+        self.kazanan = KAZANAN_ADLARI[int(bitis['kod'][0])] if len(bitis) else None
+        self.oturum = None
+        self._sira = 0
+
+    def oturum_kur(self):
+        self.oturum = OyunOturumu(self.board_size, max_tur=self.max_tur, tohum=self.tohum, hedefleme=self.hedefleme)
+        oyun = self.oturum.oyun
+        for i, kayit in enumerate(self.yerlestirmeler):
+            if kayit['olay'] == KONUM:
+                continue
+            tip = TIP_ADLARI[GemiTipi(int(kayit['gemi']))]
+            k1, k2 = (int(kayit['x'][0]), int(kayit['y'][0])), (int(kayit['x'][1]), int(kayit['y'][1]))
+            if kayit['kod']:
+                # Konumlar ve olasılıklar izleyen KONUM kayıtlarından; genlik olarak √p verilir
+                konumlar = self.yerlestirmeler[i + 1:i + 1 + int(kayit['kod'])]
+                koordinatlar = list(zip(konumlar['x'][:, 0].tolist(), konumlar['y'][:, 0].tolist()))
+                oyun.gemi_yerlestir_coklu(koordinatlar, None if tip == 'hayalet' else np.sqrt(konumlar['deger']))
+            elif tip == 'klasik':
+                oyun.gemi_yerlestir_klasik(*k1)
+            elif tip == 'hayalet':
+                oyun.gemi_yerlestir_hayalet(k1, k2)
+            else:
+                oyun.gemi_yerlestir_hileli(k1, k2, float(kayit['deger']))
+        self.oturum.envanter = {tip: 0 for tip in self.oturum.envanter}
+        self.oturum.savasi_baslat()
+        self._sira = 0
+        return self.oturum
+
+    def hedef_sec(self):
+        if self.oturum.faz != "SAVUNMA" or self._sira >= len(self.atislar):
+            return None
+        kayit = self.atislar[self._sira]
+        return self.oturum.oyun._hedefi_isaretle((int(kayit['x'][0]), int(kayit['y'][0])))
+
+    def _kayitli_bit(self):
+        bit = int(self.atislar[self._sira]['bit'])
+        self._sira += 1
+        return None if bit == BIT_YOK else bit
+
+    def cozumle_baslat(self, hedef):
+        return BekleyenCozum(self.oturum, hedef, coken_durum=self._kayitli_bit())
+
+    # Arayüzsüz tekrar; her atışın sonucu kayıttakiyle karşılaştırılır
+    def dogrula(self):
+        if self.oturum is None:
+            self.oturum_kur()
+        for kayit in self.atislar:
+            hedef = self.hedef_sec()
+            olay = self.oturum.cozumle(hedef, self._kayitli_bit())
+            if SONUC_KODLARI[olay.sonuc] != kayit['kod']:
+                return False
+        return self.oturum.kazanan == self.kazanan
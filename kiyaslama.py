@@ -0,0 +1,264 @@
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from cokme_arka_uclari import arka_uc_olustur, AnalitikArkaUc
+from kompakt_motor import KompaktGameManager
+from oyun_motoru import GameManager, OyunOturumu
+from toplu_motor import TopluOyunlar
+
+
+# --- ÖLÇÜM ÖZETİ ---
+# Her ölçüm çağrı başına süre listesinden yüzdelik dilimlere ve saniyedeki işlem sayısına indirgenir
+def ozetle(sureler):
+    dizi = np.asarray(sureler, dtype=np.float64) * 1e6
+    return {
+        'n': int(dizi.size),
+        'ortalama_us': float(dizi.mean()),
+        'p50_us': float(np.percentile(dizi, 50)),
+        'p90_us': float(np.percentile(dizi, 90)),
+        'p99_us': float(np.percentile(dizi, 99)),
+        'max_us': float(dizi.max()),
+        'islem_per_sn': float(1e6 / dizi.mean()) if dizi.mean() > 0 else float('inf'),
+    }
+
+
+# --- FİLO KURULUMU ---
+def rastgele_filo(oyun, gemi_sayisi, rng):
+    boyut = oyun.board_size
+    kare = lambda: (rng.randrange(boyut), rng.randrange(boyut))
+    for i in range(gemi_sayisi):
+        secim = i % 6
+        if secim < 3:
+            oyun.gemi_yerlestir_klasik(*kare())
+        elif secim < 5:
+            oyun.gemi_yerlestir_hayalet(kare(), kare())
+        else:
+            oyun.gemi_yerlestir_hileli(kare(), kare(), rng.uniform(0.05, 0.95))
+
+
+# --- MOTOR: HEDEF SEÇİMİ VE ATIŞ ÇÖZÜMLEME ---
+# Hedef seçimi ve atış çözümleme ayrı ayrı ölçülür; board_size büyürken atış başına süre sabit kalmalıdır.
+def motor_kiyasla(boyutlar=(8, 32, 128, 512), gemi_sayisi=3000, atis_sayisi=2000, seed=0):
+    sonuclar = {}
+    for board_size in boyutlar:
+        for hedefleme in ("rastgele", "isi_haritasi"):
+            rng = random.Random(seed)
+            oyun = GameManager(board_size, rng=rng, arka_uc=AnalitikArkaUc(seed), hedefleme=hedefleme)
+            rastgele_filo(oyun, gemi_sayisi, rng)
+            hedef_sureleri, cozum_sureleri = [], []
+            for _ in range(min(atis_sayisi, board_size * board_size)):
+                t0 = time.perf_counter()
+                hedef = oyun.qc_hedef_belirle()
+                t1 = time.perf_counter()
+                oyun.atis_cozumle(hedef)
+                t2 = time.perf_counter()
+                hedef_sureleri.append(t1 - t0)
+                cozum_sureleri.append(t2 - t1)
+            sonuclar[f"motor.qc_hedef_belirle.{hedefleme}.{board_size}"] = ozetle(hedef_sureleri)
+            if hedefleme == "rastgele":
+                sonuclar[f"motor.atis_cozumle.{board_size}"] = ozetle(cozum_sureleri)
+    return sonuclar
+
+
+# --- ÇÖKME ARKA UÇLARI ---
+# Her çağrıda taze bir hayalet gemi çökertilir; Aer yavaş olduğundan daha az örnek alınır
+def cokme_kiyasla(arka_uclar=("analitik", "havuz", "aer"), seed=0):
+    sonuclar = {}
+    for ad in arka_uclar:
+        adet = 300 if ad == "aer" else 3000
+        if ad == "havuz":
+            arka_uc = arka_uc_olustur("havuz", kaynak=AnalitikArkaUc(seed))
+        elif ad == "analitik":
+            arka_uc = arka_uc_olustur("analitik", seed=seed)
+        else:
+            arka_uc = arka_uc_olustur(ad)
+        arka_uc.isit()
+        rng = random.Random(seed)
+        oyun = GameManager(64, rng=rng, arka_uc=arka_uc)
+        for _ in range(adet):
+            oyun.gemi_yerlestir_hayalet((rng.randrange(64), rng.randrange(64)), (rng.randrange(64), rng.randrange(64)))
+        if ad == "havuz":
+            time.sleep(0.05)  # ilk ön yükleme tamamlansın; kararlı durum ölçülür
+        sureler = []
+        for isim, veri in list(oyun.ships.items()):
+            t0 = time.perf_counter()
+            oyun._kuantum_cokme_hesapla(isim, veri, veri['koordinatlar'][0])
+            sureler.append(time.perf_counter() - t0)
+        sonuclar[f"cokme.{ad}"] = ozetle(sureler)
+    return sonuclar
+
+
+# --- BAŞSIZ OYUN HIZI ---
+def oyun_kiyasla(oyun_sayisi=500, stratejiler=("rastgele", "isi_haritasi")):
+    sonuclar = {}
+    for strateji in stratejiler:
+        sistem_kazandi = toplam_tur = 0
+        sureler = []
+        for i in range(oyun_sayisi):
+            t0 = time.perf_counter()
+            oturum = OyunOturumu(rng=random.Random(i), hedefleme=strateji)
+            oturum.play_to_end()
+            sureler.append(time.perf_counter() - t0)
+            sistem_kazandi += oturum.kazanan == "sistem"
+            toplam_tur += oturum.tur
+        ozet = ozetle(sureler)
+        sonuclar[f"oyun.{strateji}"] = {
+            'p50_us': ozet['p50_us'],
+            'p99_us': ozet['p99_us'],
+            'oyun_per_sn': oyun_sayisi / sum(sureler),
+            'sistem_kazanma_orani': sistem_kazandi / oyun_sayisi,
+            'ortalama_tur': toplam_tur / oyun_sayisi,
+        }
+    return sonuclar
+
+
+# --- TOPLU MOTOR HIZI ---
+# Aynı oyunlar kilit adımlı toplu motorda; oranlar oyun.* satırlarıyla karşılaştırılabilir
+def toplu_kiyasla(oyun_sayisi=200000, stratejiler=("rastgele", "isi_haritasi")):
+    sonuclar = {}
+    for strateji in stratejiler:
+        t0 = time.perf_counter()
+        toplu = TopluOyunlar(oyun_sayisi, hedefleme=strateji, tohum=0)
+        toplu.rastgele_yerlestir()
+        toplu.oynat()
+        sure = time.perf_counter() - t0
+        ozet = toplu.ozet()
+        sonuclar[f"toplu.{strateji}"] = {
+            'oyun_per_sn': oyun_sayisi / sure,
+            'sistem_kazanma_orani': ozet['sistem_kazanma_orani'],
+            'ortalama_tur': ozet['ortalama_tur'],
+        }
+    return sonuclar
+
+
+# --- PYGAME KARE SÜRESİ ---
+# Arayüz SDL'nin görüntüsüz sürücüsüyle demo modunda çalıştırılır; kare başına iş süresi (60 FPS beklemesi hariç)
+def kare_kiyasla(kare_sayisi=1500, isinma=30):
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import amiralbatti
+    random.seed(0)
+    sureler = amiralbatti.oyunu_baslat(demo=True, kare_limiti=kare_sayisi + isinma)
+    return {"kare.demo": ozetle(sureler[isinma:])}
+
+
+# --- İLK KAREYE KADAR GEÇEN SÜRE ---
+# Oyun, SDL'nin görüntüsüz sürücüsüyle ayrı bir süreçte başlatılır ve ilk kareyi bastığı an çıkar;
+# süreç başlangıcından çıkışa kadar geçen duvar saati süresi ölçülür.
+def baslangic_kiyasla(tekrar=5):
+    ortam = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy")
+    betik = os.path.join(os.path.dirname(os.path.abspath(__file__)), "amiralbatti.py")
+    sureler = []
+    for _ in range(tekrar):
+        baslangic = time.perf_counter()
+        subprocess.run([sys.executable, betik, "--kare-limiti", "1"], env=ortam, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        sureler.append(time.perf_counter() - baslangic)
+    return {"baslangic.ilk_kare": {'tekrar': tekrar, 'medyan_ms': statistics.median(sureler) * 1e3,
+                                   'en_iyi_ms': min(sureler) * 1e3}}
+
+
+# --- OYUN BAŞINA BELLEK ---
+# Filo yerleştirilip atışlar yapıldıktan sonra bir oyun örneğinin tuttuğu bellek ölçülür
+def oyun_bellegi(sinif, board_size, gemi_sayisi=3000, atis_sayisi=30, seed=0):
+    rng = random.Random(seed)
+    arka_uc = AnalitikArkaUc(seed)
+    tracemalloc.start()
+    once = tracemalloc.take_snapshot()
+    oyun = sinif(board_size, rng=rng, arka_uc=arka_uc)
+    rastgele_filo(oyun, gemi_sayisi, rng)
+    for _ in range(min(atis_sayisi, board_size * board_size)):
+        oyun.atis_cozumle(oyun.qc_hedef_belirle())
+    sonra = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    return sum(f.size_diff for f in sonra.compare_to(once, 'filename')) / 1024
+
+
+def bellek_kiyasla(boyutlar=(8, 512), gemi_sayisi=3000):
+    return {f"bellek.{sinif.__name__}.{boyut}": {'kb': oyun_bellegi(sinif, boyut, gemi_sayisi)}
+            for boyut in boyutlar for sinif in (GameManager, KompaktGameManager)}
+
+
+BOLUMLER = {
+    'motor': motor_kiyasla,
+    'cokme': cokme_kiyasla,
+    'oyun': oyun_kiyasla,
+    'toplu': toplu_kiyasla,
+    'kare': kare_kiyasla,
+    'baslangic': baslangic_kiyasla,
+    'bellek': bellek_kiyasla,
+}
+
+
+# --- KOŞULAR ARASI KARŞILAŞTIRMA ---
+# Gecikme ve bellek metriklerinde artış, verim metriklerinde düşüş eşiği aşarsa gerileme sayılır
+KUCUK_IYI = ('p50_us', 'medyan_ms', 'kb')
+BUYUK_IYI = ('islem_per_sn', 'oyun_per_sn')
+
+
+def karsilastir(onceki, simdiki, esik=0.10):
+    gerilemeler = []
+    for ad, metrikler in simdiki.items():
+        eski = onceki.get(ad)
+        if not eski:
+            continue
+        for metrik, deger in metrikler.items():
+            if metrik not in eski or not eski[metrik]:
+                continue
+            oran = deger / eski[metrik] - 1
+            if (metrik in KUCUK_IYI and oran > esik) or (metrik in BUYUK_IYI and -oran > esik):
+                gerilemeler.append((ad, metrik, eski[metrik], deger, oran))
+    return gerilemeler
+
+
+def tabloyu_yaz(olcumler):
+    for ad, metrikler in olcumler.items():
+        alanlar = "  ".join(f"{k}={v:.3g}" for k, v in metrikler.items() if isinstance(v, float))
+        print(f"{ad:<42} {alanlar}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Kuantum Amiral Battı performans kıyaslamaları")
+    parser.add_argument("--bolumler", nargs="+", choices=list(BOLUMLER), default=list(BOLUMLER))
+    parser.add_argument("--json", help="sonuçları bu dosyaya JSON olarak yaz")
+    parser.add_argument("--karsilastir", help="önceki koşunun JSON dosyası")
+    parser.add_argument("--esik", type=float, default=0.10, help="gerileme eşiği (0.10 = %%10)")
+    args = parser.parse_args()
+
+    olcumler = {}
+    for bolum in args.bolumler:
+        olcumler.update(BOLUMLER[bolum]())
+    tabloyu_yaz(olcumler)
+
+    rapor = {
+        'meta': {'zaman': time.strftime("%Y-%m-%dT%H:%M:%S"), 'python': platform.python_version(),
+                 'platform': platform.platform(), 'bolumler': args.bolumler},
+        'olcumler': olcumler,
+    }
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(rapor, f, indent=2, ensure_ascii=False)
+
+    if args.karsilastir:
+        with open(args.karsilastir, encoding="utf-8") as f:
+            onceki = json.load(f)['olcumler']
+        gerilemeler = karsilastir(onceki, olcumler, args.esik)
+        for ad, metrik, eski, yeni, oran in gerilemeler:
+            print(f"GERİLEME {ad} {metrik}: {eski:.3g} -> {yeni:.3g} ({oran:+.0%})")
+        if gerilemeler:
+            raise SystemExit(1)
+        print(f"Gerileme yok (eşik {args.esik:.0%}).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+from enum import IntEnum
+
+import numpy as np
+
+from oyun_motoru import GameManager
+
+
+# --- KODLANMIŞ TİP VE DURUM ---
+class GemiTipi(IntEnum):
+    KLASIK = 0
+    HAYALET = 1
+    HILELI = 2
+
+
+class GemiDurumu(IntEnum):
+    AKTIF = 0
+    BATTI = 1
+
+
+TIP_ADLARI = {GemiTipi.KLASIK: 'klasik', GemiTipi.HAYALET: 'hayalet', GemiTipi.HILELI: 'hileli'}
+DURUM_ADLARI = {GemiDurumu.AKTIF: 'aktif', GemiDurumu.BATTI: 'batti'}
+ISIM_ONEKLERI = {GemiTipi.KLASIK: 'Klasik', GemiTipi.HAYALET: 'Hayalet', GemiTipi.HILELI: 'Hileli'}
+
+# Koordinatlar x * board_size + y olarak tek int32'ye paketlenir
+GEMI_DTYPE = np.dtype([
+    ('tip', np.uint8),
+    ('ilk_tip', np.uint8),
+    ('durum', np.uint8),
+    ('konum_sayisi', np.uint8),
+    ('konumlar', np.int32, (2,)),
+    ('theta', np.float64),
+    ('agirlik', np.float64),
+])
+
+
+# --- BİT TAHTASI ---
+# vurulan_kareler'in set arayüzünü (in, add, len, iter) kare başına tek bitle sağlar
+class BitTahtasi:
+    __slots__ = ('boyut', '_bitler', '_sayi')
+
+    def __init__(self, boyut):
+        self.boyut = boyut
+        self._bitler = bytearray((boyut * boyut + 7) // 8)
+        self._sayi = 0
+
+    def _kod(self, kare):
+        x, y = kare
+        if not (0 <= x < self.boyut and 0 <= y < self.boyut):
+            return None
+        return x * self.boyut + y
+
+    def __contains__(self, kare):
+        kod = self._kod(kare)
+        return kod is not None and bool(self._bitler[kod >> 3] & (1 << (kod & 7)))
+
+    def add(self, kare):
+        kod = self._kod(kare)
+        if kod is None:
+            raise ValueError(f"Tahta dışı kare: {kare}")
+        maske = 1 << (kod & 7)
+        if not self._bitler[kod >> 3] & maske:
+            self._bitler[kod >> 3] |= maske
+            self._sayi += 1
+
+    def __len__(self):
+        return self._sayi
+
+    def __iter__(self):
+        bitler = np.unpackbits(np.frombuffer(self._bitler, dtype=np.uint8), bitorder='little')
+        for kod in np.flatnonzero(bitler[:self.boyut * self.boyut]):
+            yield divmod(int(kod), self.boyut)
+
+    def dizi(self):
+        bitler = np.unpackbits(np.frombuffer(self._bitler, dtype=np.uint8), bitorder='little')
+        return bitler[:self.boyut * self.boyut].reshape(self.boyut, self.boyut)
+
+
+# --- KOMPAKT OYUN YÖNETİCİSİ ---
+# GameManager ile aynı gemi_yerlestir_* / qc_hedef_belirle / atis_cozumle arayüzü; gemiler tek bir
+# yapılandırılmış NumPy dizisinde, vurulan kareler bit tahtasında tutulur. Aynı süreçte yüzlerce
+# büyük tahtalı oyunun bellekte durabilmesi için gemi başına ~30 bayt, kare başına 1 bit harcanır.
+class KompaktGameManager(GameManager):
+    def __init__(self, board_size=8, rng=None, arka_uc="aer", hedefleme="rastgele", kapasite=16):
+        super().__init__(board_size, rng=rng, arka_uc=arka_uc, hedefleme=hedefleme)
+        self.vurulan_kareler = BitTahtasi(board_size)
+        self._gemiler = np.zeros(kapasite, dtype=GEMI_DTYPE)
+        self._gemi_adedi = 0
+        # Paketli kare -> gemi sıra numarası; aynı karede birden fazla gemi varsa yerleştirme sırasıyla liste
+        self._kare_indeksi = {}
+
+    # --- SÖZLÜK GÖRÜNÜMÜ ---
+    # Eski arayüzle uyumluluk için; her çağrıda yeniden üretilen salt okunur bir anlık görüntüdür
+    @property
+    def ships(self):
+        return {self._isim(i): self._gemi_sozlugu(i) for i in range(self._gemi_adedi)}
+
+    @ships.setter
+    def ships(self, deger):
+        # GameManager.__init__ boş sözlük atar; kompakt depoda karşılığı yok
+        pass
+
+    # Kare -> gemi isimleri (yerleştirme sırasıyla); _kare_indeksi'nden üretilen salt okunur anlık görüntü
+    @property
+    def hucre_indeksi(self):
+        indeks = {}
+        for kod, mevcut in self._kare_indeksi.items():
+            siralar = mevcut if isinstance(mevcut, list) else (mevcut,)
+            indeks[divmod(kod, self.board_size)] = [self._isim(s) for s in siralar]
+        return indeks
+
+    @hucre_indeksi.setter
+    def hucre_indeksi(self, deger):
+        pass
+
+    def _isim(self, sira):
+        return f"{ISIM_ONEKLERI[GemiTipi(self._gemiler['ilk_tip'][sira])]}_{sira + 1}"
+
+    def _koordinatlar(self, sira):
+        kayit = self._gemiler[sira]
+        return [divmod(int(k), self.board_size) for k in kayit['konumlar'][:kayit['konum_sayisi']]]
+
+    def _gemi_sozlugu(self, sira):
+        kayit = self._gemiler[sira]
+        ilk_tip = GemiTipi(kayit['ilk_tip'])
+        veri = {'tip': TIP_ADLARI[GemiTipi(kayit['tip'])], 'koordinatlar': self._koordinatlar(sira),
+                'durum': DURUM_ADLARI[GemiDurumu(kayit['durum'])]}
+        if ilk_tip == GemiTipi.HILELI:
+            veri['theta'] = float(kayit['theta'])
+            veri['agirlik'] = float(kayit['agirlik'])
+        return veri
+
+    # --- YERLEŞTİRME ---
+    def _gemi_ekle(self, tip, koordinatlar, theta=0.0, agirlik=0.0):
+        if self._gemi_adedi == len(self._gemiler):
+            self._gemiler = np.resize(self._gemiler, 2 * len(self._gemiler))
+        sira = self._gemi_adedi
+        kodlar = [x * self.board_size + y for x, y in koordinatlar]
+        kayit = self._gemiler[sira]
+        kayit['tip'] = kayit['ilk_tip'] = tip
+        kayit['durum'] = GemiDurumu.AKTIF
+        kayit['konum_sayisi'] = len(kodlar)
+        kayit['konumlar'][:len(kodlar)] = kodlar
+        kayit['theta'] = theta
+        kayit['agirlik'] = agirlik
+        self.gemi_surumu += 1
+        for kod in kodlar:
+            mevcut = self._kare_indeksi.get(kod)
+            if mevcut is None:
+                self._kare_indeksi[kod] = sira
+            elif isinstance(mevcut, list):
+                mevcut.append(sira)
+            else:
+                self._kare_indeksi[kod] = [mevcut, sira]
+        self._gemi_adedi += 1
+        self._aktif_adedi += 1
+        self.gemi_sayaci += 1
+
+    def gemi_yerlestir_klasik(self, x, y):
+        self._gemi_ekle(GemiTipi.KLASIK, [(x, y)])
+        self._isi_isle([(x, y)], [1.0])
+        if self.gunluk is not None:
+            self.gunluk.yerlestirme('klasik', [(x, y)], 1.0)
+
+    # Üç ve daha fazla konum GameManager'daki gibi gemi_yerlestir_coklu'ya gider (kompaktta ValueError)
+    def gemi_yerlestir_hayalet(self, koord1, koord2, *koordinatlar):
+        if koordinatlar:
+            return self.gemi_yerlestir_coklu([koord1, koord2, *koordinatlar])
+        self._gemi_ekle(GemiTipi.HAYALET, [koord1, koord2])
+        self._isi_isle([koord1, koord2], [0.5, 0.5])
+        self.arka_uc.on_yukle('hayalet')
+        if self.gunluk is not None:
+            self.gunluk.yerlestirme('hayalet', [koord1, koord2], 0.5)
+
+    def gemi_yerlestir_hileli(self, koord1, koord2, agirlik=0.75):
+        theta = 2 * np.arccos(np.sqrt(agirlik))
+        self._gemi_ekle(GemiTipi.HILELI, [koord1, koord2], theta, agirlik)
+        self._isi_isle([koord1, koord2], [agirlik, 1 - agirlik])
+        self.arka_uc.on_yukle('hileli', theta)
+        if self.gunluk is not None:
+            self.gunluk.yerlestirme('hileli', [koord1, koord2], agirlik)
+
+    # Kompakt kayıt en fazla iki konum tutar; ikiden fazla konumlu gemiler GameManager ile oynanır
+    def gemi_yerlestir_coklu(self, koordinatlar, genlikler=None):
+        if len(koordinatlar) != 2:
+            raise ValueError("KompaktGameManager yalnızca iki konumlu kuantum gemilerini destekler")
+        super().gemi_yerlestir_coklu(koordinatlar, genlikler)
+
+    # --- ÇÖZÜMLEME ---
+    def _indeksten_cikar_kod(self, sira, kodlar):
+        self.gemi_surumu += 1
+        for kod in set(kodlar):
+            mevcut = self._kare_indeksi.get(kod)
+            if mevcut is None: continue
+            if not isinstance(mevcut, list):
+                if mevcut == sira:
+                    del self._kare_indeksi[kod]
+                continue
+            kalan = [s for s in mevcut if s != sira]
+            if not kalan:
+                del self._kare_indeksi[kod]
+            else:
+                self._kare_indeksi[kod] = kalan if len(kalan) > 1 else kalan[0]
+
+    def _hedefteki_sira(self, hedef):
+        x, y = hedef
+        mevcut = self._kare_indeksi.get(x * self.board_size + y)
+        if mevcut is None:
+            return None
+        for sira in (mevcut if isinstance(mevcut, list) else (mevcut,)):
+            if self._gemiler['durum'][sira] == GemiDurumu.AKTIF:
+                return sira
+        return None
+
+    def hedefteki_gemi(self, hedef):
+        sira = self._hedefteki_sira(hedef)
+        if sira is None:
+            return None, None
+        return self._isim(sira), self._gemi_sozlugu(sira)
+
+    def _atis_cozumle(self, hedef, coken_durum=None):
+        sira = self._hedefteki_sira(hedef)
+        if sira is None:
+            return 'karavana'
+        kayit = self._gemiler[sira]
+        kodlar = [int(k) for k in kayit['konumlar'][:kayit['konum_sayisi']]]
+        tip = GemiTipi(kayit['tip'])
+        koordinatlar = [divmod(k, self.board_size) for k in kodlar]
+        if tip == GemiTipi.KLASIK:
+            kayit['durum'] = GemiDurumu.BATTI
+            self._aktif_adedi -= 1
+            self._indeksten_cikar_kod(sira, kodlar)
+            self._isi_isle(koordinatlar, [1.0] * len(kodlar), -1)
+            return 'batti_klasik'
+
+        # Hayalet gemi θ taşımaz; havuz ve uyum izleyicisi onu (hayalet, None) anahtarıyla tanır
+        theta = None if tip == GemiTipi.HAYALET else float(kayit['theta'])
+        if coken_durum is None:
+            coken_durum = self.cokme_olc(TIP_ADLARI[tip], theta)
+        else:
+            coken_durum = self.sonuc_dogrula(TIP_ADLARI[tip], theta, coken_durum)
+        gercek_kod = kodlar[coken_durum]
+        if tip == GemiTipi.HAYALET:
+            self._isi_isle(koordinatlar, [0.5, 0.5], -1)
+        else:
+            agirlik = float(kayit['agirlik'])
+            self._isi_isle(koordinatlar, [agirlik, 1 - agirlik], -1)
+        kayit['konumlar'][0] = gercek_kod
+        kayit['konum_sayisi'] = 1
+        if divmod(gercek_kod, self.board_size) == tuple(hedef):
+            kayit['durum'] = GemiDurumu.BATTI
+            self._aktif_adedi -= 1
+            self._indeksten_cikar_kod(sira, kodlar)
+            return 'batti_kuantum'
+        kayit['tip'] = GemiTipi.KLASIK
+        self._indeksten_cikar_kod(sira, [k for k in kodlar if k != gercek_kod])
+        self._isi_isle([divmod(gercek_kod, self.board_size)], [1.0])
+        return 'kurtuldu_kuantum'
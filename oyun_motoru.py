@@ -0,0 +1,589 @@
+import random
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+
+import numpy as np
+
+from cokme_arka_uclari import AnalitikArkaUc, IbmArkaUc, KonumDagilimi, KuantumHavuzu, arka_uc_olustur
+from uyum import VARSAYILAN_IZLEYICI
+
+
+# --- OYUN KURALLARI ---
+MAX_TUR = 30
+VARSAYILAN_ENVANTER = {"klasik": 3, "hayalet": 2, "hileli": 1}
+QPU_ZAMAN_ASIMI = 300  # saniye; aşılırsa iş iptal edilip yerel simülatöre düşülür
+MAKS_KONUM = 64        # çok konumlu gemilerde en fazla 6 kübit; günlükte çöken konum tek bayttır
+
+
+# --- OLASILIK ISI HARİTASI ---
+# Her kare için aktif gemilerin o karede bulunma olasılıklarının toplamı: klasik 1, hayalet 1/2 - 1/2,
+# hileli agirlik - (1 - agirlik). Harita yerleştirme ve her çözümleme sonrası yalnızca değişen karelerde
+# güncellenir; vurulmuş kareler -inf ile işaretlenir. Satır maksimumları ayrıca tutulduğundan en olası
+# kare O(N) ile bulunur ve değişiklik başına yalnızca etkilenen satırlar yeniden taranır.
+class IsiHaritasi:
+    ESIK = 1e-9
+
+    def __init__(self, boyut):
+        self.skor = np.zeros((boyut, boyut), dtype=np.float64)
+        self._satir_max = np.zeros(boyut, dtype=np.float64)
+
+    def _satirlari_yenile(self, satirlar):
+        for x in satirlar:
+            self._satir_max[x] = self.skor[x].max()
+
+    def ekle(self, koordinatlar, olasiliklar, isaret=1):
+        for (x, y), p in zip(koordinatlar, olasiliklar):
+            self.skor[x, y] += isaret * p
+        self._satirlari_yenile({x for x, _ in koordinatlar})
+
+    def vuruldu(self, kare):
+        x, y = kare
+        self.skor[x, y] = -np.inf
+        self._satirlari_yenile((x,))
+
+    def en_olasi(self):
+        x = int(np.argmax(self._satir_max))
+        if self._satir_max[x] <= self.ESIK:
+            return None
+        return x, int(np.argmax(self.skor[x]))
+
+
+def konum_olasiliklari(veri):
+    if 'dagilim' in veri:
+        return veri['dagilim'].olasiliklar.tolist()
+    if veri['tip'] == 'hayalet':
+        return [0.5, 0.5]
+    if veri['tip'] == 'hileli':
+        return [veri['agirlik'], 1 - veri['agirlik']]
+    return [1.0] * len(veri['koordinatlar'])
+
+
+# Arka uca giden ölçüm parametresi: hileli gemide Ry açısı, çok konumlu gemide KonumDagilimi
+def olcum_parametresi(veri):
+    return veri['dagilim'] if 'dagilim' in veri else veri.get('theta')
+
+
+# --- OYUN YÖNETİCİSİ (ÇEKİRDEK MOTOR) ---
+class GameManager:
+    # hedefleme: "rastgele" (vurulmamış karelerden eşit olasılıklı) ya da "isi_haritasi"
+    def __init__(self, board_size=8, rng=None, arka_uc="aer", hedefleme="rastgele"):
+        self.board_size = board_size
+        self.rng = rng or random.Random()
+        self.backend_tipi = "simülatör"
+        self.arka_uc = arka_uc_olustur(arka_uc)
+        self.ibm_backend = None
+        self.ships = {}
+        self.vurulan_kareler = set()
+        self.gemi_sayaci = 1
+        # Yerleştirmede artar, batmada azalır; aktif_gemi_sayisi gemileri taramadan döner
+        self._aktif_adedi = 0
+        # Kare -> o karede bulunabilecek aktif gemilerin isimleri (yerleştirme sırasıyla)
+        self.hucre_indeksi = {}
+        # İndeks her değiştiğinde (yerleştirme, batma, çökme) artar; arayüz gemi katmanını buna göre tazeler
+        self.gemi_surumu = 0
+        # Vurulmamış kareler sanal bir [0, board_size²) dizisidir (x * board_size + y); sözlükte yalnızca
+        # takas edilmiş konumlar tutulur (seyrek Fisher-Yates), bellek atış sayısıyla orantılıdır
+        self._takaslar = {}
+        self._kalan_sayisi = board_size * board_size
+        if hedefleme not in ("rastgele", "isi_haritasi"):
+            raise ValueError(f"Bilinmeyen hedefleme stratejisi: {hedefleme}")
+        self.hedefleme = hedefleme
+        self.isi_haritasi = IsiHaritasi(board_size) if hedefleme == "isi_haritasi" else None
+        # profil.Profilci atanırsa her çökmenin arka uç gecikmesi kaydedilir
+        self.profil = None
+        # Her çökme sonucu Born kuralı uyum izleyicisine bildirilir (süreç geneli; None ile kapatılır)
+        self.uyum = VARSAYILAN_IZLEYICI
+        # gunluk.GunlukYazici atanırsa yerleştirmeler, hedefler ve atış sonuçları günlüğe eklenir
+        self.gunluk = None
+        self._son_kaynak = None
+        # Arka ucun döndürdüğü, gemi konum sayısını aşan sonuçlar (gürültülü QPU); analitik yedekle yeniden çekilir
+        self.aralik_disi_sonuc = 0
+        self._analitik_yedek = None
+        # Arka plandaki her ölçüm bir nesil numarası taşır; zaman aşımı ya da iptalle yerine başkası başlatılan
+        # işin geç gelen sonucu kaydedilmez (günlük kaynağı, uyum, profil)
+        self._cokme_nesli = 0
+        self._nesil_kilidi = threading.Lock()
+
+    # havuz_boyutu verilirse her (tip, θ) için tek bir çok-atışlı QPU işi önceden koşturulur
+    def ibm_baglantisi_kur(self, api_key, havuz_boyutu=None):
+        try:
+            from qiskit_ibm_runtime import QiskitRuntimeService
+            QiskitRuntimeService.save_account(channel="ibm_quantum", token=api_key, overwrite=True)
+            service = QiskitRuntimeService(channel="ibm_quantum")
+            self.ibm_backend = service.least_busy(operational=True, simulator=False)
+            self.arka_uc = IbmArkaUc(self.ibm_backend)
+            # Parametreli çökme devreleri bağlantı anında bir kez transpile edilir
+            self.arka_uc.isit()
+            if havuz_boyutu:
+                self.arka_uc = KuantumHavuzu(self.arka_uc, parti_boyutu=havuz_boyutu)
+            self.backend_tipi = "ibm"
+            return True, self.ibm_backend.name
+        except ImportError:
+            return False, "'qiskit-ibm-runtime' kütüphanesi eksik!"
+        except Exception as e:
+            return False, str(e)
+
+    # --- HÜCRE İNDEKSİ ---
+    def _indekse_ekle(self, isim, koordinatlar):
+        self.gemi_surumu += 1
+        for koord in koordinatlar:
+            self.hucre_indeksi.setdefault(koord, []).append(isim)
+
+    def _isi_isle(self, koordinatlar, olasiliklar, isaret=1):
+        if self.isi_haritasi is not None:
+            self.isi_haritasi.ekle(koordinatlar, olasiliklar, isaret)
+
+    def _indeksten_cikar(self, isim, koordinatlar):
+        self.gemi_surumu += 1
+        for koord in set(koordinatlar):
+            isimler = self.hucre_indeksi.get(koord)
+            if not isimler: continue
+            isimler[:] = [i for i in isimler if i != isim]
+            if not isimler:
+                del self.hucre_indeksi[koord]
+
+    def gemi_yerlestir_klasik(self, x, y):
+        isim = f"Klasik_{self.gemi_sayaci}"
+        self.ships[isim] = {'tip': 'klasik', 'koordinatlar': [(x, y)], 'durum': 'aktif'}
+        self._indekse_ekle(isim, [(x, y)])
+        self._isi_isle([(x, y)], [1.0])
+        self.gemi_sayaci += 1
+        self._aktif_adedi += 1
+        if self.gunluk is not None:
+            self.gunluk.yerlestirme('klasik', [(x, y)], 1.0)
+
+    # İkiden fazla koordinat verilirse eşit olasılıklı çok konumlu gemi yerleştirilir
+    def gemi_yerlestir_hayalet(self, koord1, koord2, *koordinatlar):
+        if koordinatlar:
+            return self.gemi_yerlestir_coklu([koord1, koord2, *koordinatlar])
+        isim = f"Hayalet_{self.gemi_sayaci}"
+        self.ships[isim] = {'tip': 'hayalet', 'koordinatlar': [koord1, koord2], 'durum': 'aktif'}
+        self._indekse_ekle(isim, [koord1, koord2])
+        self._isi_isle([koord1, koord2], [0.5, 0.5])
+        self.gemi_sayaci += 1
+        self._aktif_adedi += 1
+        self.arka_uc.on_yukle('hayalet')
+        if self.gunluk is not None:
+            self.gunluk.yerlestirme('hayalet', [koord1, koord2], 0.5)
+
+    def gemi_yerlestir_hileli(self, koord1, koord2, agirlik=0.75):
+        isim = f"Hileli_{self.gemi_sayaci}"
+        theta = 2 * np.arccos(np.sqrt(agirlik))
+        self.ships[isim] = {'tip': 'hileli', 'koordinatlar': [koord1, koord2], 'theta': theta, 'agirlik': agirlik,
+                            'durum': 'aktif'}
+        self._indekse_ekle(isim, [koord1, koord2])
+        self._isi_isle([koord1, koord2], [agirlik, 1 - agirlik])
+        self.gemi_sayaci += 1
+        self._aktif_adedi += 1
+        self.arka_uc.on_yukle('hileli', theta)
+        if self.gunluk is not None:
+            self.gunluk.yerlestirme('hileli', [koord1, koord2], agirlik)
+
+    # k konumlu gemi; genlikler verilmezse eşit süperpozisyon (hayalet), verilirse |a_i|² ağırlıklı (hileli).
+    # İki konumlu gemiler tek kübitlik hayalet/hileli yoluna düşer.
+    def gemi_yerlestir_coklu(self, koordinatlar, genlikler=None):
+        koordinatlar = [tuple(k) for k in koordinatlar]
+        if not 2 <= len(koordinatlar) <= MAKS_KONUM:
+            raise ValueError(f"Çok konumlu gemi 2 ile {MAKS_KONUM} arasında konum almalı: {len(koordinatlar)}")
+        if genlikler is not None and len(genlikler) != len(koordinatlar):
+            raise ValueError("Genlik sayısı konum sayısına eşit olmalı")
+        tip = 'hayalet' if genlikler is None else 'hileli'
+        dagilim = KonumDagilimi.esit(len(koordinatlar)) if genlikler is None else KonumDagilimi(genlikler)
+        if len(koordinatlar) == 2:
+            if tip == 'hayalet':
+                return self.gemi_yerlestir_hayalet(*koordinatlar)
+            return self.gemi_yerlestir_hileli(*koordinatlar, float(dagilim.olasiliklar[0]))
+        isim = f"{tip.capitalize()}_{self.gemi_sayaci}"
+        self.ships[isim] = {'tip': tip, 'koordinatlar': koordinatlar, 'dagilim': dagilim, 'durum': 'aktif'}
+        self._indekse_ekle(isim, koordinatlar)
+        self._isi_isle(koordinatlar, dagilim.olasiliklar)
+        self.gemi_sayaci += 1
+        self._aktif_adedi += 1
+        self.arka_uc.on_yukle(tip, dagilim)
+        if self.gunluk is not None:
+            self.gunluk.yerlestirme(tip, koordinatlar, float(dagilim.olasiliklar[0]), dagilim.olasiliklar)
+
+    def aktif_gemi_sayisi(self):
+        return self._aktif_adedi
+
+    # --- HEDEF HAVUZU ---
+    def _havuzdan_cek(self):
+        # Swap-remove: seçilen konuma son eleman taşınır, havuz bir küçülür
+        i = self.rng.randrange(self._kalan_sayisi)
+        son = self._kalan_sayisi - 1
+        kod = self._takaslar.get(i, i)
+        son_kod = self._takaslar.pop(son, son)
+        if i != son:
+            self._takaslar[i] = son_kod
+        self._kalan_sayisi = son
+        return kod
+
+    def _hedefi_isaretle(self, hedef):
+        self.vurulan_kareler.add(hedef)
+        if self.isi_haritasi is not None:
+            self.isi_haritasi.vuruldu(hedef)
+        if self.gunluk is not None:
+            self.gunluk.hedef(hedef, len(self.vurulan_kareler))
+        return hedef
+
+    def qc_hedef_belirle(self):
+        if self.isi_haritasi is not None:
+            hedef = self.isi_haritasi.en_olasi()
+            if hedef is not None:
+                return self._hedefi_isaretle(hedef)
+        # Rastgele seçim (ısı haritası boşsa da buraya düşülür)
+        while self._kalan_sayisi > 0:
+            hedef = divmod(self._havuzdan_cek(), self.board_size)
+            # vurulan_kareler dışarıdan ya da ısı haritası tarafından doldurulmuş olabilir; o kareleri atla
+            if hedef not in self.vurulan_kareler:
+                return self._hedefi_isaretle(hedef)
+        return None
+
+    def hedefteki_gemi(self, hedef):
+        for isim in self.hucre_indeksi.get(hedef, ()):
+            veri = self.ships[isim]
+            if veri['durum'] == 'aktif':
+                return isim, veri
+        return None, None
+
+    # --- ÇÖKME ÖLÇÜMÜ ---
+    # Yeni bir arka plan ölçümü için nesil alır; önceki nesillerin sonuçları bundan sonra yok sayılır
+    def cokme_nesli_al(self):
+        with self._nesil_kilidi:
+            self._cokme_nesli += 1
+            self._son_kaynak = None
+            return self._cokme_nesli
+
+    # Arka plandaki iş parçacığından da çağrılır; arka_uc verilmezse oyunun etkin arka ucu kullanılır.
+    # nesil verilirse ve o arada yeni bir nesil alınmışsa sonuç hiçbir yere kaydedilmeden döner
+    def cokme_olc(self, tip, theta=None, arka_uc=None, nesil=None):
+        arka_uc = arka_uc or self.arka_uc
+        profil = self.profil is not None and self.profil.etkin
+        baslangic = time.perf_counter() if profil else 0.0
+        coken_durum = arka_uc.olc(tip, theta)
+        sure = time.perf_counter() - baslangic if profil else 0.0
+        if nesil is None:
+            return self._cokme_kaydet(arka_uc, tip, theta, coken_durum, profil, sure)
+        with self._nesil_kilidi:
+            if nesil != self._cokme_nesli:
+                return coken_durum
+            return self._cokme_kaydet(arka_uc, tip, theta, coken_durum, profil, sure)
+
+    def _cokme_kaydet(self, arka_uc, tip, theta, coken_durum, profil, sure):
+        if profil:
+            self.profil.cokme_kaydet(arka_uc.ad, tip, sure, getattr(arka_uc, 'son_zamanlama', None))
+        if self.uyum is not None:
+            self.uyum.kaydet(arka_uc, tip, theta, coken_durum)
+        gecerli = self.sonuc_dogrula(tip, theta, coken_durum)
+        if self.gunluk is not None:
+            # İş kimliği ölçümü yapan iş parçacığına özgüdür; burada okunup atış kaydına taşınır
+            if gecerli == coken_durum:
+                self._son_kaynak = (arka_uc, arka_uc.son_is_no, coken_durum)
+            else:
+                self._son_kaynak = (self._analitik_yedek, None, gecerli)
+        return gecerli
+
+    # k ikinin kuvveti değilse Ry ağacı ceil(log2 k) kübitte hazırlanır; gürültülü bir QPU k ya da daha büyük
+    # bir sıra döndürebilir. Böyle bir sonuç sayılır ve oyunun rng'siyle tohumlanan analitik örnekleyiciden
+    # yeniden çekilir; oyun atışın ortasında çökmez
+    def sonuc_dogrula(self, tip, theta, coken_durum):
+        k = theta.k if isinstance(theta, KonumDagilimi) else 2
+        if 0 <= coken_durum < k:
+            return coken_durum
+        self.aralik_disi_sonuc += 1
+        return self.analitik_yedek().olc(tip, theta)
+
+    def analitik_yedek(self):
+        if self._analitik_yedek is None:
+            self._analitik_yedek = AnalitikArkaUc(seed=self.rng.getrandbits(64))
+        return self._analitik_yedek
+
+    # coken_durum verilirse ölçüm yapılmaz; arka planda alınmış sonuç doğrudan uygulanır
+    def atis_cozumle(self, hedef, coken_durum=None):
+        if self.gunluk is None:
+            return self._atis_cozumle(hedef, coken_durum)
+        _, veri = self.hedefteki_gemi(hedef)
+        tip = veri['tip'] if veri is not None else None
+        deger = konum_olasiliklari(veri)[0] if veri is not None else 0.0
+        if coken_durum is not None and tip in ('hayalet', 'hileli'):
+            # Dışarıdan gelen sonuç da günlüğe yazılmadan önce doğrulanır
+            coken_durum = self.sonuc_dogrula(tip, olcum_parametresi(veri), coken_durum)
+        sonuc = self._atis_cozumle(hedef, coken_durum)
+        if tip in ('hayalet', 'hileli'):
+            # Ölçüm bu çağrıda ya da arka plandaki cokme_olc'da yapıldı; ikisi de yoksa bit dışarıdan (tekrar) gelir
+            kaynak, self._son_kaynak = self._son_kaynak, None
+            if coken_durum is None:
+                coken_durum = kaynak[2]
+            elif kaynak is not None and kaynak[2] != coken_durum:
+                kaynak = None
+            self.gunluk.atis(hedef, len(self.vurulan_kareler), sonuc, tip, deger, coken_durum,
+                             kaynak[:2] if kaynak else None)
+        else:
+            self.gunluk.atis(hedef, len(self.vurulan_kareler), sonuc, tip, deger)
+        return sonuc
+
+    def _atis_cozumle(self, hedef, coken_durum=None):
+        isim, veri = self.hedefteki_gemi(hedef)
+        if veri is None:
+            return 'karavana'
+        if veri['tip'] == 'klasik':
+            veri['durum'] = 'batti'
+            self._aktif_adedi -= 1
+            self._indeksten_cikar(isim, veri['koordinatlar'])
+            self._isi_isle(veri['koordinatlar'], konum_olasiliklari(veri), -1)
+            return 'batti_klasik'
+        return self._kuantum_cokme_hesapla(isim, veri, hedef, coken_durum)
+
+    def _kuantum_cokme_hesapla(self, isim, veri, atis_hedefi, coken_durum=None):
+        if coken_durum is None:
+            coken_durum = self.cokme_olc(veri['tip'], olcum_parametresi(veri))
+        else:
+            coken_durum = self.sonuc_dogrula(veri['tip'], olcum_parametresi(veri), coken_durum)
+        gercek_konum = veri['koordinatlar'][coken_durum]
+        # Süperpozisyon katkısı haritadan düşülür; gemi kurtulursa çöktüğü karede kesin (1) olarak geri eklenir
+        self._isi_isle(veri['koordinatlar'], konum_olasiliklari(veri), -1)
+
+        if gercek_konum == atis_hedefi:
+            self._indeksten_cikar(isim, veri['koordinatlar'])
+            veri['durum'] = 'batti'
+            self._aktif_adedi -= 1
+            veri['koordinatlar'] = [gercek_konum]
+            return 'batti_kuantum'
+        else:
+            # Gemi çöktüğü karede klasik olarak kalır; diğer konumlardan indeks kaydı silinir
+            self._indeksten_cikar(isim, [k for k in veri['koordinatlar'] if k != gercek_konum])
+            self._isi_isle([gercek_konum], [1.0])
+            veri['tip'] = 'klasik'
+            veri['koordinatlar'] = [gercek_konum]
+            veri.pop('dagilim', None)
+            return 'kurtuldu_kuantum'
+
+
+# --- ATIŞ OLAYI ---
+@dataclass(frozen=True)
+class AtisOlayi:
+    tur: int
+    hedef: tuple
+    sonuc: str
+    aktif_gemi: int
+    oyun_bitti: bool
+    kazanan: str = None
+
+
+# --- ARKA PLANDA ÇÖKME ---
+# Ölçüm işi daemon bir iş parçacığında yürür; oyun durumu yalnızca ana döngüde, sonuç
+# uygulanırken değişir. Daemon olması saatlerce süren bir QPU kuyruğunun çıkışı kilitlemesini engeller.
+def arka_planda_calistir(fonksiyon, *argumanlar):
+    gelecek = Future()
+
+    def is_parcacigi():
+        if not gelecek.set_running_or_notify_cancel():
+            return
+        try:
+            gelecek.set_result(fonksiyon(*argumanlar))
+        except BaseException as e:
+            gelecek.set_exception(e)
+
+    threading.Thread(target=is_parcacigi, name="kuantum-cokme", daemon=True).start()
+    return gelecek
+
+
+# coken_durum verilirse (tekrar) hiçbir arka uç çalıştırılmaz, bit doğrudan uygulanır
+class BekleyenCozum:
+    def __init__(self, oturum, hedef, veri=None, zaman_asimi=QPU_ZAMAN_ASIMI, coken_durum=None):
+        self.oturum = oturum
+        self.hedef = hedef
+        self.veri = veri
+        self.coken_durum = coken_durum
+        self.zaman_asimi = zaman_asimi
+        self.baslangic = time.monotonic()
+        self.yedege_gecti = False
+        self.hata = None
+        self.arka_uc = oturum.oyun.arka_uc
+        self.gelecek = None
+        if veri is not None:
+            self.gelecek = arka_planda_calistir(oturum.oyun.cokme_olc, veri['tip'], olcum_parametresi(veri),
+                                                self.arka_uc, oturum.oyun.cokme_nesli_al())
+
+    @property
+    def bekleme_suresi(self):
+        return time.monotonic() - self.baslangic
+
+    def _yedege_gec(self):
+        # Uzak işi bırak, aynı devreyi yerel simülatörde ölç; bırakılan iş yeni nesille geçersizleşir
+        self.arka_uc.iptal()
+        self.yedege_gecti = True
+        yedek = self.oturum.yedek_arka_uc()
+        oyun = self.oturum.oyun
+        self.gelecek = arka_planda_calistir(oyun.cokme_olc, self.veri['tip'], olcum_parametresi(self.veri), yedek,
+                                            oyun.cokme_nesli_al())
+
+    def iptal(self):
+        if self.gelecek is not None and not self.gelecek.done() and not self.yedege_gecti:
+            self._yedege_gec()
+
+    # Her karede çağrılır; asla bloklamaz
+    def tamamlandi(self):
+        if self.gelecek is None:
+            return True
+        if self.gelecek.done():
+            if self.gelecek.exception() is not None and not self.yedege_gecti:
+                self._yedege_gec()
+                return False
+            return True
+        if not self.yedege_gecti and self.zaman_asimi is not None and self.bekleme_suresi > self.zaman_asimi:
+            self._yedege_gec()
+        return False
+
+    # Yedek ölçüm de başarısız olduysa bit oyunun analitik örnekleyicisinden alınır; hata 'hata'da kalır
+    def olay(self):
+        coken_durum = self.coken_durum
+        if self.gelecek is not None:
+            try:
+                coken_durum = self.gelecek.result()
+            except Exception as e:
+                self.hata = e
+                oyun = self.oturum.oyun
+                coken_durum = oyun.cokme_olc(self.veri['tip'], olcum_parametresi(self.veri), oyun.analitik_yedek(),
+                                             oyun.cokme_nesli_al())
+        return self.oturum.cozumle(self.hedef, coken_durum)
+
+
+# --- OTURUM (PYGAME'SİZ OYUN DÖNGÜSÜ) ---
+# Yerleştirme, tur sayımı ve kazanma/kaybetme tespiti burada yapılır.
+# Pygame arayüzü de toplu simülasyonlar da aynı oturum nesnesini kullanır.
+# Toplu koşular için varsayılan çökme arka ucu analitik Born örnekleyicisidir.
+# Oturumun rastgeleliği tek bir tohumdan türetilir (verilmezse rng'den ya da sistemden çekilir);
+# analitik arka uçla oynanan bir oyun tohumundan birebir yeniden üretilebilir.
+class OyunOturumu:
+    def __init__(self, board_size=8, max_tur=MAX_TUR, envanter=None, oyun=None, rng=None, arka_uc="analitik",
+                 hedefleme="rastgele", tohum=None, gunluk=None):
+        self.tohum = tohum if tohum is not None else (rng or random).getrandbits(63)
+        self.rng = random.Random(self.tohum)
+        if oyun is None:
+            if arka_uc == "analitik":
+                arka_uc = arka_uc_olustur("analitik", seed=self.rng.getrandbits(64))
+            oyun = GameManager(board_size, rng=self.rng, arka_uc=arka_uc, hedefleme=hedefleme)
+        self.oyun = oyun
+        self.max_tur = max_tur
+        self.envanter = dict(envanter or VARSAYILAN_ENVANTER)
+        self.faz = "YERLESTIRME"
+        self.kazanan = None
+        self.olaylar = []
+        self._yedek_arka_uc = None
+        self.gunluk = gunluk
+        if gunluk is not None:
+            oyun.gunluk = gunluk
+            gunluk.oyun_basla(self.tohum, oyun.board_size, max_tur, oyun.hedefleme)
+
+    @property
+    def tur(self):
+        return len(self.oyun.vurulan_kareler)
+
+    @property
+    def kalan_tur(self):
+        return self.max_tur - self.tur
+
+    @property
+    def filo_tamam(self):
+        return sum(self.envanter.values()) == 0
+
+    # --- YERLEŞTİRME ---
+    def _envanterden_dus(self, tip):
+        if self.faz != "YERLESTIRME" or self.envanter.get(tip, 0) <= 0:
+            return False
+        self.envanter[tip] -= 1
+        return True
+
+    def yerlestir_klasik(self, x, y):
+        if not self._envanterden_dus("klasik"): return False
+        self.oyun.gemi_yerlestir_klasik(x, y)
+        return True
+
+    def yerlestir_hayalet(self, koord1, koord2):
+        if not self._envanterden_dus("hayalet"): return False
+        self.oyun.gemi_yerlestir_hayalet(koord1, koord2)
+        return True
+
+    def yerlestir_hileli(self, koord1, koord2, agirlik=0.75):
+        if not self._envanterden_dus("hileli"): return False
+        self.oyun.gemi_yerlestir_hileli(koord1, koord2, agirlik)
+        return True
+
+    # Çok konumlu gemi envanterden hayalet (genlikler yoksa) ya da hileli hakkı düşer
+    def yerlestir_coklu(self, koordinatlar, genlikler=None):
+        if not self._envanterden_dus('hayalet' if genlikler is None else 'hileli'): return False
+        self.oyun.gemi_yerlestir_coklu(koordinatlar, genlikler)
+        return True
+
+    def rastgele_yerlestir(self, agirlik=0.75):
+        boyut = self.oyun.board_size
+        kare = lambda: (self.rng.randrange(boyut), self.rng.randrange(boyut))
+        while self.envanter["klasik"] > 0:
+            self.yerlestir_klasik(*kare())
+        while self.envanter["hayalet"] > 0:
+            self.yerlestir_hayalet(kare(), kare())
+        while self.envanter["hileli"] > 0:
+            self.yerlestir_hileli(kare(), kare(), agirlik)
+
+    def savasi_baslat(self):
+        if self.faz != "YERLESTIRME" or not self.filo_tamam:
+            return False
+        self.faz = "SAVUNMA"
+        return True
+
+    # --- SAVAŞ ---
+    def hedef_sec(self):
+        if self.faz != "SAVUNMA" or self.kalan_tur <= 0:
+            return None
+        return self.oyun.qc_hedef_belirle()
+
+    def yedek_arka_uc(self):
+        if self._yedek_arka_uc is None:
+            self._yedek_arka_uc = arka_uc_olustur("aer")
+        return self._yedek_arka_uc
+
+    # Kuantum isabetlerinde ölçüm arka planda başlar; döngü BekleyenCozum'u her karede yoklar
+    def cozumle_baslat(self, hedef, zaman_asimi=QPU_ZAMAN_ASIMI):
+        _, veri = self.oyun.hedefteki_gemi(hedef)
+        if veri is not None and veri['tip'] == 'klasik':
+            veri = None
+        return BekleyenCozum(self, hedef, veri, zaman_asimi)
+
+    def cozumle(self, hedef, coken_durum=None):
+        sonuc = self.oyun.atis_cozumle(hedef, coken_durum)
+        aktif = self.oyun.aktif_gemi_sayisi()
+        if aktif == 0:
+            self.faz, self.kazanan = "OYUN_BITTI", "sistem"
+        elif self.tur >= self.max_tur:
+            self.faz, self.kazanan = "OYUN_BITTI", "oyuncu"
+        if self.faz == "OYUN_BITTI" and self.gunluk is not None:
+            self.gunluk.oyun_bitti(self.kazanan, self.tur)
+        olay = AtisOlayi(self.tur, hedef, sonuc, aktif, self.faz == "OYUN_BITTI", self.kazanan)
+        self.olaylar.append(olay)
+        return olay
+
+    def step(self):
+        hedef = self.hedef_sec()
+        if hedef is None:
+            return None
+        return self.cozumle(hedef)
+
+    def play_to_end(self):
+        if self.faz == "YERLESTIRME":
+            if not self.filo_tamam:
+                self.rastgele_yerlestir()
+            self.savasi_baslat()
+        olaylar = []
+        while self.faz == "SAVUNMA":
+            olay = self.step()
+            if olay is None:
+                # Tahta doldu ama tur sınırına ulaşılmadı: filo hayatta kaldı
+                self.faz, self.kazanan = "OYUN_BITTI", "oyuncu"
+                if self.gunluk is not None:
+                    self.gunluk.oyun_bitti(self.kazanan, self.tur)
+                break
+            olaylar.append(olay)
+        return olaylar
@@ -0,0 +1,77 @@
+import json
+import time
+from collections import deque
+
+import numpy as np
+
+
+# --- PROFİLCİ ---
+# Kare süresi bölümlere ayrılarak (olaylar, ızgara, gemiler, VFX, HUD, flip) ve her kuantum çökmesinin
+# arka uç gecikmesi kayan bir pencerede tutulur; istenirse her kayıt JSONL dosyasına da yazılır.
+# Kapalıyken her çağrı tek bir öznitelik kontrolüyle döner; ana döngüye eklenen maliyet ihmal edilebilir.
+class Profilci:
+    BOLUMLER = ("olaylar", "izgara", "gemiler", "vfx", "hud", "profil", "flip")
+
+    def __init__(self, etkin=False, dosya=None, pencere=120):
+        self.etkin = etkin
+        self.dosya_yolu = dosya
+        self._dosya = open(dosya, "a", encoding="utf-8") if dosya else None
+        self.kareler = deque(maxlen=pencere)
+        self.cokmeler = deque(maxlen=pencere)
+        self.kare_no = 0
+        self._kare = None
+        self._son = 0.0
+        self._kare_baslangic = 0.0
+
+    def _yaz(self, kayit):
+        if self._dosya is not None:
+            self._dosya.write(json.dumps(kayit, ensure_ascii=False) + "\n")
+
+    # --- KARE BÖLÜMLERİ ---
+    # isaretle(bolum), bir önceki işaretten bu yana geçen süreyi o bölüme yazar
+    def kare_basla(self):
+        if not self.etkin:
+            return
+        self._kare_baslangic = self._son = time.perf_counter()
+        self._kare = {}
+
+    def isaretle(self, bolum):
+        if self._kare is None:
+            return
+        simdi = time.perf_counter()
+        self._kare[bolum] = (simdi - self._son) * 1e3
+        self._son = simdi
+
+    def kare_bitir(self):
+        if self._kare is None:
+            return
+        kare, self._kare = self._kare, None
+        kare["toplam"] = (self._son - self._kare_baslangic) * 1e3
+        self.kare_no += 1
+        self.kareler.append(kare)
+        self._yaz({"tur": "kare", "no": self.kare_no, "zaman": time.time(), **{k: round(v, 4) for k, v in kare.items()}})
+
+    # --- ÇÖKME GECİKMESİ ---
+    # zamanlama: IBM işlerinde arka ucun ayırdığı kuyruk/çalışma süreleri (saniye)
+    def cokme_kaydet(self, arka_uc, tip, sure, zamanlama=None):
+        if not self.etkin:
+            return
+        kayit = {"tur": "cokme", "zaman": time.time(), "arka_uc": arka_uc, "tip": tip, "sure_ms": round(sure * 1e3, 4)}
+        if zamanlama:
+            kayit.update(zamanlama)
+        self.cokmeler.append(kayit)
+        self._yaz(kayit)
+
+    # --- ÖZET ---
+    def ozet(self):
+        bolumler = {}
+        if self.kareler:
+            for bolum in self.BOLUMLER + ("toplam",):
+                degerler = np.array([k.get(bolum, 0.0) for k in self.kareler])
+                bolumler[bolum] = (float(degerler.mean()), float(np.percentile(degerler, 95)))
+        return {"bolumler": bolumler, "son_cokme": self.cokmeler[-1] if self.cokmeler else None}
+
+    def kapat(self):
+        if self._dosya is not None:
+            self._dosya.close()
+            self._dosya = None
@@ -0,0 +1,305 @@
+import argparse
+import asyncio
+import json
+import random
+import time
+from dataclasses import asdict
+
+from cokme_arka_uclari import arka_uc_olustur
+from oyun_motoru import MAKS_KONUM, OyunOturumu, olcum_parametresi
+from uyum import VARSAYILAN_IZLEYICI
+
+
+# --- OTURUMLAR ARASI ÇÖKME TOPLAYICI ---
+# Oturumlardan gelen ölçüm istekleri kısa bir pencere boyunca biriktirilir ve arka uca tek bir gönderim
+# olarak verilir (Aer'de çok devreli tek koşu, IBM'de çok kübitli tek iş). Dönen bitler isteklerin
+# sırasıyla kendi oturumlarına dağıtılır. Arka uç çağrısı iş parçacığında yürür; olay döngüsü bloklanmaz.
+# Dönen bitler Born kuralı uyum izleyicisine de bildirilir.
+# Toplu gönderim başarısız olursa parti tek tek yeniden ölçülür; yine başarısız olan istek yedek (analitik)
+# örnekleyiciye düşer. Böylece bir oturumun bozuk isteği ya da geçici bir arka uç hatası partideki diğer
+# oturumlara yayılmaz.
+class CokmeToplayici:
+    def __init__(self, arka_uc="aer", pencere=0.02, en_fazla=256, uyum=VARSAYILAN_IZLEYICI, yedek="analitik"):
+        self.arka_uc = arka_uc_olustur(arka_uc)
+        self.yedek = arka_uc_olustur(yedek)
+        self.uyum = uyum
+        self.pencere = pencere
+        self.en_fazla = en_fazla
+        self._bekleyenler = []
+        self._zamanlayici = None
+        self.gonderim = 0
+        self.olcum = 0
+        self.en_buyuk_parti = 0
+        self.basarisiz_gonderim = 0
+        self.yedek_olcum = 0
+
+    async def olc(self, tip, theta=None):
+        gelecek = asyncio.get_running_loop().create_future()
+        self._bekleyenler.append((tip, theta, gelecek))
+        if len(self._bekleyenler) >= self.en_fazla:
+            self._gonder()
+        elif self._zamanlayici is None:
+            self._zamanlayici = asyncio.get_running_loop().call_later(self.pencere, self._gonder)
+        return await gelecek
+
+    def _gonder(self):
+        if self._zamanlayici is not None:
+            self._zamanlayici.cancel()
+            self._zamanlayici = None
+        parti, self._bekleyenler = self._bekleyenler, []
+        if parti:
+            asyncio.ensure_future(self._calistir(parti))
+
+    async def _calistir(self, parti):
+        istekler = [(tip, theta) for tip, theta, _ in parti]
+        self.gonderim += 1
+        self.olcum += len(parti)
+        self.en_buyuk_parti = max(self.en_buyuk_parti, len(parti))
+        dongu = asyncio.get_running_loop()
+        try:
+            bitler = await dongu.run_in_executor(None, self.arka_uc.olc_toplu, istekler)
+        except Exception:
+            self.basarisiz_gonderim += 1
+            sonuclar = await dongu.run_in_executor(None, self._tek_tek_olc, istekler)
+        else:
+            if self.uyum is not None:
+                self.uyum.kaydet_toplu(self.arka_uc, istekler, bitler)
+            sonuclar = [(int(bit), None) for bit in bitler]
+        for (_, _, gelecek), (bit, hata) in zip(parti, sonuclar):
+            if gelecek.done():
+                continue
+            if hata is None:
+                gelecek.set_result(bit)
+            else:
+                gelecek.set_exception(hata)
+
+    # Her istek için (bit, hata); bitler ölçüldükleri arka uçla uyum izleyicisine bildirilir
+    def _tek_tek_olc(self, istekler):
+        sonuclar = []
+        for tip, theta in istekler:
+            for arka_uc in (self.arka_uc, self.yedek):
+                try:
+                    bit, hata = int(arka_uc.olc(tip, theta)), None
+                except Exception as e:
+                    bit, hata = None, e
+                    continue
+                if arka_uc is self.yedek:
+                    self.yedek_olcum += 1
+                if self.uyum is not None:
+                    self.uyum.kaydet(arka_uc, tip, theta, bit)
+                break
+            sonuclar.append((bit, hata))
+        return sonuclar
+
+    def istatistikler(self):
+        return {'gonderim': self.gonderim, 'olcum': self.olcum, 'en_buyuk_parti': self.en_buyuk_parti,
+                'ortalama_parti': self.olcum / self.gonderim if self.gonderim else 0.0,
+                'basarisiz_gonderim': self.basarisiz_gonderim, 'yedek_olcum': self.yedek_olcum}
+
+
+# --- OYUN SUNUCUSU ---
+# Satır başına bir JSON nesnesi taşıyan basit bir TCP protokolü; her bağlantı tek bir oturumdur.
+#   {"komut": "yeni", "board_size": 8, "hedefleme": "rastgele"}
+#   {"komut": "yerlestir", "tip": "hayalet", "kareler": [[1, 2], [5, 6]]}   (hileli için "agirlik")
+#   {"komut": "yerlestir", "tip": "coklu", "kareler": [[0, 0], [3, 4], [7, 1]], "genlikler": [1, 1, 2]}
+#   {"komut": "rastgele_yerlestir"} / {"komut": "basla"} / {"komut": "ates"} / {"komut": "durum"}
+#   {"komut": "uyum"}: Born kuralı uyum özeti / {"komut": "metrikler"}: aynısı Prometheus metin biçiminde
+# Her isteğe tek satırlık bir JSON cevap döner; hatalı isteklerde {"hata": "..."}.
+KARE_SAYILARI = {'klasik': (1, 1), 'hayalet': (2, 2), 'hileli': (2, 2), 'coklu': (2, MAKS_KONUM)}
+TAHTA_SINIRLARI = (2, 512)
+
+
+# Sayısal alanlar oturuma ulaşmadan denetlenir: 0 ya da 1 ağırlık tek konumlu, aralık dışı ağırlık NaN θ verir;
+# büyük ya da tam sayı olmayan tahta boyutu motorun derinlerinde MemoryError / TypeError'a yol açar
+def agirligi_oku(istek):
+    agirlik = istek.get('agirlik', 0.75)
+    if type(agirlik) not in (int, float) or not 0 < agirlik < 1:
+        raise ValueError(f"'agirlik' 0 ile 1 arasında (uçlar hariç) bir sayı olmalı: {agirlik!r}")
+    return float(agirlik)
+
+
+def tahta_boyutunu_oku(istek):
+    board_size = istek.get('board_size', 8)
+    en_az, en_fazla = TAHTA_SINIRLARI
+    if type(board_size) is not int or not en_az <= board_size <= en_fazla:
+        raise ValueError(f"'board_size' {en_az} ile {en_fazla} arasında bir tam sayı olmalı: {board_size!r}")
+    return board_size
+
+
+# "kareler" tahtadaki [x, y] tam sayı çiftlerinden oluşmalı ve gemi tipinin istediği sayıda olmalı;
+# hatalı yük oturuma dokunmadan (envanterden düşülmeden) reddedilir
+def kareleri_oku(istek, board_size):
+    tip = istek['tip']
+    if tip not in KARE_SAYILARI:
+        raise ValueError(f"Bilinmeyen gemi tipi: {tip}")
+    kareler = istek['kareler']
+    if not isinstance(kareler, list) or not all(
+            isinstance(k, list) and len(k) == 2 and all(type(v) is int and 0 <= v < board_size for v in k)
+            for k in kareler):
+        raise ValueError(f"'kareler' [x, y] çiftlerinden oluşmalı (0 <= x, y < {board_size})")
+    en_az, en_fazla = KARE_SAYILARI[tip]
+    if not en_az <= len(kareler) <= en_fazla:
+        adet = en_az if en_az == en_fazla else f"{en_az}-{en_fazla}"
+        raise ValueError(f"'{tip}' gemisi {adet} kare almalı: {len(kareler)}")
+    return [tuple(k) for k in kareler]
+
+
+class OyunSunucusu:
+    def __init__(self, toplayici):
+        self.toplayici = toplayici
+        self.oturum_sayisi = 0
+        self.aktif = 0
+
+    async def baglanti(self, okuyucu, yazici):
+        self.aktif += 1
+        oturum = None
+        try:
+            async for satir in okuyucu:
+                try:
+                    istek = json.loads(satir)
+                    if not isinstance(istek, dict):
+                        raise ValueError("istek bir JSON nesnesi olmalı")
+                    oturum, cevap = await self.isle(oturum, istek)
+                except (ValueError, KeyError, TypeError, IndexError) as e:
+                    cevap = {'hata': str(e)}
+                except Exception as e:
+                    # Arka uç ya da motor hatası: bağlantı düşürülmez, istemci hatayı cevapta görür
+                    cevap = {'hata': f"{type(e).__name__}: {e}"}
+                yazici.write(json.dumps(cevap, ensure_ascii=False).encode() + b"\n")
+                await yazici.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.aktif -= 1
+            yazici.close()
+
+    async def isle(self, oturum, istek):
+        komut = istek['komut']
+        if komut == 'yeni':
+            self.oturum_sayisi += 1
+            oturum = OyunOturumu(tahta_boyutunu_oku(istek), hedefleme=istek.get('hedefleme', 'rastgele'),
+                                 tohum=istek.get('tohum'))
+            return oturum, {'oturum': self.oturum_sayisi, 'tohum': oturum.tohum}
+        if komut == 'istatistik':
+            return oturum, {**self.toplayici.istatistikler(), 'aktif_oturum': self.aktif}
+        if komut == 'uyum':
+            return oturum, self.toplayici.uyum.ozet()
+        if komut == 'metrikler':
+            return oturum, {'metrikler': self.toplayici.uyum.prometheus()}
+        if oturum is None:
+            raise ValueError("önce 'yeni' komutuyla oturum açılmalı")
+
+        if komut == 'yerlestir':
+            kareler = kareleri_oku(istek, oturum.oyun.board_size)
+            if istek['tip'] == 'klasik':
+                tamam = oturum.yerlestir_klasik(*kareler[0])
+            elif istek['tip'] == 'hayalet':
+                tamam = oturum.yerlestir_hayalet(*kareler)
+            elif istek['tip'] == 'hileli':
+                tamam = oturum.yerlestir_hileli(*kareler, agirligi_oku(istek))
+            else:
+                genlikler = istek.get('genlikler')
+                if genlikler is not None and (not isinstance(genlikler, list) or len(genlikler) != len(kareler)):
+                    raise ValueError("'genlikler' kare sayısı kadar sayı içermeli")
+                tamam = oturum.yerlestir_coklu(kareler, genlikler)
+            return oturum, {'tamam': tamam, 'envanter': oturum.envanter}
+        if komut == 'rastgele_yerlestir':
+            oturum.rastgele_yerlestir(agirligi_oku(istek))
+            return oturum, {'tamam': True, 'envanter': oturum.envanter}
+        if komut == 'basla':
+            return oturum, {'tamam': oturum.savasi_baslat()}
+        if komut == 'ates':
+            return oturum, await self.ates(oturum)
+        if komut == 'durum':
+            return oturum, {'faz': oturum.faz, 'tur': oturum.tur, 'aktif_gemi': oturum.oyun.aktif_gemi_sayisi(),
+                            'kazanan': oturum.kazanan}
+        raise ValueError(f"Bilinmeyen komut: {komut}")
+
+    # Kuantum isabetlerinde ölçüm toplayıcıya bırakılır; diğer oturumlar bu arada ilerlemeye devam eder
+    async def ates(self, oturum):
+        hedef = oturum.hedef_sec()
+        if hedef is None:
+            if oturum.faz != "SAVUNMA":
+                return {'hata': "atış yapılamaz", 'faz': oturum.faz}
+            # Tahta doldu ama tur sınırına ulaşılmadı: filo hayatta kaldı (play_to_end ile aynı kural)
+            oturum.faz, oturum.kazanan = "OYUN_BITTI", "oyuncu"
+            return {'tur': oturum.tur, 'oyun_bitti': True, 'kazanan': oturum.kazanan}
+        _, veri = oturum.oyun.hedefteki_gemi(hedef)
+        coken_durum = None
+        if veri is not None and veri['tip'] != 'klasik':
+            coken_durum = await self.toplayici.olc(veri['tip'], olcum_parametresi(veri))
+        return asdict(oturum.cozumle(hedef, coken_durum))
+
+
+async def sunucu_calistir(host="127.0.0.1", port=8765, arka_uc="aer", pencere=0.02):
+    sunucu = OyunSunucusu(CokmeToplayici(arka_uc, pencere))
+    tcp = await asyncio.start_server(sunucu.baglanti, host, port)
+    async with tcp:
+        await tcp.serve_forever()
+
+
+# --- YEREL İSTEMCİ ---
+# Aynı anda çok sayıda oyunu sunucuya karşı sonuna kadar oynatır; yük ve toplama testi için
+async def _istek(okuyucu, yazici, **istek):
+    yazici.write(json.dumps(istek).encode() + b"\n")
+    await yazici.drain()
+    return json.loads(await okuyucu.readline())
+
+
+async def istemci_oyunu(host, port, tohum):
+    okuyucu, yazici = await asyncio.open_connection(host, port)
+    try:
+        await _istek(okuyucu, yazici, komut='yeni', tohum=tohum)
+        await _istek(okuyucu, yazici, komut='rastgele_yerlestir')
+        await _istek(okuyucu, yazici, komut='basla')
+        while True:
+            olay = await _istek(okuyucu, yazici, komut='ates')
+            if 'hata' in olay or olay['oyun_bitti']:
+                return olay
+    finally:
+        yazici.close()
+        await yazici.wait_closed()
+
+
+async def istemci_calistir(host="127.0.0.1", port=8765, oyun_sayisi=100, tohum=0):
+    rng = random.Random(tohum)
+    baslangic = time.perf_counter()
+    sonuclar = await asyncio.gather(*(istemci_oyunu(host, port, rng.getrandbits(63)) for _ in range(oyun_sayisi)))
+    sure = time.perf_counter() - baslangic
+    okuyucu, yazici = await asyncio.open_connection(host, port)
+    istatistik = await _istek(okuyucu, yazici, komut='istatistik')
+    yazici.close()
+    await yazici.wait_closed()
+    sistem = sum(s.get('kazanan') == 'sistem' for s in sonuclar)
+    return {'oyun': oyun_sayisi, 'sure_sn': sure, 'sistem_kazandi': sistem, **istatistik}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Çok oturumlu Kuantum Amiral Battı sunucusu")
+    parser.add_argument("mod", choices=["sunucu", "istemci", "yerel"],
+                        help="yerel: sunucu ve istemciyi aynı süreçte çalıştırır")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--arka-uc", default="aer", choices=["analitik", "aer"])
+    parser.add_argument("--pencere", type=float, default=0.02, help="toplama penceresi (sn)")
+    parser.add_argument("--oyun", type=int, default=100, help="istemcinin eşzamanlı oynatacağı oyun sayısı")
+    args = parser.parse_args()
+
+    if args.mod == "sunucu":
+        asyncio.run(sunucu_calistir(args.host, args.port, args.arka_uc, args.pencere))
+        return
+
+    async def yerel():
+        sunucu = asyncio.ensure_future(sunucu_calistir(args.host, args.port, args.arka_uc, args.pencere))
+        await asyncio.sleep(0.1)
+        try:
+            return await istemci_calistir(args.host, args.port, args.oyun)
+        finally:
+            sunucu.cancel()
+
+    sonuc = asyncio.run(yerel() if args.mod == "yerel" else istemci_calistir(args.host, args.port, args.oyun))
+    print(json.dumps(sonuc, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
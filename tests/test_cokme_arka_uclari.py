@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from cokme_arka_uclari import (ESDEGERLIK_DURUMLARI, AnalitikArkaUc, KonumDagilimi, KuantumHavuzu,
+                               esdegerlik_testi)
+
+ESIK = 0.001
+
+
+@pytest.mark.parametrize("tip, theta", ESDEGERLIK_DURUMLARI)
+def test_analitik_ve_aer_esdeger(tip, theta):
+    pytest.importorskip("qiskit_aer")
+    from cokme_arka_uclari import AerArkaUc
+    _, p = esdegerlik_testi(AnalitikArkaUc(seed=1), AerArkaUc(seed=2), tip, theta)
+    assert p > ESIK
+
+
+@pytest.mark.parametrize("tip, theta", ESDEGERLIK_DURUMLARI)
+def test_havuz_kaynagiyla_esdeger(tip, theta):
+    _, p = esdegerlik_testi(AnalitikArkaUc(seed=3), KuantumHavuzu(AnalitikArkaUc(seed=4), parti_boyutu=4096),
+                            tip, theta)
+    assert p > ESIK
+
+
+# Test gerçekten ayırt edebilmeli: 0.75 ağırlıklı hileli gemi hayaletle karıştırılırsa reddedilir
+def test_farkli_dagilim_reddedilir():
+    hileli = 2 * np.arccos(np.sqrt(0.75))
+
+    class YanlisAci(AnalitikArkaUc):
+        def olc_coklu(self, tip, theta, adet):
+            return super().olc_coklu('hayalet', None, adet)
+
+    _, p = esdegerlik_testi(AnalitikArkaUc(seed=5), YanlisAci(seed=6), 'hileli', hileli)
+    assert p < ESIK
+
+
+def test_coklu_konum_dagilimi_born_kuralina_uyar():
+    dagilim = KonumDagilimi([1, 1, 2, 0.5, 3])
+    adet = 200000
+    sayilar = np.bincount(AnalitikArkaUc(seed=7).olc_coklu('hileli', dagilim, adet), minlength=dagilim.k)
+    beklenen = dagilim.olasiliklar * adet
+    ki_kare = float(((sayilar - beklenen) ** 2 / beklenen).sum())
+    assert ki_kare < 18.47  # 4 serbestlik derecesi, p = 0.001
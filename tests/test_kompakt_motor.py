@@ -0,0 +1,85 @@
+import random
+
+import pytest
+
+from cokme_arka_uclari import AnalitikArkaUc, CokmeArkaUcu
+from kompakt_motor import KompaktGameManager
+from oyun_motoru import GameManager
+
+
+def _filo_kur(oyun, tohum):
+    rng = random.Random(tohum)
+    kareler = rng.sample([(x, y) for x in range(oyun.board_size) for y in range(oyun.board_size)], 12)
+    for kare in kareler[:4]:
+        oyun.gemi_yerlestir_klasik(*kare)
+    oyun.gemi_yerlestir_hayalet(kareler[4], kareler[5])
+    oyun.gemi_yerlestir_hayalet(kareler[6], kareler[7])
+    oyun.gemi_yerlestir_hileli(kareler[8], kareler[9], rng.uniform(0.1, 0.9))
+    # Üst üste binen konumlar: aynı karede iki gemi
+    oyun.gemi_yerlestir_hileli(kareler[10], kareler[0])
+    oyun.gemi_yerlestir_coklu([kareler[11], kareler[1]])
+
+
+def _oynat(sinif, tohum, hedefleme):
+    oyun = sinif(6, rng=random.Random(tohum), arka_uc=AnalitikArkaUc(seed=tohum), hedefleme=hedefleme)
+    oyun.uyum = None
+    _filo_kur(oyun, tohum)
+    adimlar = []
+    while oyun.aktif_gemi_sayisi() > 0:
+        hedef = oyun.qc_hedef_belirle()
+        if hedef is None:
+            break
+        adimlar.append((hedef, oyun.atis_cozumle(hedef), oyun.aktif_gemi_sayisi(), oyun.gemi_surumu))
+    return oyun, adimlar
+
+
+# Aynı tohumlarla GameManager ve KompaktGameManager atış atış aynı hedefleri, sonuçları ve filoyu üretir
+@pytest.mark.parametrize("hedefleme", ["rastgele", "isi_haritasi"])
+@pytest.mark.parametrize("tohum", range(20))
+def test_skaler_motorla_birebir(tohum, hedefleme):
+    skaler, skaler_adimlar = _oynat(GameManager, tohum, hedefleme)
+    kompakt, kompakt_adimlar = _oynat(KompaktGameManager, tohum, hedefleme)
+    assert kompakt_adimlar == skaler_adimlar
+    assert set(kompakt.vurulan_kareler) == skaler.vurulan_kareler
+    assert kompakt.hucre_indeksi == skaler.hucre_indeksi
+    kompakt_gemiler = kompakt.ships
+    for isim, veri in skaler.ships.items():
+        assert kompakt_gemiler[isim]['durum'] == veri['durum']
+        assert kompakt_gemiler[isim]['koordinatlar'] == veri['koordinatlar']
+
+
+class AralikDisiArkaUc(CokmeArkaUcu):
+    ad = "aralik_disi"
+
+    def olc(self, tip, theta=None):
+        return 2
+
+
+# Dışarıdan verilen sonuç da temel sınıftaki gibi sonuc_dogrula'dan geçer
+def test_disaridan_gelen_sonuc_dogrulanir():
+    oyun = KompaktGameManager(4, rng=random.Random(1), arka_uc=AralikDisiArkaUc())
+    oyun.uyum = None
+    oyun.gemi_yerlestir_hayalet((0, 0), (0, 1))
+    assert oyun.atis_cozumle((0, 0), coken_durum=5) in ('batti_kuantum', 'kurtuldu_kuantum')
+    assert oyun.aralik_disi_sonuc == 1
+
+
+def test_ucten_fazla_konumlu_hayalet_reddedilir():
+    oyun = KompaktGameManager(4, arka_uc=AnalitikArkaUc(seed=1))
+    with pytest.raises(ValueError):
+        oyun.gemi_yerlestir_hayalet((0, 0), (0, 1), (0, 2))
+    assert oyun.aktif_gemi_sayisi() == 0
+
+
+def test_filo_degisince_gemi_surumu_artar():
+    oyun = KompaktGameManager(4, rng=random.Random(2), arka_uc=AnalitikArkaUc(seed=2))
+    oyun.uyum = None
+    oyun.gemi_yerlestir_klasik(0, 0)
+    oyun.gemi_yerlestir_hayalet((1, 0), (1, 1))
+    surum = oyun.gemi_surumu
+    assert surum == 2
+    oyun.atis_cozumle((0, 0))
+    assert oyun.gemi_surumu > surum
+    surum = oyun.gemi_surumu
+    oyun.atis_cozumle((1, 0))
+    assert oyun.gemi_surumu > surum
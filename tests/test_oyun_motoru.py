@@ -0,0 +1,79 @@
+import threading
+import time
+
+from cokme_arka_uclari import AnalitikArkaUc, CokmeArkaUcu
+from oyun_motoru import BekleyenCozum, OyunOturumu
+from uyum import BornIzleyici
+
+
+class YavasArkaUc(CokmeArkaUcu):
+    ad = "yavas"
+
+    def __init__(self):
+        self.birak = threading.Event()
+        self.bitti = threading.Event()
+        self._yerel = threading.local()
+
+    def olc(self, tip, theta=None):
+        self.birak.wait(5)
+        self._yerel.is_no = "gec-is"
+        self.bitti.set()
+        return 1
+
+
+def _oturum(arka_uc):
+    oturum = OyunOturumu(4, tohum=1, arka_uc=arka_uc)
+    oturum.oyun.uyum = BornIzleyici()
+    oturum._yedek_arka_uc = AnalitikArkaUc(seed=2)
+    oturum.yerlestir_hayalet((0, 0), (0, 1))
+    return oturum
+
+
+# Zaman aşımıyla bırakılan uzak işin geç gelen sonucu uyum izleyicisine ve günlük kaynağına yazılmaz
+def test_birakilan_isin_gec_sonucu_kaydedilmez():
+    yavas = YavasArkaUc()
+    oturum = _oturum(yavas)
+    oyun = oturum.oyun
+    _, veri = oyun.hedefteki_gemi((0, 0))
+    bekleyen = BekleyenCozum(oturum, (0, 0), veri, zaman_asimi=0.0)
+    while not bekleyen.tamamlandi():
+        time.sleep(0.001)
+    assert bekleyen.yedege_gecti
+    oyun.gunluk = object()  # _son_kaynak yalnızca günlük varken yazılır
+    yavas.birak.set()
+    assert yavas.bitti.wait(5)
+    time.sleep(0.05)
+    assert oyun._son_kaynak is None
+    assert all(hucre.arka_uc != "yavas" for hucre in oyun.uyum.hucreler.values())
+    assert any(hucre.arka_uc == "analitik" for hucre in oyun.uyum.hucreler.values())
+
+
+def test_guncel_is_kaydedilir():
+    oturum = _oturum(AnalitikArkaUc(seed=3))
+    _, veri = oturum.oyun.hedefteki_gemi((0, 0))
+    bekleyen = BekleyenCozum(oturum, (0, 0), veri)
+    while not bekleyen.tamamlandi():
+        time.sleep(0.001)
+    assert not bekleyen.yedege_gecti
+    bekleyen.olay()
+    assert sum(h.n + len(h.tampon) for h in oturum.oyun.uyum.hucreler.values()) == 1
+
+
+class BozukArkaUc(CokmeArkaUcu):
+    ad = "bozuk"
+
+    def olc(self, tip, theta=None):
+        raise RuntimeError("QPU hatası")
+
+
+# Uzak ölçüm de yedek de başarısız olursa atış analitik örnekleyiciyle çözülür, hata saklanır
+def test_yedek_de_bozuksa_analitige_duser():
+    oturum = _oturum(BozukArkaUc())
+    oturum._yedek_arka_uc = BozukArkaUc()
+    _, veri = oturum.oyun.hedefteki_gemi((0, 0))
+    bekleyen = BekleyenCozum(oturum, (0, 0), veri)
+    while not bekleyen.tamamlandi():
+        time.sleep(0.001)
+    olay = bekleyen.olay()
+    assert isinstance(bekleyen.hata, RuntimeError)
+    assert olay.sonuc in ('batti_kuantum', 'kurtuldu_kuantum')
@@ -0,0 +1,57 @@
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+pytest.importorskip("qiskit")
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _calistir(betik):
+    return subprocess.run([sys.executable, "-c", textwrap.dedent(betik)], cwd=KOK, capture_output=True,
+                          timeout=300).returncode
+
+
+# Qiskit'i ilk içe aktaran iş parçacığı sonlandıktan sonra başka bir iş parçacığında transpile etmek
+# süreci SIGSEGV ile çökertir (arayüzdeki ısıtma iş parçacığı biter, ardından çökme iş parçacığı devre kurar).
+# Bu test başarısız olursa hata Qiskit'te giderilmiştir; qiskit_yukle'deki kalıcı iş parçacığı kaldırılabilir.
+def test_qiskit_sonlanan_is_parcacigindan_sonra_transpile_coker():
+    donus = _calistir("""
+        import threading
+
+        def ice_aktar():
+            import qiskit  # noqa: F401
+
+        def devre_kur():
+            from qiskit import QuantumCircuit, transpile
+            qc = QuantumCircuit(1, 1)
+            qc.h(0)
+            transpile(qc, basis_gates=['rz', 'sx', 'x', 'cx'])
+
+        for hedef in (ice_aktar, devre_kur):
+            t = threading.Thread(target=hedef)
+            t.start()
+            t.join()
+    """)
+    assert donus != 0
+
+
+def test_qiskit_yukle_ile_baska_is_parcacigi_devre_kurar():
+    pytest.importorskip("qiskit_aer")
+    donus = _calistir("""
+        import threading
+        import cokme_arka_uclari as c
+
+        def devre_kur():
+            c.DEVRE_ONBELLEGI.isit(c.AerArkaUc().simulator)
+            c.AerArkaUc(seed=1).olc_coklu('hileli', 0.7, 16)
+
+        for hedef in (c.qiskit_yukle, devre_kur, devre_kur):
+            t = threading.Thread(target=hedef)
+            t.start()
+            t.join()
+    """)
+    assert donus == 0
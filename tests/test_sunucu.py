@@ -0,0 +1,101 @@
+import asyncio
+import json
+
+import pytest
+
+from sunucu import CokmeToplayici, OyunSunucusu
+
+
+def _sunucu():
+    return OyunSunucusu(CokmeToplayici("analitik", uyum=None))
+
+
+def _isle(sunucu, oturum, **istek):
+    return asyncio.run(sunucu.isle(oturum, istek))
+
+
+@pytest.mark.parametrize("board_size", [1, 513, 10 ** 9, 8.0, "8", True, None, [8]])
+def test_gecersiz_tahta_boyutu_reddedilir(board_size):
+    with pytest.raises(ValueError, match="board_size"):
+        _isle(_sunucu(), None, komut='yeni', board_size=board_size)
+
+
+@pytest.mark.parametrize("agirlik", [0, 1, 2, -0.5, float('nan'), float('inf'), "0.5", True, None])
+def test_gecersiz_agirlik_reddedilir(agirlik):
+    sunucu = _sunucu()
+    oturum, _ = _isle(sunucu, None, komut='yeni', tohum=1)
+    with pytest.raises(ValueError, match="agirlik"):
+        _isle(sunucu, oturum, komut='yerlestir', tip='hileli', kareler=[[0, 0], [1, 1]], agirlik=agirlik)
+    with pytest.raises(ValueError, match="agirlik"):
+        _isle(sunucu, oturum, komut='rastgele_yerlestir', agirlik=agirlik)
+    # Reddedilen istek envanterden düşmez
+    assert oturum.envanter['hileli'] == 1 and not oturum.oyun.ships
+
+
+def test_gecerli_degerler_kabul_edilir():
+    sunucu = _sunucu()
+    oturum, cevap = _isle(sunucu, None, komut='yeni', board_size=5, tohum=1)
+    assert oturum.oyun.board_size == 5
+    _, cevap = _isle(sunucu, oturum, komut='yerlestir', tip='hileli', kareler=[[0, 0], [1, 1]], agirlik=0.3)
+    assert cevap['tamam']
+
+
+# Toplu gönderim bozulursa istekler tek tek ölçülür; ölçülemeyen istek yedeğe düşer, diğerleri etkilenmez
+def test_toplu_hata_oturumlara_yayilmaz():
+    from cokme_arka_uclari import AnalitikArkaUc
+
+    class Bozuk(AnalitikArkaUc):
+        ad = "bozuk"
+
+        def olc_toplu(self, istekler):
+            raise RuntimeError("QPU hatası")
+
+        def olc(self, tip, theta=None):
+            if theta == 1.0:
+                raise RuntimeError("bozuk devre")
+            return super().olc(tip, theta)
+
+    toplayici = CokmeToplayici(Bozuk(seed=1), pencere=0.01, uyum=None)
+
+    async def calistir():
+        return await asyncio.gather(*(toplayici.olc('hileli', theta) for theta in (0.5, 1.0, 2.0)))
+
+    bitler = asyncio.run(calistir())
+    assert all(bit in (0, 1) for bit in bitler)
+    istatistik = toplayici.istatistikler()
+    assert istatistik['basarisiz_gonderim'] == 1 and istatistik['yedek_olcum'] == 1
+
+
+def test_arka_uc_hatasi_baglantiyi_dusurmez():
+    from cokme_arka_uclari import CokmeArkaUcu
+
+    class Patlayan(CokmeArkaUcu):
+        ad = "patlayan"
+
+        def olc_toplu(self, istekler):
+            raise RuntimeError("QPU hatası")
+
+        def olc(self, tip, theta=None):
+            raise RuntimeError("QPU hatası")
+
+    sunucu = OyunSunucusu(CokmeToplayici(Patlayan(), pencere=0.01, uyum=None, yedek=Patlayan()))
+
+    async def oyna():
+        tcp = await asyncio.start_server(sunucu.baglanti, "127.0.0.1", 0)
+        port = tcp.sockets[0].getsockname()[1]
+        okuyucu, yazici = await asyncio.open_connection("127.0.0.1", port)
+        cevaplar = []
+        for istek in ['{"komut": "yeni", "tohum": 1, "board_size": 4}', '{"komut": "rastgele_yerlestir"}',
+                      '{"komut": "basla"}'] + ['{"komut": "ates"}'] * 16 + ['{"komut": "durum"}']:
+            yazici.write(istek.encode() + b"\n")
+            await yazici.drain()
+            cevaplar.append(json.loads(await okuyucu.readline()))
+        yazici.close()
+        await yazici.wait_closed()
+        tcp.close()
+        await tcp.wait_closed()
+        return cevaplar
+
+    cevaplar = asyncio.run(oyna())
+    assert any('RuntimeError' in c.get('hata', '') for c in cevaplar)
+    assert 'faz' in cevaplar[-1]
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from gunluk import KAZANAN_KODLARI
+from toplu_motor import TopluOyunlar, dogrula
+
+
+# Toplu motorun her oyunu skaler motorda aynı filo, hedefler ve bitlerle atış atış yeniden oynatılır;
+# 5x5 tahtada tur sınırı tahtadan büyük olduğundan tahtanın dolduğu oyunlar da denenir
+@pytest.mark.parametrize("hedefleme", ["rastgele", "isi_haritasi"])
+@pytest.mark.parametrize("board_size, max_tur, agirlik", [(8, 30, 0.75), (5, 40, 0.9)])
+def test_skaler_motorla_birebir(hedefleme, board_size, max_tur, agirlik):
+    assert dogrula(300, board_size, max_tur, hedefleme=hedefleme, agirlik=agirlik, tohum=1) == []
+
+
+def test_tum_oyunlar_biter():
+    toplu = TopluOyunlar(1000, tohum=2)
+    toplu.rastgele_yerlestir()
+    toplu.oynat()
+    assert not np.any(toplu.kazanan == KAZANAN_KODLARI[None])
+    assert toplu.ozet()['biten_oyun'] == 1000
+
+
+def test_ayni_tohum_ayni_sonuc():
+    ozetler = []
+    for _ in range(2):
+        toplu = TopluOyunlar(500, hedefleme="isi_haritasi", tohum=3)
+        toplu.rastgele_yerlestir()
+        ozetler.append(toplu.oynat().ozet())
+    assert ozetler[0] == ozetler[1]
+
+
+def test_bilinmeyen_hedefleme():
+    with pytest.raises(ValueError):
+        TopluOyunlar(1, hedefleme="yok")
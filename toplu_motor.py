@@ -0,0 +1,290 @@
+import argparse
+import time
+
+import numpy as np
+
+from gunluk import BIT_YOK, KAZANAN_KODLARI, SONUC_KODLARI
+from kompakt_motor import GemiTipi, TIP_ADLARI
+from oyun_motoru import MAX_TUR, VARSAYILAN_ENVANTER, IsiHaritasi, OyunOturumu
+
+
+# --- KİLİT ADIMLI TOPLU MOTOR ---
+# B bağımsız oyun aynı anda, tur tur ilerletilir. Vurulan kareler (B, N, N) maskesinde, filo (B, S) dizilerinde
+# tutulur (S: filodaki gemi sayısı; her gemi iki kare kodu, klasik gemide ikisi aynı kare). Hedef seçimi, isabet
+# çözümleme, Born çökmesi (H ve θ açılı Ry) ve kazanma/tur sınırı kontrolleri her turda süren oyunların hepsi
+# için tek dizi işlemleriyle yapılır; Python döngüsü oyun başına değil tur başınadır.
+# Kurallar GameManager.atis_cozumle ile birebir aynıdır: bir karede birden fazla aktif gemi varsa yerleştirme
+# sırasıyla ilki vurulur, kurtulan kuantum gemisi çöktüğü karede klasiğe döner. Isı haritası da skaler motorla
+# aynı sırada aynı toplama/çıkarmaları yapar; en olası kare seçimi bit düzeyinde aynıdır. Çok konumlu gemiler
+# desteklenmez; onlar skaler motorla oynanır.
+class TopluOyunlar:
+    # kaydet: her turun hedefi, çöken biti ve sonucu (tur, oyun) dizilerinde tutulur (dogrula için)
+    def __init__(self, adet, board_size=8, max_tur=MAX_TUR, envanter=None, hedefleme="rastgele", tohum=None,
+                 kaydet=False):
+        if hedefleme not in ("rastgele", "isi_haritasi"):
+            raise ValueError(f"Bilinmeyen hedefleme stratejisi: {hedefleme}")
+        self.adet = adet
+        self.board_size = board_size
+        self.max_tur = max_tur
+        self.envanter = dict(envanter or VARSAYILAN_ENVANTER)
+        self.hedefleme = hedefleme
+        self.rng = np.random.default_rng(tohum)
+
+        # Filo sırası OyunOturumu.rastgele_yerlestir ile aynı: önce klasikler, sonra hayaletler, sonra hileliler
+        self.ilk_tip = np.repeat([GemiTipi.KLASIK, GemiTipi.HAYALET, GemiTipi.HILELI],
+                                 [self.envanter['klasik'], self.envanter['hayalet'], self.envanter['hileli']])
+        gemi = len(self.ilk_tip)
+        self.vurulan = np.zeros((adet, board_size, board_size), dtype=bool)
+        self._vurulan = self.vurulan.reshape(adet, -1)
+        self.konum = np.zeros((adet, gemi, 2), dtype=np.int32)
+        self.tip = np.broadcast_to(self.ilk_tip.astype(np.int8), (adet, gemi)).copy()
+        self.aktif = np.zeros((adet, gemi), dtype=bool)
+        self.agirlik = np.ones((adet, gemi), dtype=np.float64)     # ilk konumun olasılığı (ısı haritası)
+        self.sifir = np.ones((adet, gemi), dtype=np.float64)       # |0> ölçme olasılığı (çökme)
+        self.aktif_adedi = np.zeros(adet, dtype=np.int32)
+        self.tur = np.zeros(adet, dtype=np.int32)
+        self.kazanan = np.zeros(adet, dtype=np.int8)               # KAZANAN_KODLARI
+        self.skor = np.zeros((adet, board_size * board_size)) if hedefleme == "isi_haritasi" else None
+
+        self.kaydet = kaydet
+        if kaydet:
+            self.hedefler = np.full((max_tur, adet), -1, dtype=np.int32)
+            self.bitler = np.full((max_tur, adet), BIT_YOK, dtype=np.uint8)
+            self.sonuclar = np.full((max_tur, adet), -1, dtype=np.int8)
+
+    # --- YERLEŞTİRME ---
+    # kareler: (B, K) kare kodları (x * board_size + y); filoyu_kur gibi tüketilir: klasiğe bir, kuantuma iki kare
+    def yerlestir(self, kareler, agirlik=0.75):
+        kareler = np.asarray(kareler, dtype=np.int32)
+        hucre = 0
+        theta = 2 * np.arccos(np.sqrt(agirlik))
+        for s, tip in enumerate(self.ilk_tip):
+            if tip == GemiTipi.KLASIK:
+                self.konum[:, s] = kareler[:, hucre, None]
+                hucre += 1
+            else:
+                self.konum[:, s] = kareler[:, hucre:hucre + 2]
+                hucre += 2
+            if tip == GemiTipi.HAYALET:
+                self.agirlik[:, s] = self.sifir[:, s] = 0.5
+            elif tip == GemiTipi.HILELI:
+                self.agirlik[:, s] = agirlik
+                self.sifir[:, s] = np.cos(theta / 2) ** 2
+        self.aktif[:] = True
+        self.aktif_adedi[:] = len(self.ilk_tip)
+        if self.kaydet:
+            self.konum_ilk = self.konum.copy()
+
+        if self.skor is not None:
+            satirlar = np.arange(self.adet)
+            for s, tip in enumerate(self.ilk_tip):
+                self.skor[satirlar, self.konum[:, s, 0]] += self.agirlik[:, s]
+                if tip != GemiTipi.KLASIK:
+                    self.skor[satirlar, self.konum[:, s, 1]] += 1 - self.agirlik[:, s]
+
+    def rastgele_yerlestir(self, agirlik=0.75):
+        kare_sayisi = len(self.ilk_tip) + np.count_nonzero(self.ilk_tip != GemiTipi.KLASIK)
+        self.yerlestir(self.rng.integers(0, self.board_size ** 2, (self.adet, kare_sayisi)), agirlik)
+
+    # --- HEDEF SEÇİMİ ---
+    # Vurulmamış karelerden eşit olasılıklı: çakışan çekilişler yalnızca o oyunlar için yenilenir (reddetme)
+    def _rastgele_hedef(self, oyunlar):
+        hedef = self.rng.integers(0, self.board_size ** 2, len(oyunlar))
+        cakisma = self._vurulan[oyunlar, hedef]
+        while cakisma.any():
+            hedef[cakisma] = self.rng.integers(0, self.board_size ** 2, np.count_nonzero(cakisma))
+            cakisma[cakisma] = self._vurulan[oyunlar[cakisma], hedef[cakisma]]
+        return hedef
+
+    # Isı haritasında satır sıralı ilk en büyük kare; harita boşsa (<= ESIK) rastgele seçime düşülür
+    def _hedef_sec(self, oyunlar):
+        if self.skor is None:
+            return self._rastgele_hedef(oyunlar)
+        skor = self.skor[oyunlar]
+        hedef = skor.argmax(axis=1)
+        bos = skor[np.arange(len(oyunlar)), hedef] <= IsiHaritasi.ESIK
+        if bos.any():
+            hedef[bos] = self._rastgele_hedef(oyunlar[bos])
+        return hedef
+
+    # --- TUR ---
+    # Süren her oyunda bir atış yapar; ilerleyen oyun sayısını döndürür (0: hepsi bitti)
+    def adim(self):
+        oyunlar = np.flatnonzero(self.kazanan == KAZANAN_KODLARI[None])
+        # Tahta doldu ama tur sınırına ulaşılmadı: filo hayatta kaldı (play_to_end ile aynı kural)
+        dolu = self.tur[oyunlar] >= self.board_size ** 2
+        if dolu.any():
+            self.kazanan[oyunlar[dolu]] = KAZANAN_KODLARI['oyuncu']
+            oyunlar = oyunlar[~dolu]
+        if not len(oyunlar):
+            return 0
+
+        hedef = self._hedef_sec(oyunlar)
+        self._vurulan[oyunlar, hedef] = True
+        if self.skor is not None:
+            self.skor[oyunlar, hedef] = -np.inf
+        tur = self.tur[oyunlar]
+        self.tur[oyunlar] = tur + 1
+
+        # Hedef karede bulunabilecek ilk aktif gemi (yerleştirme sırasıyla)
+        konum = self.konum[oyunlar]
+        eslesme = self.aktif[oyunlar] & ((konum[:, :, 0] == hedef[:, None]) | (konum[:, :, 1] == hedef[:, None]))
+        vuruldu = eslesme.any(axis=1)
+        sonuc = np.full(len(oyunlar), SONUC_KODLARI['karavana'], dtype=np.int8)
+        bit = np.full(len(oyunlar), BIT_YOK, dtype=np.uint8)
+
+        v = np.flatnonzero(vuruldu)
+        o, g, h = oyunlar[v], eslesme[v].argmax(axis=1), hedef[v]
+        klasik = self.tip[o, g] == GemiTipi.KLASIK
+
+        # Klasik isabet: gemi batar
+        ko, kg = o[klasik], g[klasik]
+        self.aktif[ko, kg] = False
+        if self.skor is not None:
+            self.skor[ko, self.konum[ko, kg, 0]] -= 1.0
+        sonuc[v[klasik]] = SONUC_KODLARI['batti_klasik']
+
+        # Kuantum isabet: Born kuralıyla çökme; çöktüğü kare hedefse batar, değilse orada klasiğe döner
+        kuantum = ~klasik
+        qo, qg, qh = o[kuantum], g[kuantum], h[kuantum]
+        coken = (self.rng.random(len(qo)) >= self.sifir[qo, qg]).astype(np.uint8)
+        gercek = self.konum[qo, qg, coken]
+        if self.skor is not None:
+            self.skor[qo, self.konum[qo, qg, 0]] -= self.agirlik[qo, qg]
+            self.skor[qo, self.konum[qo, qg, 1]] -= 1 - self.agirlik[qo, qg]
+        batti = gercek == qh
+        self.aktif[qo[batti], qg[batti]] = False
+        # Batan da kurtulan da tek kareye (çöktüğü kare) iner
+        self.konum[qo, qg] = gercek[:, None]
+        kurtulan_o, kurtulan_g = qo[~batti], qg[~batti]
+        self.tip[kurtulan_o, kurtulan_g] = GemiTipi.KLASIK
+        self.agirlik[kurtulan_o, kurtulan_g] = self.sifir[kurtulan_o, kurtulan_g] = 1.0
+        if self.skor is not None:
+            self.skor[kurtulan_o, gercek[~batti]] += 1.0
+        vq = v[kuantum]
+        sonuc[vq] = np.where(batti, SONUC_KODLARI['batti_kuantum'], SONUC_KODLARI['kurtuldu_kuantum'])
+        bit[vq] = coken
+
+        # Kazanma / tur sınırı (OyunOturumu.cozumle sırası: önce filo, sonra tur)
+        self.aktif_adedi[oyunlar] -= (sonuc == SONUC_KODLARI['batti_klasik']) | (sonuc == SONUC_KODLARI['batti_kuantum'])
+        kalan = self.aktif_adedi[oyunlar]
+        self.kazanan[oyunlar] = np.where(kalan == 0, KAZANAN_KODLARI['sistem'],
+                                         np.where(tur + 1 >= self.max_tur, KAZANAN_KODLARI['oyuncu'],
+                                                  KAZANAN_KODLARI[None]))
+
+        if self.kaydet:
+            self.hedefler[tur, oyunlar] = hedef
+            self.bitler[tur, oyunlar] = bit
+            self.sonuclar[tur, oyunlar] = sonuc
+        return len(oyunlar)
+
+    def oynat(self):
+        while self.adim():
+            pass
+        return self
+
+    # --- ÖZET ---
+    def ozet(self):
+        bitti = self.kazanan != KAZANAN_KODLARI[None]
+        sonuc = {
+            'oyun': self.adet,
+            'biten_oyun': int(bitti.sum()),
+            'sistem_kazanma_orani': float(np.mean(self.kazanan == KAZANAN_KODLARI['sistem'])),
+            'ortalama_tur': float(self.tur.mean()),
+        }
+        # İlk tipe göre hayatta kalma oranı (kurtulan kuantum gemileri klasiğe dönmüş olsa da ilk tipinde sayılır)
+        for tip, ad in TIP_ADLARI.items():
+            sutunlar = self.ilk_tip == tip
+            if sutunlar.any():
+                sonuc[f'{ad}_hayatta'] = float(self.aktif[:, sutunlar].mean())
+        return sonuc
+
+
+# --- SKALER MOTORLA DOĞRULAMA ---
+# Toplu motorun her oyunu aynı filo, aynı hedefler ve aynı çöken bitlerle OyunOturumu üzerinde yeniden oynatılır.
+# Her atışın sonucu, oyunun kazananı/tur sayısı ve gemilerin son durumu karşılaştırılır; ısı haritası
+# stratejisinde skaler haritanın seçtiği kare de toplu motorunkiyle aynı olmalıdır. Uyuşmazlıkların listesi döner.
+def dogrula(adet=2000, board_size=8, max_tur=MAX_TUR, envanter=None, hedefleme="rastgele", agirlik=0.75, tohum=0):
+    toplu = TopluOyunlar(adet, board_size, max_tur, envanter, hedefleme, tohum, kaydet=True)
+    toplu.rastgele_yerlestir(agirlik)
+    toplu.oynat()
+
+    kare = lambda kod: divmod(int(kod), board_size)
+    uyusmazliklar = []
+    for b in range(adet):
+        oturum = OyunOturumu(board_size, max_tur=max_tur, envanter=toplu.envanter, hedefleme=hedefleme, tohum=b)
+        oyun = oturum.oyun
+        for s, tip in enumerate(toplu.ilk_tip):
+            k1, k2 = kare(toplu.konum_ilk[b, s, 0]), kare(toplu.konum_ilk[b, s, 1])
+            if tip == GemiTipi.KLASIK:
+                oturum.yerlestir_klasik(*k1)
+            elif tip == GemiTipi.HAYALET:
+                oturum.yerlestir_hayalet(k1, k2)
+            else:
+                oturum.yerlestir_hileli(k1, k2, agirlik)
+        oturum.savasi_baslat()
+
+        for t in range(toplu.tur[b]):
+            hedef = kare(toplu.hedefler[t, b])
+            if oyun.isi_haritasi is not None:
+                beklenen = oyun.isi_haritasi.en_olasi()
+                if beklenen is not None and beklenen != hedef:
+                    uyusmazliklar.append((b, t, 'hedef', beklenen, hedef))
+                    break
+            oyun._hedefi_isaretle(hedef)
+            bit = int(toplu.bitler[t, b])
+            olay = oturum.cozumle(hedef, None if bit == BIT_YOK else bit)
+            if SONUC_KODLARI[olay.sonuc] != toplu.sonuclar[t, b]:
+                uyusmazliklar.append((b, t, 'sonuc', olay.sonuc, int(toplu.sonuclar[t, b])))
+                break
+        else:
+            if oturum.faz == "SAVUNMA" and oturum.tur >= board_size ** 2:
+                oturum.faz, oturum.kazanan = "OYUN_BITTI", "oyuncu"
+            if KAZANAN_KODLARI[oturum.kazanan] != toplu.kazanan[b] or oturum.tur != toplu.tur[b]:
+                uyusmazliklar.append((b, None, 'kazanan', (oturum.kazanan, oturum.tur),
+                                      (int(toplu.kazanan[b]), int(toplu.tur[b]))))
+                continue
+            for s, veri in enumerate(oyun.ships.values()):
+                beklenen = (veri['durum'] == 'aktif', veri['tip'], veri['koordinatlar'][0])
+                gelen = (bool(toplu.aktif[b, s]), TIP_ADLARI[GemiTipi(toplu.tip[b, s])], kare(toplu.konum[b, s, 0]))
+                if beklenen != gelen:
+                    uyusmazliklar.append((b, None, 'gemi', beklenen, gelen))
+                    break
+    return uyusmazliklar
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Kilit adımlı toplu oyun motoru")
+    parser.add_argument("--oyun", type=int, default=1_000_000, help="toplam oyun sayısı")
+    parser.add_argument("--parti", type=int, default=100_000, help="aynı anda ilerletilen oyun sayısı")
+    parser.add_argument("--boyut", type=int, default=8)
+    parser.add_argument("--hedefleme", choices=["rastgele", "isi_haritasi"], default="rastgele")
+    parser.add_argument("--agirlik", type=float, default=0.75)
+    parser.add_argument("--tohum", type=int, default=0)
+    parser.add_argument("--dogrula", type=int, default=0, metavar="N",
+                        help="önce N oyunu skaler motorla atış atış karşılaştır")
+    args = parser.parse_args()
+
+    if args.dogrula:
+        for hedefleme in ("rastgele", "isi_haritasi"):
+            hatalar = dogrula(args.dogrula, args.boyut, hedefleme=hedefleme, agirlik=args.agirlik, tohum=args.tohum)
+            print(f"doğrulama {hedefleme:<13} {args.dogrula} oyun  "
+                  f"{'GEÇTİ' if not hatalar else f'{len(hatalar)} UYUŞMAZLIK, ilki: {hatalar[0]}'}")
+
+    baslangic = time.perf_counter()
+    tohumlar = np.random.SeedSequence(args.tohum).spawn((args.oyun + args.parti - 1) // args.parti)
+    sistem = tur = 0
+    for i, tohum in enumerate(tohumlar):
+        adet = min(args.parti, args.oyun - i * args.parti)
+        toplu = TopluOyunlar(adet, args.boyut, hedefleme=args.hedefleme, tohum=tohum)
+        toplu.rastgele_yerlestir(args.agirlik)
+        toplu.oynat()
+        sistem += int(np.count_nonzero(toplu.kazanan == KAZANAN_KODLARI['sistem']))
+        tur += int(toplu.tur.sum())
+    sure = time.perf_counter() - baslangic
+    print(f"{args.oyun} oyun, {sure:.2f} sn, {args.oyun / sure * 60:,.0f} oyun/dk  "
+          f"sistem kazandı %{sistem / args.oyun * 100:.2f}  ortalama tur {tur / args.oyun:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+import argparse
+import json
+import multiprocessing
+import random
+import time
+from itertools import product
+
+import numpy as np
+
+from gunluk import KAZANAN_KODLARI
+from kompakt_motor import GemiTipi
+from oyun_motoru import MAX_TUR, VARSAYILAN_ENVANTER, OyunOturumu
+from toplu_motor import TopluOyunlar
+
+
+# --- YERLEŞTİRME STRATEJİLERİ ---
+# Her strateji, filoyu kurmaya yetecek kadar kare üreten bir yineleyici döndürür.
+# Önce klasik gemiler tek kareyle, sonra hayalet ve hileli gemiler ikişer kareyle yerleştirilir.
+def _rastgele(rng, boyut, adet):
+    while True:
+        yield rng.randrange(boyut), rng.randrange(boyut)
+
+
+def _dagitik(rng, boyut, adet):
+    # Hiçbir iki konum aynı kareye düşmez
+    for kod in rng.sample(range(boyut * boyut), min(adet, boyut * boyut)):
+        yield divmod(kod, boyut)
+    yield from _rastgele(rng, boyut, adet)
+
+
+def _kenar(rng, boyut, adet):
+    kareler = [(x, y) for x in range(boyut) for y in range(boyut) if x in (0, boyut - 1) or y in (0, boyut - 1)]
+    while True:
+        yield rng.choice(kareler)
+
+
+def _merkez(rng, boyut, adet):
+    bas, son = boyut // 4, boyut - boyut // 4
+    while True:
+        yield rng.randrange(bas, son), rng.randrange(bas, son)
+
+
+YERLESTIRME_STRATEJILERI = {
+    'rastgele': _rastgele,
+    'dagitik': _dagitik,
+    'kenar': _kenar,
+    'merkez': _merkez,
+}
+
+GEMI_TIPLERI = ('klasik', 'hayalet', 'hileli')
+
+
+# Toplu motor için aynı stratejiler: (oyun, adet) boyutlu kare kodu (x * boyut + y) dizisi
+def _toplu_rastgele(rng, boyut, adet, oyun):
+    return rng.integers(0, boyut * boyut, (oyun, adet))
+
+
+def _toplu_dagitik(rng, boyut, adet, oyun):
+    ayri = np.argsort(rng.random((oyun, boyut * boyut)), axis=1)[:, :adet]
+    if adet <= boyut * boyut:
+        return ayri
+    return np.concatenate([ayri, _toplu_rastgele(rng, boyut, adet - boyut * boyut, oyun)], axis=1)
+
+
+def _toplu_kenar(rng, boyut, adet, oyun):
+    kareler = np.array([x * boyut + y for x in range(boyut) for y in range(boyut)
+                        if x in (0, boyut - 1) or y in (0, boyut - 1)])
+    return kareler[rng.integers(0, len(kareler), (oyun, adet))]
+
+
+def _toplu_merkez(rng, boyut, adet, oyun):
+    bas, son = boyut // 4, boyut - boyut // 4
+    return rng.integers(bas, son, (oyun, adet)) * boyut + rng.integers(bas, son, (oyun, adet))
+
+
+TOPLU_STRATEJILER = {
+    'rastgele': _toplu_rastgele,
+    'dagitik': _toplu_dagitik,
+    'kenar': _toplu_kenar,
+    'merkez': _toplu_merkez,
+}
+
+
+def filoyu_kur(oturum, strateji, agirlik):
+    envanter = oturum.envanter
+    adet = envanter['klasik'] + 2 * (envanter['hayalet'] + envanter['hileli'])
+    kareler = YERLESTIRME_STRATEJILERI[strateji](oturum.rng, oturum.oyun.board_size, adet)
+    while envanter['klasik'] > 0:
+        oturum.yerlestir_klasik(*next(kareler))
+    while envanter['hayalet'] > 0:
+        oturum.yerlestir_hayalet(next(kareler), next(kareler))
+    while envanter['hileli'] > 0:
+        oturum.yerlestir_hileli(next(kareler), next(kareler), agirlik)
+
+
+# --- İŞÇİ ---
+# Her görev tek bir (strateji, agirlik) hücresinden bir parti oyundur. İşçi, görevle gelen SeedSequence
+# çocuğundan kendi rastgelelik akışını kurar ve yerel analitik arka uçla oynar; ana sürece oyun başına
+# değil parti başına birkaç tamsayılık bir özet döner.
+def parti_oyna(gorev):
+    strateji, agirlik, adet, tohum_dizisi, ayarlar = gorev
+    if ayarlar.get('motor') == 'toplu':
+        return toplu_parti_oyna(gorev)
+    rng = random.Random(int(tohum_dizisi.generate_state(1, np.uint64)[0]))
+    tip_sirasi = {tip.capitalize(): i for i, tip in enumerate(GEMI_TIPLERI)}
+    gemiler = np.zeros((len(GEMI_TIPLERI), 2), dtype=np.int64)  # [yerleşen, hayatta kalan]
+    hayatta = tur = 0
+    for _ in range(adet):
+        oturum = OyunOturumu(ayarlar['board_size'], max_tur=ayarlar['max_tur'], envanter=ayarlar['envanter'],
+                             hedefleme=ayarlar['hedefleme'], tohum=rng.getrandbits(63))
+        filoyu_kur(oturum, strateji, agirlik)
+        oturum.savasi_baslat()
+        oturum.play_to_end()
+        hayatta += oturum.kazanan == "oyuncu"
+        tur += oturum.tur
+        for isim, veri in oturum.oyun.ships.items():
+            # Kurtulan kuantum gemileri klasiğe döner; ilk tip isim önekinden okunur
+            i = tip_sirasi[isim.split('_', 1)[0]]
+            gemiler[i, 0] += 1
+            gemiler[i, 1] += veri['durum'] == 'aktif'
+    return strateji, agirlik, adet, hayatta, tur, gemiler
+
+
+# Partinin bütün oyunları kilit adımlı toplu motorda birlikte ilerletilir; özet aynı biçimdedir
+def toplu_parti_oyna(gorev):
+    strateji, agirlik, adet, tohum_dizisi, ayarlar = gorev
+    toplu = TopluOyunlar(adet, ayarlar['board_size'], ayarlar['max_tur'], ayarlar['envanter'],
+                         ayarlar['hedefleme'], tohum=tohum_dizisi)
+    kare_sayisi = len(toplu.ilk_tip) + int(np.count_nonzero(toplu.ilk_tip != GemiTipi.KLASIK))
+    toplu.yerlestir(TOPLU_STRATEJILER[strateji](toplu.rng, toplu.board_size, kare_sayisi, adet), agirlik)
+    toplu.oynat()
+    gemiler = np.zeros((len(GEMI_TIPLERI), 2), dtype=np.int64)
+    for i in range(len(GEMI_TIPLERI)):
+        sutunlar = toplu.ilk_tip == i
+        gemiler[i] = adet * np.count_nonzero(sutunlar), np.count_nonzero(toplu.aktif[:, sutunlar])
+    hayatta = int(np.count_nonzero(toplu.kazanan == KAZANAN_KODLARI['oyuncu']))
+    return strateji, agirlik, adet, hayatta, int(toplu.tur.sum()), gemiler
+
+
+# --- TURNUVA ---
+class TurnuvaSonucu:
+    def __init__(self):
+        self.hucreler = {}
+        self.oyun = 0
+
+    def ekle(self, strateji, agirlik, adet, hayatta, tur, gemiler):
+        hucre = self.hucreler.setdefault((strateji, agirlik), {'oyun': 0, 'hayatta': 0, 'tur': 0,
+                                                               'gemiler': np.zeros_like(gemiler)})
+        hucre['oyun'] += adet
+        hucre['hayatta'] += hayatta
+        hucre['tur'] += tur
+        hucre['gemiler'] += gemiler
+        self.oyun += adet
+
+    def tablo(self):
+        satirlar = []
+        for (strateji, agirlik), h in sorted(self.hucreler.items()):
+            satir = {'strateji': strateji, 'agirlik': agirlik, 'oyun': h['oyun'],
+                     'filo_hayatta': h['hayatta'] / h['oyun'], 'ortalama_tur': h['tur'] / h['oyun']}
+            for i, tip in enumerate(GEMI_TIPLERI):
+                yerlesen, kalan = h['gemiler'][i]
+                satir[f'{tip}_hayatta'] = kalan / yerlesen if yerlesen else None
+            satirlar.append(satir)
+        return satirlar
+
+
+def gorevleri_olustur(stratejiler, agirliklar, oyun_sayisi, parti, tohum, ayarlar):
+    hucreler = list(product(stratejiler, agirliklar))
+    partiler = [(s, a, min(parti, oyun_sayisi - bas)) for s, a in hucreler for bas in range(0, oyun_sayisi, parti)]
+    # Görev başına bağımsız bir akış; işçi sayısından bağımsız olarak aynı tohum aynı sonuçları verir
+    cocuklar = np.random.SeedSequence(tohum).spawn(len(partiler))
+    return [(s, a, adet, cocuk, ayarlar) for (s, a, adet), cocuk in zip(partiler, cocuklar)]
+
+
+def turnuva_calistir(stratejiler=tuple(YERLESTIRME_STRATEJILERI), agirliklar=(0.75,), oyun_sayisi=10000,
+                     isci=None, parti=1000, tohum=0, board_size=8, max_tur=MAX_TUR, envanter=None,
+                     hedefleme="rastgele", ilerleme=None, motor="skaler"):
+    ayarlar = {'board_size': board_size, 'max_tur': max_tur, 'envanter': dict(envanter or VARSAYILAN_ENVANTER),
+               'hedefleme': hedefleme, 'motor': motor}
+    gorevler = gorevleri_olustur(stratejiler, agirliklar, oyun_sayisi, parti, tohum, ayarlar)
+    sonuc = TurnuvaSonucu()
+    isci = isci or multiprocessing.cpu_count()
+    if isci == 1:
+        for parti_sonucu in map(parti_oyna, gorevler):
+            sonuc.ekle(*parti_sonucu)
+            if ilerleme: ilerleme(sonuc)
+        return sonuc
+    with multiprocessing.Pool(isci) as havuz:
+        for parti_sonucu in havuz.imap_unordered(parti_oyna, gorevler):
+            sonuc.ekle(*parti_sonucu)
+            if ilerleme: ilerleme(sonuc)
+    return sonuc
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Filo yerleştirme stratejileri turnuvası")
+    parser.add_argument("--oyun", type=int, default=10000, help="strateji/agirlik hücresi başına oyun")
+    parser.add_argument("--stratejiler", nargs="+", choices=list(YERLESTIRME_STRATEJILERI),
+                        default=list(YERLESTIRME_STRATEJILERI))
+    parser.add_argument("--agirliklar", nargs="+", type=float, default=[0.75])
+    parser.add_argument("--isci", type=int, default=None, help="süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument("--parti", type=int, default=1000, help="görev başına oyun")
+    parser.add_argument("--tohum", type=int, default=0)
+    parser.add_argument("--max-tur", type=int, default=MAX_TUR)
+    parser.add_argument("--envanter", nargs=3, type=int, metavar=("KLASIK", "HAYALET", "HILELI"),
+                        default=list(VARSAYILAN_ENVANTER.values()))
+    parser.add_argument("--hedefleme", choices=["rastgele", "isi_haritasi"], default="rastgele")
+    parser.add_argument("--motor", choices=["skaler", "toplu"], default="skaler",
+                        help="toplu: partinin oyunları kilit adımlı NumPy motorunda birlikte oynanır")
+    parser.add_argument("--json", help="sonuç tablosunu bu dosyaya yaz")
+    args = parser.parse_args()
+
+    baslangic = time.perf_counter()
+    sonuc = turnuva_calistir(args.stratejiler, args.agirliklar, args.oyun, args.isci, args.parti, args.tohum,
+                             max_tur=args.max_tur, envanter=dict(zip(GEMI_TIPLERI, args.envanter)),
+                             hedefleme=args.hedefleme, motor=args.motor)
+    sure = time.perf_counter() - baslangic
+
+    print(f"{'STRATEJİ':<10}{'AĞIRLIK':>8}{'OYUN':>9}{'FİLO':>8}{'TUR':>7}{'KLASİK':>8}{'HAYALET':>9}{'HİLELİ':>8}")
+    tablo = sonuc.tablo()
+    for s in tablo:
+        oran = lambda v: f"{v:8.3f}" if v is not None else f"{'-':>8}"
+        print(f"{s['strateji']:<10}{s['agirlik']:>8.2f}{s['oyun']:>9}{s['filo_hayatta']:8.3f}{s['ortalama_tur']:7.1f}"
+              f"{oran(s['klasik_hayatta'])}{oran(s['hayalet_hayatta'])} {oran(s['hileli_hayatta'])}")
+    print(f"{sonuc.oyun} oyun, {sure:.1f} sn, {sonuc.oyun / sure:.0f} oyun/sn")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({'ayarlar': vars(args), 'sure_sn': sure, 'sonuclar': tablo}, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,343 @@
+import argparse
+import json
+import math
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+from cokme_arka_uclari import KonumDagilimi, arka_uc_olustur, sifir_olasiligi
+
+
+# --- P-DEĞERİ ---
+# Ki-kare kuyruk olasılığı, tam sayı serbestlik derecesi için kapalı biçimde (en fazla 63 terim):
+# çift derecede e^(-x/2) Σ (x/2)^i / i!, tek derecede erfc(√(x/2)) + √(2x/π) e^(-x/2) Σ x^(i-1) / (1·3···(2i-1))
+def ki_kare_p_degeri(ki_kare, serbestlik):
+    if serbestlik <= 0:
+        return 1.0
+    if math.isinf(ki_kare):
+        return 0.0
+    yari = ki_kare / 2
+    if serbestlik % 2 == 0:
+        terim = toplam = 1.0
+        for i in range(1, serbestlik // 2):
+            terim *= yari / i
+            toplam += terim
+        return min(1.0, math.exp(-yari) * toplam)
+    p = math.erfc(math.sqrt(yari))
+    if serbestlik > 1:
+        terim = toplam = 1.0
+        for i in range(2, (serbestlik + 1) // 2):
+            terim *= ki_kare / (2 * i - 1)
+            toplam += terim
+        p += math.sqrt(2 * ki_kare / math.pi) * math.exp(-yari) * toplam
+    return min(1.0, p)
+
+
+def ki_kare(gozlenen, olasiliklar, n):
+    if n <= 0:
+        return 0.0
+    toplam = 0.0
+    for o, p in zip(gozlenen, olasiliklar):
+        if p > 0:
+            toplam += (o - n * p) ** 2 / (n * p)
+        elif o > 0:
+            return math.inf   # Olasılığı sıfır olan sonuç gözlendi
+    return toplam
+
+
+# Havuzdan gelen sonuçlar, kaynağı görünür olsun diye "havuz:<kaynak>" adıyla ayrı izlenir
+def kaynak_adi(arka_uc):
+    ic = getattr(arka_uc, 'kaynak', None)
+    return arka_uc.ad if ic is None else f"havuz:{kaynak_adi(ic)}"
+
+
+# --- HÜCRE ---
+# Tek bir (arka uç, tip, θ / dağılım) için sayaçlar. Ham sonuç saklanmaz; kayıt yolu sonucu küçük bir tampona
+# ekler, tampon dolunca (izleyicinin kontrol aralığı) bincount ile sayaçlara katlanır:
+#   sayilar : başlangıçtan beri her konumun sayısı (toplam uyum testi)
+#   pencere : üstel ağırlıklı sayılar; en yeni ölçümün ağırlığı 1, 'yari_omur' ölçüm öncekininki 1/2 (kayma testi).
+#             Ağırlıklar geometrik olduğundan Kish etkin örneklem büyüklüğü yalnızca n'den hesaplanır
+#   aralik_disi : konum sayısını aşan sonuçlar (gürültülü QPU); testlere ve n'e katılmaz, ayrı sayılır
+class UyumHucresi:
+    __slots__ = ('arka_uc', 'tip', 'olasiliklar', 'sayilar', 'n', 'pencere', 'tampon', '_r', 'uyari_sayisi',
+                 'uyarida', 'aralik_disi')
+
+    def __init__(self, arka_uc, tip, olasiliklar, yari_omur):
+        self.arka_uc = arka_uc
+        self.tip = tip
+        self.olasiliklar = olasiliklar
+        self.sayilar = np.zeros(len(olasiliklar), dtype=np.int64)
+        self.n = 0
+        self.pencere = np.zeros(len(olasiliklar))
+        self.tampon = []
+        self._r = 0.5 ** (1 / yari_omur)
+        self.uyari_sayisi = 0
+        self.uyarida = False
+        self.aralik_disi = 0
+
+    # Bu katlamada görülen aralık dışı sonuç sayısını döndürür
+    def bosalt(self):
+        if not self.tampon:
+            return 0
+        tampon, self.tampon = self.tampon, []
+        sonuclar = np.asarray(tampon, dtype=np.intp)
+        k = len(self.olasiliklar)
+        gecerli = (sonuclar >= 0) & (sonuclar < k)
+        aralik_disi = len(sonuclar) - int(np.count_nonzero(gecerli))
+        if aralik_disi:
+            self.aralik_disi += aralik_disi
+            sonuclar = sonuclar[gecerli]
+        m = len(sonuclar)
+        self.sayilar += np.bincount(sonuclar, minlength=k)
+        agirliklar = self._r ** np.arange(m - 1, -1, -1, dtype=np.float64)
+        self.pencere = self.pencere * self._r ** m + np.bincount(sonuclar, weights=agirliklar, minlength=k)
+        self.n += m
+        return aralik_disi
+
+    @property
+    def serbestlik(self):
+        return sum(p > 0 for p in self.olasiliklar) - 1
+
+    def toplam_testi(self):
+        x = ki_kare(self.sayilar.tolist(), self.olasiliklar, self.n)
+        return x, ki_kare_p_degeri(x, self.serbestlik)
+
+    # (etkin örneklem, ki-kare, p-değeri); sayılar etkin örneklem büyüklüğüne ölçeklenir
+    def pencere_testi(self):
+        if self.n == 0:
+            return 0.0, 0.0, 1.0
+        r = self._r
+        w = (1 - r ** self.n) / (1 - r)
+        w2 = (1 - r ** (2 * self.n)) / (1 - r * r)
+        n_etkin = w * w / w2
+        gozlenen = (self.pencere * (n_etkin / w)).tolist()
+        x = ki_kare(gozlenen, self.olasiliklar, n_etkin)
+        return n_etkin, x, ki_kare_p_degeri(x, self.serbestlik)
+
+    def ozet(self):
+        self.bosalt()
+        toplam_ki, toplam_p = self.toplam_testi()
+        n_etkin, pencere_ki, pencere_p = self.pencere_testi()
+        return {
+            'arka_uc': self.arka_uc, 'tip': self.tip, 'beklenen': list(self.olasiliklar), 'n': self.n,
+            'gozlenen': (self.sayilar / self.n).tolist() if self.n else [0.0] * len(self.olasiliklar),
+            'ki_kare': toplam_ki, 'p_degeri': toplam_p,
+            'pencere_n': n_etkin, 'pencere_ki_kare': pencere_ki, 'pencere_p_degeri': pencere_p,
+            'uyari_sayisi': self.uyari_sayisi, 'uyarida': self.uyarida, 'aralik_disi': self.aralik_disi,
+        }
+
+
+# --- BORN KURALI UYUM İZLEYİCİSİ ---
+# GameManager.cokme_olc ve sunucunun toplu gönderimleri her çökme sonucunu buraya bildirir. Sonuçlar
+# (arka uç, tip, θ / KonumDagilimi) hücrelerinde sayılır; beklenen dağılım hücre ilk açılırken bir kez hesaplanır.
+# Kayıt yolu bir sözlük araması ve bir liste eklemesidir; kilit yalnızca hücre açılırken ve tampon katlanırken
+# alınır (katlama anına denk gelen eşzamanlı bir kayıt nadiren düşebilir, bu sonuçtan bağımsızdır). Kayma testi hücre başına her 'kontrol_araligi'
+# ölçümde bir, tampon sayaçlara katlanırken yapılır: pencere p-değeri 'esik'in altına düşer ve etkin örneklem
+# 'en_az' ölçümü geçerse uyarı verilir; uyarı, pencere p-değeri 'temiz_esik'in üstüne çıkana kadar tekrarlanmaz.
+# Konum sayısını aşan bir sonuç (gürültülü QPU) ayrıca sayılır; hücrenin ilk aralık dışı sonucunda bir uyarı verilir.
+# Hücre sayısı 'en_fazla_hucre' ile sınırlıdır, bellek ölçüm sayısından bağımsızdır; sınıra ilk ulaşıldığında
+# bir uyarı verilir, sonrasında izlenemeyen ölçümler 'izlenmeyen' ile sayılır.
+# θ anahtarda 'theta_basamak' ondalığa yuvarlanır (KuantumHavuzu._anahtar gibi; tam sayı adım olarak tutulur): istemcilerin seçtiği sürekli
+# ağırlıklar sınırlı sayıda hücrede toplanır. Beklenen dağılım yuvarlanmış θ'dan hesaplanır; 2 basamakta
+# |Δp0| <= sin θ · Δθ / 2 <= 0.0025. Sonlu olmayan θ (NaN, ±inf) hücre açmaz, 'gecersiz_theta' ile sayılır.
+class BornIzleyici:
+    def __init__(self, yari_omur=500, esik=1e-6, temiz_esik=0.01, en_az=200, kontrol_araligi=64,
+                 en_fazla_hucre=4096, theta_basamak=2, bildir=None):
+        self.yari_omur = yari_omur
+        self.esik = esik
+        self.temiz_esik = temiz_esik
+        self.en_az = en_az
+        self.kontrol_araligi = kontrol_araligi
+        self.en_fazla_hucre = en_fazla_hucre
+        self.theta_basamak = theta_basamak
+        self._theta_olcek = 10 ** theta_basamak
+        self.bildir = bildir
+        self.etkin = True
+        self.hucreler = {}
+        self.uyarilar = deque(maxlen=100)
+        self.izlenmeyen = 0
+        self.gecersiz_theta = 0
+        self._kilit = threading.Lock()
+
+    # anahtar: (arka uç adı, tip, theta); theta hileli gemide Ry açısının 10^-theta_basamak birimindeki tam sayı
+    # karşılığı, çok konumlu gemide KonumDagilimi, hayalette None
+    def _hucre_ac(self, anahtar):
+        with self._kilit:
+            hucre = self.hucreler.get(anahtar)
+            if hucre is not None:
+                return hucre
+            if len(self.hucreler) >= self.en_fazla_hucre:
+                self.izlenmeyen += 1
+                if self.izlenmeyen == 1:
+                    uyari = {'zaman': time.time(), 'neden': 'hucre_siniri', 'arka_uc': anahtar[0],
+                             'tip': anahtar[1], 'en_fazla_hucre': self.en_fazla_hucre}
+                    self.uyarilar.append(uyari)
+                    if self.bildir is not None:
+                        self.bildir(uyari)
+                return None
+            ad, tip, theta = anahtar
+            if isinstance(theta, KonumDagilimi):
+                olasiliklar = tuple(theta.olasiliklar.tolist())
+            else:
+                p0 = sifir_olasiligi(tip, None if theta is None else theta / self._theta_olcek)
+                olasiliklar = (p0, 1 - p0)
+            hucre = self.hucreler[anahtar] = UyumHucresi(ad, tip, olasiliklar, self.yari_omur)
+            return hucre
+
+    def kaydet(self, arka_uc, tip, theta, sonuc):
+        if not self.etkin:
+            return
+        if theta is not None and not isinstance(theta, KonumDagilimi):
+            theta = float(theta)
+            if not math.isfinite(theta):
+                self.gecersiz_theta += 1
+                return
+            theta = round(theta * self._theta_olcek)
+        anahtar = (kaynak_adi(arka_uc), tip, theta)
+        hucre = self.hucreler.get(anahtar) or self._hucre_ac(anahtar)
+        if hucre is None:
+            return
+        hucre.tampon.append(sonuc)
+        if len(hucre.tampon) >= self.kontrol_araligi:
+            self._kontrol(hucre)
+
+    # Sunucunun toplu gönderimleri: istekler [(tip, theta), ...] ile aynı sırada bitler
+    def kaydet_toplu(self, arka_uc, istekler, bitler):
+        if not self.etkin:
+            return
+        ad = kaynak_adi(arka_uc)
+        for (tip, theta), bit in zip(istekler, bitler):
+            self._ekle(ad, tip, theta, bit)
+
+    def _ekle(self, ad, tip, theta, sonuc):
+        if theta is not None and not isinstance(theta, KonumDagilimi):
+            theta = float(theta)
+            if not math.isfinite(theta):
+                self.gecersiz_theta += 1
+                return
+            theta = round(theta * self._theta_olcek)
+        anahtar = (ad, tip, theta)
+        hucre = self.hucreler.get(anahtar) or self._hucre_ac(anahtar)
+        if hucre is None:
+            return
+        hucre.tampon.append(sonuc)
+        if len(hucre.tampon) >= self.kontrol_araligi:
+            self._kontrol(hucre)
+
+    def _kontrol(self, hucre):
+        with self._kilit:
+            self._katla(hucre)
+            self._pencereyi_denetle(hucre)
+
+    # Kilit altında çağrılır
+    def _katla(self, hucre):
+        aralik_disi = hucre.bosalt()
+        if aralik_disi and hucre.aralik_disi == aralik_disi:
+            self._uyar(hucre, {'neden': 'aralik_disi', 'aralik_disi': aralik_disi})
+
+    def _uyar(self, hucre, ayrinti):
+        hucre.uyari_sayisi += 1
+        uyari = {'zaman': time.time(), 'arka_uc': hucre.arka_uc, 'tip': hucre.tip,
+                 'beklenen': list(hucre.olasiliklar), 'n': hucre.n, **ayrinti}
+        self.uyarilar.append(uyari)
+        if self.bildir is not None:
+            self.bildir(uyari)
+
+    def _pencereyi_denetle(self, hucre):
+        n_etkin, x, p = hucre.pencere_testi()
+        if p >= self.temiz_esik:
+            hucre.uyarida = False
+        if n_etkin < self.en_az or p >= self.esik or hucre.uyarida:
+            return
+        hucre.uyarida = True
+        self._uyar(hucre, {'neden': 'kayma', 'pencere_n': n_etkin,
+                           'pencere_gozlenen': (hucre.pencere / hucre.pencere.sum()).tolist(), 'ki_kare': x,
+                           'p_degeri': p})
+
+    # --- DIŞA AKTARMA ---
+    def ozet(self):
+        with self._kilit:
+            hucreler = list(self.hucreler.values())
+            for h in hucreler:
+                self._katla(h)
+            return {'hucreler': [h.ozet() for h in hucreler], 'uyarilar': list(self.uyarilar),
+                    'izlenmeyen': self.izlenmeyen, 'gecersiz_theta': self.gecersiz_theta}
+
+    # Prometheus metin biçimi; iki konumlu gemilerde etiket p0, çok konumlularda konum sayısı k'dır
+    def prometheus(self):
+        satirlar = {
+            'born_olcum_toplam': ('counter', "Hücreye düşen çökme sayısı"),
+            'born_sifir_orani': ('gauge', "Gözlenen ilk konum (|0>) oranı"),
+            'born_p_degeri': ('gauge', "Başlangıçtan beri ki-kare uyum p-değeri"),
+            'born_pencere_p_degeri': ('gauge', "Son ölçümlerin (üstel pencere) ki-kare p-değeri"),
+            'born_uyari_toplam': ('counter', "Kayma ve aralık dışı sonuç uyarısı sayısı"),
+            'born_aralik_disi_toplam': ('counter', "Konum sayısını aşan (testlere katılmayan) sonuç sayısı"),
+        }
+        degerler = {ad: [] for ad in satirlar}
+        ozet = self.ozet()
+        for h in ozet['hucreler']:
+            beklenen = h['beklenen']
+            etiket = f'arka_uc="{h["arka_uc"]}",tip="{h["tip"]}",' + (
+                f'p0="{beklenen[0]:.6g}"' if len(beklenen) == 2 else f'k="{len(beklenen)}",p0="{beklenen[0]:.6g}"')
+            degerler['born_olcum_toplam'].append((etiket, h['n']))
+            degerler['born_sifir_orani'].append((etiket, h['gozlenen'][0]))
+            degerler['born_p_degeri'].append((etiket, h['p_degeri']))
+            degerler['born_pencere_p_degeri'].append((etiket, h['pencere_p_degeri']))
+            degerler['born_uyari_toplam'].append((etiket, h['uyari_sayisi']))
+            degerler['born_aralik_disi_toplam'].append((etiket, h['aralik_disi']))
+        metin = []
+        for ad, (tur, aciklama) in satirlar.items():
+            metin += [f"# HELP {ad} {aciklama}", f"# TYPE {ad} {tur}"]
+            metin += [f"{ad}{{{etiket}}} {deger:.6g}" for etiket, deger in degerler[ad]]
+        for ad, aciklama in (('born_izlenmeyen_toplam', "Hücre sınırı dolduğu için izlenemeyen ölçüm sayısı"),
+                             ('born_gecersiz_theta_toplam', "Sonlu olmayan θ ile bildirilen ölçüm sayısı")):
+            metin += [f"# HELP {ad} {aciklama}", f"# TYPE {ad} counter",
+                      f"{ad} {ozet[ad.removeprefix('born_').removesuffix('_toplam')]}"]
+        return "\n".join(metin) + "\n"
+
+
+# Süreç genelindeki izleyici; GameManager ve sunucu varsayılan olarak buna yazar
+VARSAYILAN_IZLEYICI = BornIzleyici()
+
+
+# --- TARAMA ---
+# Bir arka ucu hayalet ve birkaç hileli ağırlıkta ölçüm ölçüm izleyiciden geçirir ve tabloyu yazar
+def tarama(arka_uc="aer", agirliklar=(0.1, 0.5, 0.75, 0.9), atis=5000, izleyici=None):
+    arka_uc = arka_uc_olustur(arka_uc) if isinstance(arka_uc, str) else arka_uc
+    izleyici = izleyici or BornIzleyici()
+    durumlar = [('hayalet', None)] + [('hileli', 2 * np.arccos(np.sqrt(w))) for w in agirliklar]
+    for tip, theta in durumlar:
+        for bit in arka_uc.olc_coklu(tip, theta, atis):
+            izleyici.kaydet(arka_uc, tip, theta, int(bit))
+    return izleyici
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Çökme arka uçları için Born kuralı uyum taraması")
+    parser.add_argument("--arka-uc", default="aer", choices=["analitik", "aer", "havuz"])
+    parser.add_argument("--atis", type=int, default=5000, help="durum başına ölçüm")
+    parser.add_argument("--agirliklar", nargs="+", type=float, default=[0.1, 0.5, 0.75, 0.9])
+    parser.add_argument("--metrikler", action="store_true", help="Prometheus metin biçiminde yaz")
+    parser.add_argument("--json", help="özeti bu dosyaya yaz")
+    args = parser.parse_args()
+
+    izleyici = tarama(args.arka_uc, args.agirliklar, args.atis)
+    ozet = izleyici.ozet()
+    if args.metrikler:
+        print(izleyici.prometheus(), end="")
+    else:
+        print(f"{'ARKA UÇ':<14}{'TİP':<9}{'BEKLENEN':>9}{'GÖZLENEN':>10}{'N':>8}{'p':>10}{'PENCERE p':>11}")
+        for h in ozet['hucreler']:
+            print(f"{h['arka_uc']:<14}{h['tip']:<9}{h['beklenen'][0]:9.4f}{h['gozlenen'][0]:10.4f}{h['n']:8d}"
+                  f"{h['p_degeri']:10.4f}{h['pencere_p_degeri']:11.4f}")
+        print(f"{len(ozet['uyarilar'])} uyarı")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(ozet, f, indent=2, ensure_ascii=False)
+    raise SystemExit(1 if ozet['uyarilar'] else 0)
+
+
+if __name__ == "__main__":
+    main()